@@ -8,10 +8,46 @@
 #   deterministic finite automata.                      #
 #########################################################
 
-import tkinter as tk
-from tkinter import filedialog
 import os
-from tkinter import ttk
+import sys
+import contextlib
+import functools
+import hashlib
+import json
+import mmap
+import operator
+import queue
+import struct
+import threading
+import time
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator
+
+# tkinter is imported by _load_tkinter() when the App starts, so the other
+# classes can be imported and used on machines without a display
+tk = None
+ttk = None
+filedialog = None
+tkfont = None
+
+def _load_tkinter() -> None:
+    """Imports tkinter for the App on first use"""
+
+    global tk, ttk, filedialog, tkfont
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as tkinter_ttk, filedialog as tkinter_filedialog, font as tkinter_font
+        tk, ttk, filedialog, tkfont = tkinter, tkinter_ttk, tkinter_filedialog, tkinter_font
+
+def _load_numpy():
+    """Imports numpy on first use, gives None if it is not installed"""
+
+    try:
+        import numpy
+    except ImportError:    # numpy is only needed for vectorized checking
+        return None
+    return numpy
 
 class StateMachine:
     """
@@ -21,14 +57,14 @@ class StateMachine:
     Attributes
     ----------
     alphabet : list[str]
-        Contains the list of alphabets, list must be of length 2
+        Contains the list of alphabets, 2 for a classic .dfa file or more for an extended one
     states : list[str]
         Contains a list of states in the DFA, state[0] is the start state
     f_states : list[str]
         Contains a list of final states
     transition : list[list[str]]
         Contains the transitions, i.e. transition[x][y] is destination state from 
-        state[x] when alphabet[y] is inputted, second dimension must be of length 2
+        state[x] when alphabet[y] is inputted, second dimension must be the length of alphabet
     
     Methods
     -------
@@ -38,6 +74,16 @@ class StateMachine:
         Determines if a given state is final
     get_start_state()
         Gets the start state of the DFA
+    compile()
+        Gets the integer-indexed form of the DFA used for checking strings
+    scan(text)
+        Finds the longest matches of the DFA in a stream of text
+    tokenize(text)
+        Splits a stream of text into the longest matches of the DFA and the text between them
+    count_accepted(length, up_to)
+        Counts the valid strings of a given length
+    accepted_strings(max_length)
+        Gives the valid strings in shortlex order
     """
 
     def __init__(self, alphabet: list[str], states: list[str], f_states: list[str], transition: list[list[str]]) -> None:
@@ -46,20 +92,21 @@ class StateMachine:
         Parameters
         ----------
         alphabet : list[str]
-            Contains the list of alphabets, list must be of length 2
+            Contains the list of alphabets, 2 for a classic .dfa file or more for an extended one
         states : list[str]
             Contains a list of states in the DFA, state[0] is the start state
         f_states : list[str]
             Contains a list of final states
         transition : list[list[str]]
             Contains the transitions, i.e. transition[x][y] is destination state from 
-            state[x] when alphabet[y] is inputted, second dimension must be of length 2
+            state[x] when alphabet[y] is inputted, second dimension must be the length of alphabet
         """
 
         self.alphabet = alphabet
         self.states = states
         self.f_states = f_states
         self.transition = transition
+        self._compiled = None
 
     def move(self, src: str, buf: str) -> str:
         """Does the logic for state transitions
@@ -116,6 +163,102 @@ class StateMachine:
         """
 
         return self.states[0]
+
+    def compile(self) -> "CompiledDFA":
+        """Gets the integer-indexed form of the DFA used for checking strings
+
+        The compiled form has unreachable states removed and equivalent states
+        merged (see CompiledDFA.optimized()), while this object keeps the DFA as
+        written. Its sink table is built here too, so the first check does not
+        pay for it. It is built once and reused, so the DFA should not be
+        modified after it has been used for checking.
+
+        Returns
+        -------
+        CompiledDFA
+            The compiled DFA
+        """
+
+        if self._compiled is None:
+            compiled = CompiledDFA(self).optimized()
+            compiled.sink_table()
+            self._compiled = compiled
+        return self._compiled
+
+    def scan(self, text) -> Iterator[tuple[int, int]]:
+        """Finds the longest matches of the DFA in a stream of text
+
+        Matches do not overlap and each is the longest one starting at the
+        leftmost position where any non-empty match starts, see
+        CompiledDFA.tokenize().
+
+        Parameters
+        ----------
+        text : str or Iterable[str] or TextIO
+            A string, pieces of a text in order, or a file opened for reading text
+
+        Yields
+        ------
+        tuple[int, int]
+            The start and end offsets of each match, e.g. text[start:end]
+        """
+
+        return self.compile().scan(text)
+
+    def tokenize(self, text) -> Iterator[tuple[str, bool]]:
+        """Splits a stream of text into the longest matches of the DFA and the text between them
+
+        Parameters
+        ----------
+        text : str or Iterable[str] or TextIO
+            A string, pieces of a text in order, or a file opened for reading text
+
+        Yields
+        ------
+        tuple[str, bool]
+            A piece of the text and True if it is a match, False otherwise
+        """
+
+        return self.compile().tokenize(text)
+
+    def count_accepted(self, length: int, up_to: bool = False) -> int:
+        """Counts the valid strings of a given length
+
+        Parameters
+        ----------
+        length : int
+            Number of letters in the strings
+        up_to : bool
+            Count the valid strings of every length from 0 to length instead
+
+        Raises
+        ------
+        Exception
+            If length is negative
+
+        Returns
+        -------
+        int
+            The exact number of valid strings, see CompiledDFA.count_accepted()
+        """
+
+        return self.compile().count_accepted(length, up_to)
+
+    def accepted_strings(self, max_length: int = None) -> Iterator[str]:
+        """Gives the valid strings in shortlex order
+
+        Parameters
+        ----------
+        max_length : int
+            Length of the longest strings to give, None for no limit
+
+        Yields
+        ------
+        str
+            Each valid string, shortest first, see CompiledDFA.accepted_strings()
+        """
+
+        return self.compile().accepted_strings(max_length)
     
     def format_for_display(self) -> list[list[str]]:
         """Saves the output as a properly formatted output.txt file
@@ -127,224 +270,3811 @@ class StateMachine:
         """
 
         new_list = list()
+        start_state = self.get_start_state()
+        f_states = set(self.f_states)
+        rows = dict()
+        for index, state in enumerate(self.states):
+            rows.setdefault(state, self.transition[index])
 
         for state in self.states:
             current_line = list()
-            if state == self.get_start_state():
+            if state == start_state:
                 current_line.append('-')
-                if self.is_final(state):
+                if state in f_states:
                     current_line[0] += '+'
-            elif self.is_final(state):
+            elif state in f_states:
                 current_line.append('+')
             else:
                 current_line.append('')
             current_line.append(state)
-            current_line = current_line + self.transition[self.states.index(state)]
+            current_line = current_line + rows[state]
             new_list.append(current_line)
         
         return new_list
 
 
-class FileParser:
+class CompiledDFA:
     """
-    A class that parses .in and .dfa files into usable elements in the program
-    Main author: Poledo
+    Class to represent a StateMachine as dense integer tables for fast checking.
+
+    States and input letters are numbered in the order they appear in the
+    StateMachine, so the start state is always 0. A destination that is not a
+    declared state gets its own number too; every input letter from such a state
+    is an error, the same as StateMachine.move raising.
+
+    Attributes
+    ----------
+    symbol_index : dict[str, int]
+        Maps each input letter to its number
+    state_names : list[str]
+        Contains the name of each numbered state
+    state_map : dict[str, int]
+        Maps each state name of the StateMachine to its number, or to -1 if it
+        was merged into the error state. Unreachable states are left out
+    n_states : int
+        Number of numbered states
+    n_symbols : int
+        Number of input letters
+    start : int
+        Number of the start state
+    table : array
+        Flat transition table, i.e. table[state * n_symbols + symbol] is the
+        destination state number, or -1 if the move is an error
+    final : bytearray
+        Bitmap of final states, bit (state % 8) of byte (state // 8) is set if final
 
     Methods
     -------
-    in_parser(src)
-        Parses a .in file
-    dfa_parser(src)
-        Parses a .dfa file
+    is_final(state)
+        Determines if a numbered state is final
+    move(state, char)
+        Does the logic for state transitions on numbered states
+    compile()
+        Gets this DFA, so it can be passed to StringChecker like a StateMachine
+    optimized()
+        Gets an equivalent DFA with the fewest states
+    save(filename, source_hash)
+        Saves the DFA as a binary cache file
+    load(filename, source_hash)
+        Loads a DFA from a binary cache file
+    sink_table()
+        Gets the transition table used by accepts(), which stops at sink states
+    accepts(input)
+        Checks if a string is valid
+    stride_length(memory_budget)
+        Picks the longest stride whose table fits a memory budget
+    stride_table(k, memory_budget)
+        Gets the transition table used by accepts_stride(), which moves k letters at a time
+    verify_stride_table(state_machine, k)
+        Checks every entry of the stride table against StateMachine.move
+    accepts_stride(input, k)
+        Checks if a string is valid, moving k letters at a time
+    chunk_mapping(chunk)
+        Gets the state every state reaches after a chunk of a long string
+    accepts_mappings(mappings)
+        Checks if a long string is valid from the mappings of its chunks
+    tokenize(chunks)
+        Splits a stream of text into the longest matches and the text between them
+    scan(chunks)
+        Finds the longest matches in a stream of text
+    count_accepted(length, up_to)
+        Counts the valid strings of a given length
+    accepted_strings(max_length)
+        Gives the valid strings in shortlex order
+    accepts_vectorized(inputs, batch_size)
+        Checks multiple strings together using numpy
+    accepts_trie(inputs)
+        Checks multiple strings, moving through each shared prefix only once
+    scan_bytes(data)
+        Checks every line of raw file contents
+    equivalent(other)
+        Determines if another DFA accepts exactly the same strings
     """
 
-    def in_parser(self, src: str) -> list[str]:
-        """Parses a .in file
-        
+    def __init__(self, state_machine: StateMachine) -> None:
+        """
         Parameters
         ----------
-        src : str
-            A file path to the .in file
-        
+        state_machine : StateMachine
+            The DFA to compile
+        """
+
+        self.symbol_index = dict()
+        for symbol in state_machine.alphabet:
+            self.symbol_index.setdefault(symbol, len(self.symbol_index))
+
+        state_index = dict()
+        positions = dict()
+        self.state_names = list()
+        for position, state in enumerate(state_machine.states):
+            if state not in state_index:
+                state_index[state] = len(self.state_names)
+                positions[state] = position
+                self.state_names.append(state)
+        declared = len(self.state_names)
+
+        rows = list()
+        for state in self.state_names[:declared]:
+            row = state_machine.transition[positions[state]]
+            for dest in row:
+                if dest not in state_index:
+                    state_index[dest] = len(self.state_names)
+                    self.state_names.append(dest)
+            rows.append(row)
+
+        self.state_map = state_index
+        self.n_states = len(self.state_names)
+        self.n_symbols = len(self.symbol_index)
+        self.start = 0
+        self.table = array('i', [-1]) * (self.n_states * self.n_symbols)
+        for letter, symbol in self.symbol_index.items():
+            column = state_machine.alphabet.index(letter)
+            for state in range(declared):
+                # a short transition row is only an error once that letter is used
+                if column < len(rows[state]):
+                    self.table[state * self.n_symbols + symbol] = state_index[rows[state][column]]
+
+        f_states = set(state_machine.f_states)
+        self.final = bytearray((self.n_states + 7) // 8)
+        for state, name in enumerate(self.state_names):
+            if name in f_states:
+                self.final[state >> 3] |= 1 << (state & 7)
+        self._byte_table = None
+        self._sink_table = None
+        self._stride_table = None
+
+    @classmethod
+    def from_tables(cls, symbol_index: dict[str, int], state_names: list[str], state_map: dict[str, int],
+                    start: int, table: array, final: bytearray, sink: tuple = None) -> "CompiledDFA":
+        """Makes a CompiledDFA directly from its tables
+
+        Parameters
+        ----------
+        symbol_index : dict[str, int]
+            Maps each input letter to its number
+        state_names : list[str]
+            Contains the name of each numbered state
+        state_map : dict[str, int]
+            Maps state names of the original StateMachine to state numbers
+        start : int
+            Number of the start state
+        table : array
+            Flat transition table, -1 for error moves
+        final : bytearray
+            Bitmap of final states
+        sink : tuple
+            The sink_table() of the DFA if it is already known, else None
+
         Returns
         -------
-        list[str]
-            A list of all strings from the .in  file
+        CompiledDFA
+            The DFA made from the tables
+        """
+
+        dfa = cls.__new__(cls)
+        dfa.symbol_index = symbol_index
+        dfa.state_names = state_names
+        dfa.state_map = state_map
+        dfa.n_states = len(state_names)
+        dfa.n_symbols = len(symbol_index)
+        dfa.start = start
+        dfa.table = table
+        dfa.final = final
+        dfa._byte_table = None
+        dfa._sink_table = sink
+        dfa._stride_table = None
+        return dfa
+
+    def is_final(self, state: int) -> bool:
+        """Determines if a numbered state is final
+
+        Parameters
+        ----------
+        state : int
+            Number of the state to test
+
+        Returns
+        -------
+        bool
+            True if state is final state, false otherwise
+        """
+
+        return state >= 0 and (self.final[state >> 3] >> (state & 7)) & 1 == 1
+
+    def compile(self) -> "CompiledDFA":
+        """Gets this DFA, so it can be passed to StringChecker like a StateMachine
+
+        Returns
+        -------
+        CompiledDFA
+            This DFA
+        """
+
+        return self
+
+    def optimized(self) -> "CompiledDFA":
+        """Gets an equivalent DFA with the fewest states
+
+        States that cannot be reached from the start state are dropped, then
+        equivalent states are merged with Hopcroft's algorithm. States that can
+        never reach a final state are merged into the error state (-1), so
+        checking stops as soon as a string can no longer be valid. Each merged
+        state keeps the name of its first state.
+
+        Returns
+        -------
+        CompiledDFA
+            The optimized DFA
+        """
+
+        n_symbols = self.n_symbols
+        table = self.table
+
+        # number the reachable states in breadth-first order, the start state first
+        order = [self.start]
+        position = {self.start: 0}
+        for state in order:
+            for dest in table[state * n_symbols:(state + 1) * n_symbols]:
+                if dest >= 0 and dest not in position:
+                    position[dest] = len(order)
+                    order.append(dest)
+
+        # error moves go to an extra state that loops to itself on every letter
+        reject = len(order)
+        size = reject + 1
+        moves = [reject] * (size * n_symbols)
+        inverse = [[list() for _ in range(size)] for _ in range(n_symbols)]
+        for old, state in enumerate(order):
+            for symbol in range(n_symbols):
+                dest = table[state * n_symbols + symbol]
+                moves[old * n_symbols + symbol] = position[dest] if dest >= 0 else reject
+        for state in range(size):
+            for symbol in range(n_symbols):
+                inverse[symbol][moves[state * n_symbols + symbol]].append(state)
+
+        finals = set(old for old, state in enumerate(order) if self.is_final(state))
+        others = set(range(size)) - finals
+        blocks = [block for block in (finals, others) if block]
+        block_of = [0] * size
+        for number, block in enumerate(blocks):
+            for state in block:
+                block_of[state] = number
+
+        # Hopcroft's algorithm, a split block always keeps the larger half under its old number
+        waiting = set(range(len(blocks))) if len(blocks) < 2 else {0 if len(blocks[0]) <= len(blocks[1]) else 1}
+        while waiting:
+            splitter = list(blocks[waiting.pop()])
+            for symbol in range(n_symbols):
+                predecessors = inverse[symbol]
+                hit = dict()
+                for state in splitter:
+                    for source in predecessors[state]:
+                        hit.setdefault(block_of[source], set()).add(source)
+                for number, inside in hit.items():
+                    block = blocks[number]
+                    if len(inside) == len(block):
+                        continue
+                    outside = block - inside
+                    if len(inside) <= len(outside):
+                        blocks[number], smaller = outside, inside
+                    else:
+                        blocks[number], smaller = inside, outside
+                    blocks.append(smaller)
+                    for state in smaller:
+                        block_of[state] = len(blocks) - 1
+                    waiting.add(len(blocks) - 1)
+
+        # renumber the blocks breadth-first from the start block
+        dead = block_of[reject]
+        first = block_of[0]
+        number_of = {first: 0}
+        members = {first: 0}
+        queue = [first]
+        for block in queue:
+            state = members[block]
+            for symbol in range(n_symbols):
+                dest = moves[state * n_symbols + symbol]
+                target = block_of[dest]
+                if target not in number_of and target != dead:
+                    number_of[target] = len(queue)
+                    members[target] = dest
+                    queue.append(target)
+        if first != dead:
+            number_of[dead] = -1
+
+        # the first state of each block in breadth-first order names the block
+        for old in range(reject - 1, -1, -1):
+            if block_of[old] in members:
+                members[block_of[old]] = old
+
+        new_table = array('i', [-1]) * (len(queue) * n_symbols)
+        new_final = bytearray((len(queue) + 7) // 8)
+        state_names = list()
+        for number, block in enumerate(queue):
+            state = members[block]
+            state_names.append(self.state_names[order[state]])
+            for symbol in range(n_symbols):
+                new_table[number * n_symbols + symbol] = number_of[block_of[moves[state * n_symbols + symbol]]]
+            if state in finals:
+                new_final[number >> 3] |= 1 << (number & 7)
+
+        state_map = dict()
+        for name, state in self.state_map.items():
+            if state >= 0 and state in position:
+                state_map[name] = number_of[block_of[position[state]]]
+            elif state < 0:
+                state_map[name] = -1
+        return CompiledDFA.from_tables(self.symbol_index, state_names, state_map, 0, new_table, new_final)
+
+    # cache file layout, all little-endian: header, letters as code points,
+    # transition table, sink table and sink codes, final state bitmap, then the
+    # state names and state_map
+    CACHE_MAGIC = b"PE01DFA\0"
+    CACHE_VERSION = 2
+    CACHE_HEADER = struct.Struct("<8sI32sIIiIIII")
+
+    def save(self, filename: str, source_hash: bytes) -> None:
+        """Saves the DFA as a binary cache file
+
+        The file is written under a temporary name first and then renamed, so
+        a reader never sees a half written cache.
+
+        Parameters
+        ----------
+        filename : str
+            The cache file path
+        source_hash : bytes
+            SHA-256 digest of the .dfa file the DFA was parsed from
+        """
+
+        symbols = array('I', [ord(symbol) for symbol in self.symbol_index])
+        table = array('i', self.table)
+        sink_table, codes = (array('i', values) for values in self.sink_table())
+        map_indexes = array('i', self.state_map.values())
+        if sys.byteorder != 'little':
+            for values in (symbols, table, sink_table, codes, map_indexes):
+                values.byteswap()
+        names = '\n'.join(self.state_names).encode('utf-8')
+        map_names = '\n'.join(self.state_map).encode('utf-8')
+        body = b''.join([symbols.tobytes(), table.tobytes(), sink_table.tobytes(), codes.tobytes(),
+                         map_indexes.tobytes(), bytes(self.final), names, map_names])
+        header = self.CACHE_HEADER.pack(self.CACHE_MAGIC, self.CACHE_VERSION, source_hash, self.n_states,
+                                        self.n_symbols, self.start, len(self.state_map), len(names),
+                                        len(map_names), zlib.crc32(body))
+
+        temporary = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(temporary, 'wb') as file:
+                file.write(header)
+                file.write(body)
+            os.replace(temporary, filename)
+        except OSError:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+    @classmethod
+    def load(cls, filename: str, source_hash: bytes) -> "CompiledDFA":
+        """Loads a DFA from a binary cache file
+
+        The file is memory-mapped and the transition table, sink table and
+        final state bitmap are used in place as memoryviews, without copying.
+
+        Parameters
+        ----------
+        filename : str
+            The cache file path
+        source_hash : bytes
+            SHA-256 digest of the current .dfa file
+
+        Returns
+        -------
+        CompiledDFA
+            The cached DFA, or None if the cache is missing, was made from
+            another version of the .dfa file, or is corrupt
+        """
+
+        try:
+            with open(filename, 'rb') as file:
+                buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        view = memoryview(buffer)
+        header = cls.CACHE_HEADER
+        if len(view) < header.size:
+            return None
+        (magic, version, cached_hash, n_states, n_symbols, start,
+         map_size, names_size, map_names_size, checksum) = header.unpack_from(view)
+        if magic != cls.CACHE_MAGIC or version != cls.CACHE_VERSION or cached_hash != source_hash:
+            return None
+
+        # sections are 4-byte values first, so the table stays aligned for cast()
+        offset = header.size
+        sizes = [4 * n_symbols, 4 * n_states * n_symbols, 4 * n_states * n_symbols, 4 * n_states, 4 * map_size,
+                 (n_states + 7) // 8, names_size, map_names_size]
+        if len(view) != offset + sum(sizes) or zlib.crc32(view[offset:]) != checksum:
+            return None
+        sections = list()
+        for size in sizes:
+            sections.append(view[offset:offset + size])
+            offset += size
+        symbols, table, sink_table, codes, map_indexes, final, names, map_names = sections
+
+        tables = [table, sink_table, codes]
+        for number, values in enumerate(tables):
+            if sys.byteorder == 'little':
+                tables[number] = values.cast('i')
+            else:
+                tables[number] = array('i', values.tobytes())
+                tables[number].byteswap()
+        table, sink_table, codes = tables
+        symbols = array('I', symbols.tobytes())
+        map_indexes = array('i', map_indexes.tobytes())
+        if sys.byteorder != 'little':
+            symbols.byteswap()
+            map_indexes.byteswap()
+
+        state_names = names.tobytes().decode('utf-8').split('\n')
+        map_names = map_names.tobytes().decode('utf-8').split('\n') if map_size else []
+        if len(state_names) != n_states or len(map_names) != map_size or not 0 <= start < n_states:
+            return None
+        symbol_index = {chr(symbol): number for number, symbol in enumerate(symbols)}
+        return cls.from_tables(symbol_index, state_names, dict(zip(map_names, map_indexes)), start, table, final,
+                               (sink_table, codes))
+
+    def __getstate__(self) -> dict:
+        """Copies memory-mapped tables so the DFA can be pickled, e.g. for worker processes"""
+
+        state = self.__dict__.copy()
+        state['table'] = array('i', self.table)
+        state['final'] = bytearray(self.final)
+        if self._sink_table is not None:
+            state['_sink_table'] = tuple(list(values) for values in self._sink_table)
+        # the stride table can be megabytes, it is quicker to build it again
+        state['_stride_table'] = None
+        return state
+
+    # codes in the sink table for a state where the verdict is already decided
+    DEAD_STATE = -1
+    ACCEPT_SINK = -2
+
+    def sink_table(self) -> tuple[list[int], list[int]]:
+        """Gets the transition table used by accepts(), which stops at sink states
+
+        A dead state can never reach a final state, so every string that
+        enters it is invalid. An accepting sink can never reach a non-final
+        state or an error, so every string that enters it is valid as long as
+        its remaining letters are input letters. Moves into these states are
+        replaced by DEAD_STATE and ACCEPT_SINK, and the other moves are the
+        same as in table.
+
+        The tables are built by StateMachine.compile() and stored in the
+        cache file, so a DFA from load() reads them in place from the file.
+
+        Returns
+        -------
+        tuple[list[int], list[int]]
+            The flat table, and the code of each state, which is the state
+            itself if it is not a sink
+        """
+
+        if self._sink_table is not None:
+            return self._sink_table
+
+        n_states = self.n_states
+        n_symbols = self.n_symbols
+        table = self.table
+        predecessors = [list() for _ in range(n_states)]
+        for state in range(n_states):
+            for dest in table[state * n_symbols:(state + 1) * n_symbols]:
+                if dest >= 0:
+                    predecessors[dest].append(state)
+
+        def reaching(targets: list[int]) -> bytearray:
+            # marks the states with a path to one of the targets
+            seen = bytearray(n_states)
+            for state in targets:
+                seen[state] = 1
+            while targets:
+                for previous in predecessors[targets.pop()]:
+                    if not seen[previous]:
+                        seen[previous] = 1
+                        targets.append(previous)
+            return seen
+
+        live = reaching([state for state in range(n_states) if self.is_final(state)])
+        rejecting = reaching([state for state in range(n_states) if not self.is_final(state)
+                              or -1 in table[state * n_symbols:(state + 1) * n_symbols]])
+        codes = [state if rejecting[state] else self.ACCEPT_SINK for state in range(n_states)]
+        for state in range(n_states):
+            if not live[state]:
+                codes[state] = self.DEAD_STATE
+
+        self._sink_table = ([codes[dest] if dest >= 0 else self.DEAD_STATE for dest in table], codes)
+        return self._sink_table
+
+    def accepts(self, input: str) -> bool:
+        """Checks if a string is valid
+
+        Stops moving through the DFA as soon as the string reaches a dead state
+        or an accepting sink, see sink_table().
+
+        Parameters
+        ----------
+        input : str
+            An input string to test
+
+        Returns
+        -------
+        bool
+            True if string is valid, False otherwise
+        """
+
+        table, codes = self.sink_table()
+        state = codes[self.start]
+        n_symbols = self.n_symbols
+        symbol_index = self.symbol_index
+        chars = iter(input)
+        if state >= 0:
+            for char in chars:
+                symbol = symbol_index.get(char)
+                if symbol is None:
+                    return False
+                state = table[state * n_symbols + symbol]
+                if state < 0:
+                    break
+            else:
+                return self.is_final(state)
+        if state == self.DEAD_STATE:
+            return False
+        # in an accepting sink the rest of the string only has to use input letters
+        return symbol_index.keys() >= set(chars)
+
+    # strides longer than this gain little, as slicing the string starts to cost more than the lookups
+    STRIDE_MAX = 16
+    STRIDE_BUDGET = 1 << 22
+
+    def stride_length(self, memory_budget: int = STRIDE_BUDGET) -> int:
+        """Picks the longest stride whose table fits a memory budget
+
+        Parameters
+        ----------
+        memory_budget : int
+            Approximate bytes the stride table may take
+
+        Returns
+        -------
+        int
+            Number of letters per move, 1 if even a 2 letter table is too large
+        """
+
+        if self.n_symbols < 2:
+            return self.STRIDE_MAX
+        k = 1
+        while k < self.STRIDE_MAX:
+            blocks = self.n_symbols ** (k + 1)
+            # each block is a string shared by every row, plus a dict entry per state
+            if blocks * (50 + k + 1) + self.n_states * blocks * 32 > memory_budget:
+                break
+            k += 1
+        return k
+
+    def stride_table(self, k: int = None, memory_budget: int = STRIDE_BUDGET) -> tuple[list[dict[str, int]], int]:
+        """Gets the transition table used by accepts_stride(), which moves k letters at a time
+
+        Row state maps every string of k input letters to the state reached
+        from state after those letters. Like sink_table(), a dead state or an
+        accepting sink reached within the letters gives DEAD_STATE or
+        ACCEPT_SINK, so the string can stop there.
+
+        Parameters
+        ----------
+        k : int
+            Number of letters per move, None to pick it with stride_length()
+        memory_budget : int
+            Approximate bytes the table may take when k is None
+
+        Returns
+        -------
+        tuple[list[dict[str, int]], int]
+            One row per state, and k
+        """
+
+        if k is None:
+            k = self.stride_length(memory_budget)
+        if self._stride_table is not None and self._stride_table[1] == k:
+            return self._stride_table
+
+        table = self.sink_table()[0]
+        n_symbols = self.n_symbols
+        letters = list(self.symbol_index)
+        blocks = ['']
+        dests = [[state] for state in range(self.n_states)]
+        for _ in range(k):
+            blocks = [block + letter for block in blocks for letter in letters]
+            dests = [[table[dest * n_symbols + symbol] if dest >= 0 else dest for dest in row for symbol in range(n_symbols)]
+                     for row in dests]
+
+        self._stride_table = ([dict(zip(blocks, row)) for row in dests], k)
+        return self._stride_table
+
+    def verify_stride_table(self, state_machine: StateMachine, k: int = None) -> None:
+        """Checks every entry of the stride table against StateMachine.move
+
+        Each state of state_machine kept in state_map is moved through every
+        string of k letters with the original move(), and the state it ends in
+        must be the one in the stride table, or a dead state or accepting sink
+        with the matching code.
+
+        Parameters
+        ----------
+        state_machine : StateMachine
+            The StateMachine this DFA was compiled from
+        k : int
+            Number of letters per move, None to pick it with stride_length()
+
+        Raises
+        ------
+        Exception
+            If an entry of the stride table is wrong
+        """
+
+        rows, k = self.stride_table(k)
+        codes = self.sink_table()[1]
+        for name, state in self.state_map.items():
+            if state < 0:
+                continue
+            for block, dest in rows[state].items():
+                current = name
+                try:
+                    for char in block:
+                        current = state_machine.move(current, char)
+                    expected = self.state_map[current]
+                except Exception:
+                    expected = -1
+                expected = codes[expected] if expected >= 0 else self.DEAD_STATE
+                if dest != expected:
+                    raise Exception(f"Error! The stride table moves {name} on {block} to {dest}, not {expected}.")
+
+    def accepts_stride(self, input: str, k: int = None) -> bool:
+        """Checks if a string is valid, moving k letters at a time
+
+        Gives the same result as accepts(), using one lookup in stride_table()
+        per k letters and single moves for the last len(input) % k letters.
+
+        Parameters
+        ----------
+        input : str
+            An input string to test
+        k : int
+            Number of letters per move, None to use the last stride table or
+            pick k with stride_length()
+
+        Returns
+        -------
+        bool
+            True if string is valid, False otherwise
+        """
+
+        rows, k = self._stride_table if k is None and self._stride_table is not None else self.stride_table(k)
+        table, codes = self.sink_table()
+        state = codes[self.start]
+        n_symbols = self.n_symbols
+        symbol_index = self.symbol_index
+        rest = 0    # where the letters left after a sink start
+        if state >= 0:
+            end = len(input) - len(input) % k
+            for position in range(0, end, k):
+                # a block with a letter outside the alphabet is not in the row
+                state = rows[state].get(input[position:position + k], self.DEAD_STATE)
+                if state < 0:
+                    rest = position + k
+                    break
+            else:
+                for rest in range(end, len(input)):
+                    symbol = symbol_index.get(input[rest])
+                    if symbol is None:
+                        return False
+                    state = table[state * n_symbols + symbol]
+                    if state < 0:
+                        rest += 1
+                        break
+                else:
+                    return self.is_final(state)
+        if state == self.DEAD_STATE:
+            return False
+        return symbol_index.keys() >= set(input[rest:])
+
+    def chunk_mapping(self, chunk: str) -> list[int]:
+        """Gets the state every state reaches after a chunk of a long string
+
+        Every state is moved through the chunk together, k letters at a time
+        with the stride table. States that reach the same state move as one
+        from then on, and DFAs tend to merge most of their states quickly, so
+        this usually costs only a little more than moving one state.
+
+        Parameters
+        ----------
+        chunk : str
+            A piece of a long input string
+
+        Returns
+        -------
+        list[int]
+            The state reached from each state, or its sink code, see
+            sink_table(). None if the chunk has a letter outside the alphabet,
+            which makes the whole string invalid
+        """
+
+        symbol_index = self.symbol_index
+        if not symbol_index.keys() >= set(chunk):
+            return None
+        rows, k = self._stride_table if self._stride_table is not None else self.stride_table()
+        table, codes = self.sink_table()
+        n_symbols = self.n_symbols
+
+        # walkers holds the distinct states being moved, slot[state] the walker of each state
+        index = dict()
+        slot = [index.setdefault(code, len(index)) for code in codes]
+        walkers = list(index)
+
+        end = len(chunk) - len(chunk) % k
+        for step, position in enumerate(range(0, end, k)):
+            block = chunk[position:position + k]
+            walkers = [rows[state][block] if state >= 0 else state for state in walkers]
+            if step % 64 == 63 and len(set(walkers)) < len(walkers):
+                index = dict()
+                merged = [index.setdefault(state, len(index)) for state in walkers]
+                slot = [merged[walker] for walker in slot]
+                walkers = list(index)
+        for char in chunk[end:]:
+            symbol = symbol_index[char]
+            walkers = [table[state * n_symbols + symbol] if state >= 0 else state for state in walkers]
+        return [walkers[walker] for walker in slot]
+
+    def accepts_mappings(self, mappings: Iterable[list[int]]) -> bool:
+        """Checks if a long string is valid from the mappings of its chunks
+
+        Parameters
+        ----------
+        mappings : Iterable[list[int]]
+            The chunk_mapping() of each chunk of the string, in order
+
+        Returns
+        -------
+        bool
+            True if string is valid, False otherwise
         """
 
-        file = open(src, 'r')
-        content = file.read().splitlines()
-        file.close()
-        return content
+        state = self.sink_table()[1][self.start]
+        for mapping in mappings:
+            # a bad letter anywhere makes the string invalid, even after an accepting sink
+            if mapping is None:
+                return False
+            if state >= 0:
+                state = mapping[state]
+        if state < 0:
+            return state == self.ACCEPT_SINK
+        return self.is_final(state)
+
+    def tokenize(self, chunks) -> Iterator[tuple[str, bool]]:
+        """Splits a stream of text into the longest matches and the text between them
+
+        From each position the DFA is run as far as it can go, and the longest
+        non-empty piece it accepts is a match, after which matching starts
+        again. If nothing matches, the letter is skipped. Empty matches are
+        never given. Pairs of position and state that were found to lead to no
+        match are remembered, so a later attempt that reaches one stops there
+        and the whole stream takes linear time. Only the text from the match
+        being looked for on is kept in memory.
+
+        Parameters
+        ----------
+        chunks : str or Iterable[str] or TextIO
+            A string, pieces of a text in order, or a file opened for reading text
+
+        Yields
+        ------
+        tuple[str, bool]
+            A piece of the text and True if it is a match, False for text
+            between matches, which may come in several pieces. Joined together
+            the pieces give back the whole text
+        """
+
+        if isinstance(chunks, str):
+            chunks = (chunks,)
+        elif hasattr(chunks, 'read'):
+            chunks = iter(functools.partial(chunks.read, 1 << 16), '')
+        chunks = iter(chunks)
+
+        table, codes = self.sink_table()
+        n_states = self.n_states
+        n_symbols = self.n_symbols
+        symbol_index = self.symbol_index
+        finals = [self.is_final(state) for state in range(n_states)]
+        dead = self.DEAD_STATE
+        accept_sink = self.ACCEPT_SINK
+        if codes[self.start] == dead:
+            # nothing can match, e.g. a DFA without final states
+            for chunk in chunks:
+                if chunk:
+                    yield chunk, False
+            return
+
+        failed = set()      # position * n_states + state for pairs that lead to no match
+        failed_limit = 1 << 16
+        buffer = ''         # the text from offset on
+        offset = 0
+        limit = 0           # offset + len(buffer)
+        gap = 0             # start of the text between matches not given out yet
+        begin = 0           # start of the match being looked for
+        ended = False       # every chunk has been read
+
+        while not ended or begin < limit:
+            state = codes[self.start]
+            position = last = begin
+            last_state = state
+            while state != dead:
+                if position == limit:
+                    chunk = None if ended else next(chunks, None)
+                    if chunk is None:
+                        ended = True
+                        break
+                    # give out the text before begin so the buffer does not keep it
+                    if gap < begin:
+                        yield buffer[gap - offset:begin - offset], False
+                        gap = begin
+                    buffer = buffer[begin - offset:] + chunk
+                    offset = begin
+                    limit = offset + len(buffer)
+                    continue
+                symbol = symbol_index.get(buffer[position - offset])
+                if symbol is None:
+                    break
+                if state >= 0:
+                    state = table[state * n_symbols + symbol]
+                position += 1
+                if state >= 0:
+                    if finals[state]:
+                        last = position
+                        last_state = state
+                    elif position * n_states + state in failed:
+                        break
+                elif state == accept_sink:
+                    last = position
+                    last_state = state
+
+            # no state after the end of the match can lead to a match either
+            state = last_state
+            for after in range(last, position):
+                if state < 0:
+                    break
+                state = table[state * n_symbols + symbol_index[buffer[after - offset]]]
+                if state >= 0:
+                    failed.add((after + 1) * n_states + state)
+
+            if last > begin:
+                if gap < begin:
+                    yield buffer[gap - offset:begin - offset], False
+                yield buffer[begin - offset:last - offset], True
+                gap = begin = last
+            else:
+                begin += 1
+            if len(failed) > failed_limit:
+                # later attempts start at begin or after, so earlier pairs are never reached
+                failed = {pair for pair in failed if pair >= (begin + 1) * n_states}
+                failed_limit = max(failed_limit, 2 * len(failed))
+
+        if gap < limit:
+            yield buffer[gap - offset:], False
+
+    def scan(self, chunks) -> Iterator[tuple[int, int]]:
+        """Finds the longest matches in a stream of text
+
+        Parameters
+        ----------
+        chunks : str or Iterable[str] or TextIO
+            A string, pieces of a text in order, or a file opened for reading text
+
+        Yields
+        ------
+        tuple[int, int]
+            The start and end offsets of each match found by tokenize()
+        """
+
+        position = 0
+        for token, matched in self.tokenize(chunks):
+            if matched:
+                yield position, position + len(token)
+            position += len(token)
+
+    def count_accepted(self, length: int, up_to: bool = False) -> int:
+        """Counts the valid strings of a given length
+
+        The number of strings reaching each state is carried forward one
+        letter at a time, or for long lengths the transition matrix, whose
+        entry [x][y] is the number of letters moving state x to state y, is
+        raised to the power length by repeated squaring. The method with the
+        fewest operations is picked. Python integers keep the count exact.
+
+        Parameters
+        ----------
+        length : int
+            Number of letters in the strings
+        up_to : bool
+            Count the valid strings of every length from 0 to length instead
+
+        Raises
+        ------
+        Exception
+            If length is negative
+
+        Returns
+        -------
+        int
+            The number of valid strings
+        """
+
+        if length < 0:
+            raise Exception(f"Error! A string cannot have {length} letters.")
+        n_states = self.n_states
+        n_symbols = self.n_symbols
+        table = self.table
+        finals = [state for state in range(n_states) if self.is_final(state)]
+
+        # one step per letter costs length * states * letters, the matrix states^3 per squaring
+        if length * n_symbols <= 2 * n_states * n_states * length.bit_length():
+            counts = [0] * n_states
+            counts[self.start] = 1
+            total = counts[self.start] if self.start in finals else 0
+            for _ in range(length):
+                moved = [0] * n_states
+                for state, count in enumerate(counts):
+                    if count:
+                        for dest in table[state * n_symbols:(state + 1) * n_symbols]:
+                            if dest >= 0:
+                                moved[dest] += count
+                counts = moved
+                if up_to:
+                    total += sum(counts[state] for state in finals)
+            return total if up_to else sum(counts[state] for state in finals)
+
+        # with up_to an extra column adds up the valid strings of each length as they go by
+        size = n_states + 1 if up_to else n_states
+        matrix = [[0] * size for _ in range(size)]
+        for state in range(n_states):
+            for dest in table[state * n_symbols:(state + 1) * n_symbols]:
+                if dest >= 0:
+                    matrix[state][dest] += 1
+        if up_to:
+            for state in finals:
+                matrix[state][n_states] = 1
+            matrix[n_states][n_states] = 1
+        vector = [0] * size
+        vector[self.start] = 1
+        steps = length + 1 if up_to else length
+        while steps:
+            if steps & 1:
+                vector = _multiply([vector], matrix)[0]
+            steps >>= 1
+            if steps:
+                matrix = _multiply(matrix, matrix)
+        return vector[n_states] if up_to else sum(vector[state] for state in finals)
+
+    def accepted_strings(self, max_length: int = None) -> Iterator[str]:
+        """Gives the valid strings in shortlex order
+
+        Strings are given shortest first, and strings of the same length in
+        the order of their letters' code points. For each length the set of
+        states that can reach a final state in exactly the letters left is
+        known, so a prefix is only extended if it leads to a valid string and
+        every step of the search gives output. When the sets start repeating
+        without the start state in them, no longer string is valid and the
+        generator ends even without max_length.
+
+        Parameters
+        ----------
+        max_length : int
+            Length of the longest strings to give, None for no limit
+
+        Yields
+        ------
+        str
+            Each valid string
+        """
+
+        n_states = self.n_states
+        n_symbols = self.n_symbols
+        table = self.table
+        letters = sorted(self.symbol_index.items())
+        # reaching[r] holds the states with a path of exactly r letters to a final state
+        reaching = [frozenset(state for state in range(n_states) if self.is_final(state))]
+        first_seen = {reaching[0]: 0}
+        period_start = None
+
+        length = 0
+        while max_length is None or length <= max_length:
+            while len(reaching) <= length:
+                previous = reaching[-1]
+                reaching.append(frozenset(state for state in range(n_states)
+                                          if any(dest in previous for dest in table[state * n_symbols:(state + 1) * n_symbols])))
+                if period_start is None:
+                    if reaching[-1] in first_seen:
+                        period_start = first_seen[reaching[-1]]
+                    else:
+                        first_seen[reaching[-1]] = len(reaching) - 1
+            # once the sets repeat, lengths from here on only see sets already met
+            if period_start is not None and length >= period_start and \
+                    all(self.start not in states for states in reaching[period_start:]):
+                return
+
+            if self.start in reaching[length]:
+                # depth first in reverse letter order, so the stack pops the smallest prefix first
+                stack = [(self.start, '')]
+                while stack:
+                    state, prefix = stack.pop()
+                    left = length - len(prefix)
+                    if left == 0:
+                        yield prefix
+                        continue
+                    for letter, symbol in reversed(letters):
+                        dest = table[state * n_symbols + symbol]
+                        if dest >= 0 and dest in reaching[left - 1]:
+                            stack.append((dest, prefix + letter))
+            length += 1
+
+    def accepts_vectorized(self, inputs: list[str], batch_size: int = 1 << 16) -> list[bool]:
+        """Checks multiple strings together using numpy
+
+        All strings of a batch are moved one letter at a time through the
+        transition table, longest strings first, so each step only touches the
+        strings that still have letters left. Falls back to accepts() if numpy
+        is not installed or there are too many input letters to number in a byte.
+
+        Parameters
+        ----------
+        inputs : list[str]
+            A list of input strings to test
+        batch_size : int
+            Number of strings moved through the table together
+
+        Returns
+        -------
+        list[bool]
+            A list of bools per string, True if string is valid, False otherwise
+        """
+
+        np = _load_numpy()
+        if np is None or self.n_symbols >= 255:
+            return [self.accepts(input) for input in inputs]
+
+        # row n_states is the error state, column n_symbols is a letter outside the alphabet
+        reject = self.n_states
+        table = np.full((self.n_states + 1, self.n_symbols + 1), reject, dtype=np.int32)
+        moves = np.frombuffer(self.table, dtype=np.int32).reshape(self.n_states, self.n_symbols)
+        table[:self.n_states, :self.n_symbols] = np.where(moves < 0, reject, moves)
+        final = np.zeros(self.n_states + 1, dtype=bool)
+        final[:self.n_states] = [self.is_final(state) for state in range(self.n_states)]
+
+        codes = np.array(sorted(ord(symbol) for symbol in self.symbol_index), dtype=np.uint32)
+        numbers = np.array([self.symbol_index[chr(code)] for code in codes], dtype=np.uint8)
+        lookup = np.full(256, self.n_symbols, dtype=np.uint8)
+        for symbol, number in self.symbol_index.items():
+            if ord(symbol) < 256:
+                lookup[ord(symbol)] = number
+
+        output = list()
+        for first in range(0, len(inputs), batch_size):
+            batch = inputs[first:first + batch_size]
+            joined = ''.join(batch)
+            if joined.isascii():
+                letters = lookup[np.frombuffer(joined.encode('ascii'), dtype=np.uint8)]
+            else:
+                points = np.frombuffer(joined.encode('utf-32-le'), dtype='<u4')
+                found = np.minimum(np.searchsorted(codes, points), len(codes) - 1)
+                letters = np.where(codes[found] == points, numbers[found], self.n_symbols).astype(np.uint8)
+
+            lengths = np.fromiter(map(len, batch), dtype=np.int64, count=len(batch))
+            offsets = np.zeros(len(batch), dtype=np.int64)
+            np.cumsum(lengths[:-1], out=offsets[1:])
+
+            order = np.argsort(-lengths, kind='stable')
+            sorted_lengths = lengths[order]
+            positions = offsets[order]
+            states = np.full(len(batch), self.start, dtype=np.int32)
+            longest = int(sorted_lengths[0]) if len(batch) else 0
+            # strings are sorted longest first, so the ones still running are a prefix
+            running = np.searchsorted(-sorted_lengths, -np.arange(longest), side='left')
+            for column in range(longest):
+                active = running[column]
+                states[:active] = table[states[:active], letters[positions[:active] + column]]
+
+            verdicts = np.empty(len(batch), dtype=bool)
+            verdicts[order] = final[states]
+            output.extend(verdicts.tolist())
+        return output
+
+    def accepts_trie(self, inputs: list[str]) -> list[bool]:
+        """Checks multiple strings, moving through each shared prefix only once
+
+        The strings are visited in sorted order, which walks the prefix trie of
+        the batch depth first. The states after each letter of the previous
+        string are kept, so a string only moves through the letters after its
+        common prefix with the previous one. The number of moves is the number
+        of distinct prefixes instead of the total length of the strings.
+
+        Parameters
+        ----------
+        inputs : list[str]
+            A list of input strings to test
+
+        Returns
+        -------
+        list[bool]
+            A list of bools per string, True if string is valid, False otherwise
+        """
+
+        table = self.table
+        n_symbols = self.n_symbols
+        symbol_index = self.symbol_index
+        output = [False] * len(inputs)
+
+        # path[i] is the state after the first i letters of previous, -1 once it is an error
+        path = [self.start]
+        previous = ''
+        for index in sorted(range(len(inputs)), key=inputs.__getitem__):
+            input = inputs[index]
+            shared = min(_common_prefix_length(previous, input), len(path) - 1)
+            del path[shared + 1:]
+            state = path[shared]
+            if state >= 0:
+                for char in input[shared:]:
+                    symbol = symbol_index.get(char)
+                    state = table[state * n_symbols + symbol] if symbol is not None else -1
+                    path.append(state)
+                    if state < 0:
+                        break
+            output[index] = state >= 0 and len(path) == len(input) + 1 and self.is_final(state)
+            previous = input
+        return output
+
+
+    # codes in the byte table for the end of a line, the rest are row offsets
+    LINE_INVALID = -1
+    LINE_VALID = -2
+    CR_INVALID = -3
+    CR_VALID = -4
+    SKIP_LF = -5
+    LINE_BREAKS = b"\n\r\x0b\x0c\x1c\x1d\x1e"
+
+    def byte_table(self) -> list[int]:
+        """Gets the transition table over raw bytes used by scan_bytes()
+
+        Each state has a row of 256 entries, one per byte value, and states are
+        stored as row offsets (state * 256) so a move is a single lookup. Bytes
+        that are not input letters lead to an error row, and line break bytes
+        give one of the LINE_* or CR_* codes saying whether the line is valid.
+        After a carriage return an extra row, a copy of the start row, skips a
+        following line feed so \r\n ends only one line.
+
+        Raises
+        ------
+        Exception
+            If an input letter is not an ASCII character
+
+        Returns
+        -------
+        list[int]
+            The flat byte transition table
+        """
+
+        if self._byte_table is not None:
+            return self._byte_table
+        for symbol in self.symbol_index:
+            if not symbol.isascii():
+                raise Exception(f"Error! {symbol} is not an ASCII input letter.")
+
+        reject = self.n_states
+        after_cr = self.n_states + 1
+        table = [reject * 256] * ((self.n_states + 2) * 256)
+        for state in range(self.n_states):
+            row = state * 256
+            for symbol, number in self.symbol_index.items():
+                dest = self.table[state * self.n_symbols + number]
+                table[row + ord(symbol)] = (dest if dest >= 0 else reject) * 256
+            for byte in self.LINE_BREAKS:
+                table[row + byte] = self.LINE_VALID if self.is_final(state) else self.LINE_INVALID
+            table[row + ord('\r')] = self.CR_VALID if self.is_final(state) else self.CR_INVALID
+        for byte in self.LINE_BREAKS:
+            table[reject * 256 + byte] = self.LINE_INVALID
+        table[reject * 256 + ord('\r')] = self.CR_INVALID
+        table[after_cr * 256:] = table[self.start * 256:(self.start + 1) * 256]
+        table[after_cr * 256 + ord('\n')] = self.SKIP_LF
+
+        self._byte_table = table
+        return table
+
+    def scan_bytes(self, data) -> Iterator[bool]:
+        """Checks every line of raw file contents
+
+        Runs the byte transition table straight over the bytes, going back to
+        the start state at each line break, so no string is made per line. Line
+        breaks are the ASCII ones of str.splitlines() with \r\n counted once,
+        and any non-ASCII byte makes its line invalid.
+
+        Parameters
+        ----------
+        data : bytes-like
+            Contents of a .in file, e.g. a memory-mapped file
+
+        Raises
+        ------
+        Exception
+            If an input letter is not an ASCII character
+
+        Yields
+        ------
+        bool
+            True if the line is valid, False otherwise
+        """
+
+        table = self.byte_table()
+        start = self.start * 256
+        after_cr = (self.n_states + 1) * 256
+        skip_lf = self.SKIP_LF
+        state = start
+        for byte in memoryview(data):
+            state = table[state + byte]
+            if state < 0:
+                if state == skip_lf:
+                    state = start
+                    continue
+                # the valid codes are the even ones
+                yield state & 1 == 0
+                state = after_cr if state <= self.CR_INVALID else start
+        if len(data) and data[-1] not in self.LINE_BREAKS:
+            yield self.is_final(state // 256) if state < self.n_states * 256 else False
+
+
+    def equivalent(self, other: "CompiledDFA") -> bool:
+        """Determines if another DFA accepts exactly the same strings
+
+        Walks both DFAs together from their start states over the letters of
+        either alphabet, a letter missing from one alphabet being an error in
+        that DFA, and looks for a pair of states where only one is final.
+
+        Parameters
+        ----------
+        other : CompiledDFA
+            The DFA to compare with
+
+        Returns
+        -------
+        bool
+            True if both DFAs accept the same strings, False otherwise
+        """
+
+        letters = set(self.symbol_index) | set(other.symbol_index)
+        pairs = [(self.start, other.start)]
+        seen = set(pairs)
+        for state, other_state in pairs:
+            if self.is_final(state) != other.is_final(other_state):
+                return False
+            for char in letters:
+                pair = (self.move(state, char), other.move(other_state, char))
+                if pair not in seen:
+                    seen.add(pair)
+                    pairs.append(pair)
+        return True
+
+    def move(self, state: int, char: str) -> int:
+        """Does the logic for state transitions on numbered states
+
+        Parameters
+        ----------
+        state : int
+            Number of the source state, -1 for the error state
+        char : str
+            Input letter
+
+        Returns
+        -------
+        int
+            Number of the destination state, -1 for an error
+        """
+
+        symbol = self.symbol_index.get(char)
+        if state < 0 or symbol is None:
+            return -1
+        return self.table[state * self.n_symbols + symbol]
+
+def _common_prefix_length(first: str, second: str) -> int:
+    """Gets the length of the common prefix of two strings, or of two bytearrays"""
+
+    length = min(len(first), len(second))
+    if first[:length] == second[:length]:
+        return length
+    # binary search on slice comparisons, which run in C
+    low, high = 0, length
+    while low < high:
+        middle = (low + high + 1) // 2
+        if first[:middle] == second[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+class Instrumentation:
+    """
+    A class that records where the time of a run goes, for profiling slow runs.
+    Pass one to FileParser, StringChecker or App to turn it on; without one
+    nothing is recorded.
+
+    Per-state visits are counted on the compiled DFA, where equivalent states
+    are merged, so a merged state is counted under the name of its first state.
+
+    Each stage records only its own time. Time recorded by a stage that runs
+    inside another one, such as lazy checking while the results are saved, is
+    left out of the outer stage, so the stages add up to the time of the run.
+
+    Attributes
+    ----------
+    stages : dict[str, dict]
+        Wall time and number of calls of each stage, e.g. "parse_dfa", "check"
+    recorded_seconds : float
+        Total seconds recorded by all stages, used to leave inner stages out
+        of the stages around them
+    strings : int
+        Number of strings checked
+    symbols : int
+        Number of input letters checked
+    accepted : int
+        Number of valid strings
+    rejections : dict[str, int]
+        Number of invalid strings by reason, "invalid_symbol" for a letter
+        outside the alphabet and "non_final" for ending outside a final state
+    state_visits : dict[str, int]
+        Number of times each state was entered, only for checks done one
+        string at a time
+    hooks : list
+        Functions called as hook(stage, record) whenever a stage ends
+
+    Methods
+    -------
+    add_hook(hook)
+        Adds a function to call whenever a stage ends
+    stage(name)
+        Records the wall time of a block of code as a stage
+    timed(name, iterable)
+        Records the time spent getting the items of an iterable as a stage
+    add_stage(name, seconds)
+        Adds a call of a stage and calls the hooks
+    check(dfa, input)
+        Checks a string, recording visited states and the rejection reason
+    count(inputs)
+        Records strings that were checked without tracing
+    report()
+        Gets everything recorded
+    to_json()
+        Gets everything recorded as JSON
+    summary()
+        Gets a one-line summary for the status bar
+    """
+
+    def __init__(self) -> None:
+        """Constructor of the Instrumentation class
+        """
+
+        self.stages = dict()
+        self.recorded_seconds = 0.0
+        self.strings = 0
+        self.symbols = 0
+        self.accepted = 0
+        self.rejections = {"invalid_symbol": 0, "non_final": 0}
+        self.state_visits = dict()
+        self.hooks = list()
+
+    def add_hook(self, hook) -> None:
+        """Adds a function to call whenever a stage ends
+
+        Parameters
+        ----------
+        hook : Callable[[str, dict], None]
+            Called with the stage name and its record, e.g. {"seconds": 0.5, "calls": 1}
+        """
+
+        self.hooks.append(hook)
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Records the wall time of a block of code as a stage
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage
+        """
+
+        start = time.perf_counter()
+        recorded = self.recorded_seconds
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            seconds = elapsed - (self.recorded_seconds - recorded)
+            self.recorded_seconds = recorded + elapsed
+            self.add_stage(name, seconds)
+
+    def timed(self, name: str, iterable: Iterable) -> Iterator:
+        """Records the time spent getting the items of an iterable as a stage
+
+        Lazy steps such as FileParser.in_stream() and StringChecker.check_stream()
+        run while their items are used, e.g. while the results are saved. The
+        time of each item is recorded under name and left out of the stage
+        that uses it. The stage counts one call when the items run out or the
+        iterator is closed.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage
+        iterable : Iterable
+            The items to time
+
+        Yields
+        ------
+        Any
+            The same items, unchanged
+        """
+
+        iterator = iter(iterable)
+        seconds = 0.0
+        try:
+            while True:
+                start = time.perf_counter()
+                recorded = self.recorded_seconds
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed = time.perf_counter() - start
+                    seconds += elapsed - (self.recorded_seconds - recorded)
+                    self.recorded_seconds = recorded + elapsed
+                yield item
+        finally:
+            self.add_stage(name, seconds)
+
+    def add_stage(self, name: str, seconds: float) -> None:
+        """Adds a call of a stage and calls the hooks
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage
+        seconds : float
+            Time of the call, without the stages inside it
+        """
+
+        record = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0})
+        record["seconds"] += seconds
+        record["calls"] += 1
+        for hook in self.hooks:
+            hook(name, record)
+
+    def check(self, dfa: CompiledDFA, input: str) -> bool:
+        """Checks a string, recording visited states and the rejection reason
+
+        Parameters
+        ----------
+        dfa : CompiledDFA
+            The DFA to check the string with
+        input : str
+            An input string to test
+
+        Returns
+        -------
+        bool
+            True if string is valid, False otherwise
+        """
+
+        visits = self.state_visits
+        names = dfa.state_names
+        state = dfa.start
+        visits[names[state]] = visits.get(names[state], 0) + 1
+        reason = None
+        for char in input:
+            symbol = dfa.symbol_index.get(char)
+            if symbol is None:
+                reason = "invalid_symbol"
+                break
+            state = dfa.table[state * dfa.n_symbols + symbol]
+            if state < 0:
+                # the string can no longer be valid, but a later letter may still be outside the alphabet
+                reason = "non_final" if all(char in dfa.symbol_index for char in input) else "invalid_symbol"
+                break
+            visits[names[state]] = visits.get(names[state], 0) + 1
+
+        self.strings += 1
+        self.symbols += len(input)
+        if reason is None and dfa.is_final(state):
+            self.accepted += 1
+            return True
+        self.rejections[reason or "non_final"] += 1
+        return False
+
+    def count(self, inputs: list[str]) -> None:
+        """Records strings that were checked without tracing
+
+        Parameters
+        ----------
+        inputs : list[str]
+            The strings that were checked
+        """
+
+        self.strings += len(inputs)
+        self.symbols += sum(map(len, inputs))
+
+    def report(self) -> dict:
+        """Gets everything recorded
+
+        Returns
+        -------
+        dict
+            The stages, counts, rejection reasons and state visits
+        """
+
+        return {
+            "stages": self.stages,
+            "strings": self.strings,
+            "symbols": self.symbols,
+            "accepted": self.accepted,
+            "rejections": self.rejections,
+            "state_visits": self.state_visits,
+        }
+
+    def to_json(self) -> str:
+        """Gets everything recorded as JSON
+
+        Returns
+        -------
+        str
+            The report() as a JSON string
+        """
+
+        return json.dumps(self.report(), indent=2)
+
+    def summary(self) -> str:
+        """Gets a one-line summary for the status bar
+
+        Returns
+        -------
+        str
+            Time per stage and the number of strings and rejections
+        """
+
+        stages = ", ".join(f"{name} {record['seconds']:.3f}s" for name, record in self.stages.items())
+        return (f"{stages}; {self.strings} strings, {self.symbols} symbols, "
+                f"{self.rejections['invalid_symbol']} invalid symbol, {self.rejections['non_final']} non-final")
+
+
+def _multiply(first: list[list[int]], second: list[list[int]]) -> list[list[int]]:
+    """Multiplies two matrices of integers given as lists of rows"""
+
+    columns = list(zip(*second))
+    return [[sum(map(operator.mul, row, column)) for column in columns] for row in first]
+
+def _stage(instrumentation: Instrumentation, name: str):
+    """Gets a context that records a stage, or does nothing if instrumentation is None"""
+
+    if instrumentation is None:
+        return contextlib.nullcontext()
+    return instrumentation.stage(name)
+
+def _timed(instrumentation: Instrumentation, name: str, iterable: Iterable) -> Iterable:
+    """Gets the items of an iterable timed as a stage, or the iterable itself if instrumentation is None"""
+
+    if instrumentation is None:
+        return iterable
+    return instrumentation.timed(name, iterable)
+
+
+class ProductDFA:
+    """
+    Class to run several DFAs over the same strings in one pass.
+
+    A state of the product is the tuple of the states of every DFA. Product
+    states and their moves are only built when a string reaches them, so each
+    letter usually costs one dict lookup for all DFAs together. If the product
+    grows past max_states, strings that need new product states are stepped
+    through each DFA separately instead.
+
+    Attributes
+    ----------
+    dfas : list[CompiledDFA]
+        The DFAs being run
+    max_states : int
+        Largest number of product states to build
+    product_states : list[tuple[int, ...]]
+        The state of every DFA for each product state
+    moves : list[dict[str, int]]
+        The product state reached from each product state on each letter seen so far
+    verdicts : list[tuple[bool, ...]]
+        Whether each DFA is in a final state, for each product state
+
+    Methods
+    -------
+    accepts(input)
+        Checks a string against every DFA
+    """
+
+    def __init__(self, dfas: list[CompiledDFA], max_states: int = 1 << 16) -> None:
+        """
+        Parameters
+        ----------
+        dfas : list[CompiledDFA]
+            The DFAs to run
+        max_states : int
+            Largest number of product states to build
+        """
+
+        self.dfas = dfas
+        self.max_states = max_states
+        self.product_states = list()
+        self.moves = list()
+        self.verdicts = list()
+        self.index = dict()
+        self.add(tuple(dfa.start for dfa in dfas))
+        # every DFA in the error state, no letter can change the verdicts
+        self.dead = self.add(tuple(-1 for _ in dfas))
+
+    def add(self, states: tuple[int, ...]) -> int:
+        """Adds a product state
+
+        Parameters
+        ----------
+        states : tuple[int, ...]
+            The state of every DFA
+
+        Returns
+        -------
+        int
+            Number of the new product state
+        """
+
+        number = len(self.product_states)
+        self.index[states] = number
+        self.product_states.append(states)
+        self.moves.append(dict())
+        self.verdicts.append(tuple(dfa.is_final(state) for dfa, state in zip(self.dfas, states)))
+        return number
+
+    def step(self, states: tuple[int, ...], char: str) -> tuple[int, ...]:
+        """Moves every DFA on one letter
+
+        Parameters
+        ----------
+        states : tuple[int, ...]
+            The state of every DFA
+        char : str
+            Input letter
+
+        Returns
+        -------
+        tuple[int, ...]
+            The next state of every DFA, -1 for an error
+        """
+
+        next_states = list()
+        for dfa, state in zip(self.dfas, states):
+            symbol = dfa.symbol_index.get(char)
+            if state < 0 or symbol is None:
+                next_states.append(-1)
+            else:
+                next_states.append(dfa.table[state * dfa.n_symbols + symbol])
+        return tuple(next_states)
+
+    def accepts(self, input: str) -> tuple[bool, ...]:
+        """Checks a string against every DFA
+
+        Parameters
+        ----------
+        input : str
+            An input string to test
+
+        Returns
+        -------
+        tuple[bool, ...]
+            True for each DFA the string is valid in, False otherwise
+        """
+
+        moves = self.moves
+        dead = self.dead
+        state = 0
+        for char in input:
+            next_state = moves[state].get(char)
+            if next_state is None:
+                states = self.step(self.product_states[state], char)
+                next_state = self.index.get(states)
+                if next_state is None:
+                    if len(self.product_states) >= self.max_states:
+                        return self.accepts_separately(input)
+                    next_state = self.add(states)
+                moves[state][char] = next_state
+            state = next_state
+            if state == dead:
+                break
+        return self.verdicts[state]
+
+    def accepts_separately(self, input: str) -> tuple[bool, ...]:
+        """Checks a string against every DFA without building product states
+
+        Parameters
+        ----------
+        input : str
+            An input string to test
+
+        Returns
+        -------
+        tuple[bool, ...]
+            True for each DFA the string is valid in, False otherwise
+        """
+
+        return tuple(dfa.accepts(input) for dfa in self.dfas)
+
+
+class FileParser:
+    """
+    A class that parses .in and .dfa files into usable elements in the program
+    Main author: Poledo
+
+    Attributes
+    ----------
+    instrumentation : Instrumentation
+        Records the time spent parsing, None to record nothing
+
+    Methods
+    -------
+    in_parser(src)
+        Parses a .in file
+    in_stream(src)
+        Reads a .in file one string at a time
+    dfa_parser(src)
+        Parses a .dfa file
+    dfa_text_parser(text, file_name)
+        Parses the content of a .dfa file, e.g. one sent to the DFAServer
+    classic_dfa_parser(content, file_name)
+        Parses the lines of a classic .dfa file
+    extended_dfa_parser(content, file_name)
+        Parses the lines of an extended .dfa file, after the %extended line
+    compiled_dfa_parser(src)
+        Parses a .dfa file into a CompiledDFA, using a binary cache
+    """
+
+    def __init__(self, instrumentation: Instrumentation = None) -> None:
+        """
+        Parameters
+        ----------
+        instrumentation : Instrumentation
+            Records the time spent parsing, None to record nothing
+        """
+
+        self.instrumentation = instrumentation
+
+    def in_parser(self, src: str) -> list[str]:
+        """Parses a .in file
+        
+        Parameters
+        ----------
+        src : str
+            A file path to the .in file
+        
+        Returns
+        -------
+        list[str]
+            A list of all strings from the .in  file
+        """
+
+        with _stage(self.instrumentation, "parse_input"):
+            file = open(src, 'r')
+            content = file.read().splitlines()
+            file.close()
+        return content
+
+    def in_stream(self, src: str) -> Iterator[str]:
+        """Reads a .in file one string at a time
+
+        Gives the same strings as in_parser() without holding the whole file in memory.
+        With instrumentation, the reading time is the "parse_input" stage.
+        
+        Parameters
+        ----------
+        src : str
+            A file path to the .in file
+        
+        Yields
+        ------
+        str
+            Each string from the .in file
+        """
+
+        def read() -> Iterator[str]:
+            with open(src, 'r') as file:
+                for line in file:
+                    # splitlines() also breaks on characters like \f that file iteration keeps
+                    yield from line.splitlines()
+
+        return _timed(self.instrumentation, "parse_input", read())
+
+    def dfa_parser(self, src: str) -> StateMachine:
+        """Parses a .dfa file
+        
+        Two dialects are accepted. The classic one has 2 input symbols on the
+        first line and one line per state, type,name,dest1,dest2, where names
+        are single capital letters. The extended one starts with a %extended
+        line, then any number of single character input symbols, then state
+        lines type,name,dest1,...,destN where names are any text without commas.
+        The type is - for the start state, + for a final state, -+ or +- for
+        both, or empty.
+
+        Parameters
+        ----------
+        src : str
+            A file path to the .dfa file
+        
+        Raises
+        ------
+        Exception
+            If there are invalid inputs in the file
+        
+        Returns
+        -------
+        StateMachine
+            A working StateMachine object based on the .dfa file
+        """
+
+        with _stage(self.instrumentation, "parse_dfa"):
+            file = open(src, 'r')
+            text = file.read()
+            file.close()
+
+            return self.dfa_text_parser(text, os.path.basename(src))
+
+    def dfa_text_parser(self, text: str, file_name: str) -> StateMachine:
+        """Parses the content of a .dfa file, e.g. one sent to the DFAServer
+
+        Parameters
+        ----------
+        text : str
+            The content of the .dfa file, in either dialect
+        file_name : str
+            Name of the file shown in error messages
+
+        Raises
+        ------
+        Exception
+            If there are invalid inputs in the content
+
+        Returns
+        -------
+        StateMachine
+            A working StateMachine object based on the content
+        """
+
+        content = text.splitlines()
+        if content and content[0] == "%extended":
+            state_machine = self.extended_dfa_parser(content[1:], file_name)
+        else:
+            state_machine = self.classic_dfa_parser(content, file_name)
+
+        # optimize the DFA now so checking strings later uses the smaller table
+        state_machine.compile()
+        return state_machine
+
+    def classic_dfa_parser(self, content: list[str], file_name: str) -> StateMachine:
+        """Parses the lines of a classic .dfa file
+
+        Parameters
+        ----------
+        content : list[str]
+            The lines of the file
+        file_name : str
+            The file name used in error messages
+
+        Raises
+        ------
+        Exception
+            If there are invalid inputs in the file
+
+        Returns
+        -------
+        StateMachine
+            A working StateMachine object based on the lines
+        """
+
+        content = [line.split(',') for line in content]
+        alphabet = content.pop(0) if content else ['']
+        
+        # errors: more than 2 symbols, the 2 symbols are the same, the symbols are not single character
+        if (len(alphabet) != 2 or alphabet[0] == alphabet[1]):
+            raise Exception(f"({file_name}) Invalid DFA! DFA must have 2 unique input symbols.")
+        for char in alphabet:
+            if (len(char) != 1):
+                raise Exception(f"({file_name}) Invalid DFA! ({char}) is not a valid input symbol.")
+
+        start_state = None
+        start_transition = None
+        states = list()
+        f_states = list()
+        transition = list(list())
+
+        current_line = 1    # for checking dfa file line number
+
+        for line in content:
+            current_line += 1
+            # error if line is missing state type or state name
+            if len(line) < 2:
+                raise Exception(f"({file_name}) Invalid DFA! Invalid state in line {current_line}.")
+            if line[0] == '-' or line[0] == '-+' or line[0] == '+-':
+                if start_state is not None:
+                    raise Exception(f"({file_name}) Invalid DFA! Duplicate start state in line {current_line}.")
+                start_state = line[1]
+                start_transition = line[2:4]
+                if line[0] == '-+' or line[0] == '+-':
+                    f_states.append(line[1])
+            else:
+                if line[0] == '+':
+                    f_states.append(line[1])
+                elif line[0] != '':
+                    # determinant of start/final state is not - or +
+                    raise Exception(f"({file_name}) Invalid DFA! Invalid state type symbol ({line[0]}) in line {current_line}.")
+                states.append(line[1])
+                transition.append(line[2:4])
+            
+            # other errors: non capital letter state, invalid transitions
+            if len(line[1]) != 1 or not line[1].isupper():
+                raise Exception(f"({file_name}) Invalid DFA! Invalid state ({line[1]}) found in line {current_line}. Not a capital letter.")
+            if len(line) != 4:
+                raise Exception(f"({file_name}) Invalid DFA! Invalid number of state transitions in line {current_line}.")
+
+        # the start state goes first, states[0] is the start state
+        if start_state is not None:
+            states.insert(0, start_state)
+            transition.insert(0, start_transition)
+        
+        # some more errors: state with no transitions
+        known_states = set(states)
+        first_with_row = dict()     # the error names the first state with an identical transition row
+        for index, line in enumerate(transition):
+            first_with_row.setdefault(tuple(line), index)
+            for state in line:
+                if not state in known_states:
+                    raise Exception(f"({file_name}) Invalid DFA! Invalid state ({state}) in transitions for state {states[first_with_row[tuple(line)]]}.")
+        
+        if start_state is None:
+            raise Exception(f"({file_name}) Invalid DFA! No start state found.")
+
+        return StateMachine(alphabet, states, f_states, transition)
+
+    def extended_dfa_parser(self, content: list[str], file_name: str) -> StateMachine:
+        """Parses the lines of an extended .dfa file, after the %extended line
+
+        Runs in linear time, states are looked up in a dict.
+
+        Parameters
+        ----------
+        content : list[str]
+            The lines of the file after the %extended line
+        file_name : str
+            The file name used in error messages
+
+        Raises
+        ------
+        Exception
+            If there are invalid inputs in the file
+
+        Returns
+        -------
+        StateMachine
+            A working StateMachine object based on the lines
+        """
+
+        if not content:
+            raise Exception(f"({file_name}) Invalid DFA! No input symbols in line 2.")
+        alphabet = content[0].split(',')
+        for char in alphabet:
+            if len(char) != 1:
+                raise Exception(f"({file_name}) Invalid DFA! ({char}) is not a valid input symbol in line 2.")
+        if len(set(alphabet)) != len(alphabet):
+            raise Exception(f"({file_name}) Invalid DFA! Input symbols must be unique in line 2.")
+
+        start_state = None
+        states = list()
+        f_states = list()
+        transition = list()
+        line_of_state = dict()   # state name -> line number, also the set of known states
+
+        for current_line, text in enumerate(content[1:], start=3):
+            line = text.split(',')
+            if len(line) < 2 or line[1] == '' or line[1] != line[1].strip():
+                raise Exception(f"({file_name}) Invalid DFA! Invalid state in line {current_line}.")
+            state_type, name = line[0], line[1]
+            if state_type not in ('', '-', '+', '-+', '+-'):
+                raise Exception(f"({file_name}) Invalid DFA! Invalid state type symbol ({state_type}) in line {current_line}.")
+            if name in line_of_state:
+                raise Exception(f"({file_name}) Invalid DFA! Duplicate state ({name}) in line {current_line}, "
+                                f"first found in line {line_of_state[name]}.")
+            if len(line) != len(alphabet) + 2:
+                raise Exception(f"({file_name}) Invalid DFA! Invalid number of state transitions in line {current_line}.")
+            line_of_state[name] = current_line
+
+            if '-' in state_type:
+                if start_state is not None:
+                    raise Exception(f"({file_name}) Invalid DFA! Duplicate start state in line {current_line}.")
+                start_state = len(states)
+            if '+' in state_type:
+                f_states.append(name)
+            states.append(name)
+            transition.append(line[2:])
+
+        if start_state is None:
+            raise Exception(f"({file_name}) Invalid DFA! No start state found.")
+
+        for name, row in zip(states, transition):
+            for state in row:
+                if state not in line_of_state:
+                    raise Exception(f"({file_name}) Invalid DFA! Invalid state ({state}) in transitions for state {name} "
+                                    f"in line {line_of_state[name]}.")
+
+        # states[0] is the start state, the others keep their order
+        order = [start_state] + [index for index in range(len(states)) if index != start_state]
+        return StateMachine(alphabet, [states[index] for index in order], f_states, [transition[index] for index in order])
+
+    def compiled_dfa_parser(self, src: str) -> CompiledDFA:
+        """Parses a .dfa file into a CompiledDFA, using a binary cache
+
+        The compiled DFA is cached in a file next to the .dfa file (X.dfa ->
+        X.dfac) along with the SHA-256 hash of the .dfa file. The cache is used
+        while the hash still matches, and is rebuilt if the .dfa file changed or
+        the cache is corrupt. If the cache cannot be written the DFA is still
+        returned.
+        
+        Parameters
+        ----------
+        src : str
+            A file path to the .dfa file
+        
+        Raises
+        ------
+        Exception
+            If there are invalid inputs in the file
+        
+        Returns
+        -------
+        CompiledDFA
+            The compiled DFA based on the .dfa file
+        """
+
+        file = open(src, 'rb')
+        source_hash = hashlib.sha256(file.read()).digest()
+        file.close()
+
+        cache = src + 'c'
+        with _stage(self.instrumentation, "load_dfa_cache"):
+            compiled = CompiledDFA.load(cache, source_hash)
+        if compiled is None:
+            compiled = self.dfa_parser(src).compile()
+            try:
+                compiled.save(cache, source_hash)
+            except OSError:
+                pass
+        return compiled
+
+
+# maps result bytes (0 or 1) to binary digits and back, for packing through int()
+_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+
+def _results_text(values: bytes) -> bytes:
+    """Turns result bytes, 1 for VALID and 0 for INVALID, into the lines of a .out file"""
+
+    line_break = os.linesep.encode()
+    return bytes(values).replace(b"\x00", b"IN\x01").replace(b"\x01", b"VALID" + line_break)
+
+class ResultBits:
+    """
+    A class that stores the results of checking strings as packed bits, one
+    bit per string instead of a pointer per bool
+
+    It can be used like the list[bool] it replaces: it has a length, can be
+    indexed, sliced and iterated, and compares equal to a list of the same
+    bools. Bit i is bit (i % 8) of byte (i // 8), as in CompiledDFA.final.
+
+    Attributes
+    ----------
+    data : bytearray
+        The packed bits, True for VALID and False for INVALID
+    length : int
+        Number of results
+
+    Methods
+    -------
+    from_bytes(values)
+        Makes the results from bytes that are 1 for VALID and 0 for INVALID
+    unpack()
+        Gets one byte per result, 1 for VALID and 0 for INVALID
+    count(value)
+        Counts the results equal to a value
+    tolist()
+        Gets the results as a list of bools
+    write_text(file, first, chunk_size)
+        Writes the results as VALID and INVALID lines to a binary file
+    save(filename)
+        Saves the results as a binary .out file
+    load(filename)
+        Loads results from a binary .out file
+    """
+
+    BITS_MAGIC = b"PE01OUT\0"
+    BITS_HEADER = struct.Struct("<8sQ")
+
+    def __init__(self, output_bools: Iterable[bool] = ()) -> None:
+        """
+        Parameters
+        ----------
+        output_bools : Iterable[bool]
+            The results, e.g. from check_stream()
+        """
+
+        values = bytes(map(bool, output_bools))
+        self.length = len(values)
+        # the first result is the lowest bit, so the digits are read in reverse
+        digits = values[::-1].translate(_TO_DIGITS)
+        self.data = bytearray(int(digits or b"0", 2).to_bytes((self.length + 7) // 8, 'little'))
+
+    @classmethod
+    def from_bytes(cls, values: bytes) -> "ResultBits":
+        """Makes the results from bytes that are 1 for VALID and 0 for INVALID
+
+        Parameters
+        ----------
+        values : bytes
+            One byte per result, e.g. bytes(map(dfa.accepts, inputs))
+
+        Returns
+        -------
+        ResultBits
+            The packed results
+        """
+
+        results = cls.__new__(cls)
+        results.length = len(values)
+        digits = bytes(values[::-1]).translate(_TO_DIGITS)
+        results.data = bytearray(int(digits or b"0", 2).to_bytes((results.length + 7) // 8, 'little'))
+        return results
+
+    def unpack(self) -> bytes:
+        """Gets one byte per result, 1 for VALID and 0 for INVALID
+
+        Returns
+        -------
+        bytes
+            The unpacked results
+        """
+
+        if self.length == 0:
+            return b""
+        digits = format(int.from_bytes(self.data, 'little'), 'b').zfill(self.length)
+        return digits.encode('ascii')[::-1].translate(_FROM_DIGITS)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ResultBits.from_bytes(self.unpack()[index])
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("ResultBits index out of range")
+        return bool(self.data[index >> 3] >> (index & 7) & 1)
+
+    def __iter__(self) -> Iterator[bool]:
+        return map(bool, self.unpack())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ResultBits):
+            return self.length == other.length and self.data == other.data
+        try:
+            return self.length == len(other) and self.unpack() == bytes(map(bool, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ResultBits({self.tolist()!r})"
+
+    def count(self, value: bool) -> int:
+        """Counts the results equal to a value
+
+        Parameters
+        ----------
+        value : bool
+            True to count VALID results, False to count INVALID results
+
+        Returns
+        -------
+        int
+            The number of results equal to value
+        """
+
+        valid = bin(int.from_bytes(self.data, 'little')).count('1')
+        return valid if value else self.length - valid
+
+    def tolist(self) -> list[bool]:
+        """Gets the results as a list of bools
+
+        Returns
+        -------
+        list[bool]
+            True for VALID and False for INVALID, one per result
+        """
+
+        return list(map(bool, self.unpack()))
+
+    def write_text(self, file, first: int = 0, chunk_size: int = 1 << 16) -> None:
+        """Writes the results as VALID and INVALID lines to a binary file
+
+        Parameters
+        ----------
+        file : BinaryIO
+            A file opened for writing bytes
+        first : int
+            Index of the first result to write
+        chunk_size : int
+            Number of lines joined into one write
+        """
+
+        values = self.unpack()
+        for start in range(first, self.length, chunk_size):
+            file.write(_results_text(values[start:start + chunk_size]))
+
+    def save(self, filename: str) -> None:
+        """Saves the results as a binary .out file
+
+        The file has a header with BITS_MAGIC and the number of results as a
+        little-endian 64-bit integer, followed by the packed bits.
+
+        Parameters
+        ----------
+        filename : str
+            The filename to store the results
+        """
+
+        with open(filename, 'wb') as file:
+            file.write(self.BITS_HEADER.pack(self.BITS_MAGIC, self.length))
+            file.write(self.data)
+
+    @classmethod
+    def load(cls, filename: str) -> "ResultBits":
+        """Loads results from a binary .out file
+
+        Parameters
+        ----------
+        filename : str
+            A file saved by save()
+
+        Raises
+        ------
+        Exception
+            If the file is not a binary .out file
+
+        Returns
+        -------
+        ResultBits
+            The results in the file
+        """
+
+        with open(filename, 'rb') as file:
+            content = file.read()
+        header = cls.BITS_HEADER
+        if len(content) >= header.size:
+            magic, length = header.unpack_from(content)
+            if magic == cls.BITS_MAGIC and len(content) == header.size + (length + 7) // 8:
+                results = cls.__new__(cls)
+                results.length = length
+                results.data = bytearray(content[header.size:])
+                return results
+        raise Exception(f"Error! {os.path.basename(filename)} is not a binary output file.")
+
+
+class StringChecker:
+    """
+    A class that contains the methods for checking for valid strings
+    Main author: Galang
+
+    Attributes
+    ----------
+    instrumentation : Instrumentation
+        Records the time spent checking and saving, None to record nothing
+
+    Methods
+    -------
+    is_valid(input, state_machine)
+        Checks if a string is valid
+    check_multiple(inputs, state_machine)
+        Checks multiple strings if those are valid
+    check_multiple_vectorized(inputs, state_machine)
+        Checks multiple strings if those are valid, all strings at once
+    check_multiple_parallel(inputs, state_machine, workers, chunk_size, serial_threshold)
+        Checks multiple strings if those are valid, using several processes
+    check_long(inputs, state_machine, workers, chunk_size, max_states)
+        Checks strings that can each be too long for one process, e.g. hundreds of MB
+    map_chunks(executor, input, workers, chunk_size)
+        Sends the chunks of a long string to the workers, two per worker at a time
+    check_multiple_trie(inputs, state_machine)
+        Checks multiple strings if those are valid, sharing work on common prefixes
+    check_multiple_stride(inputs, state_machine, k)
+        Checks multiple strings if those are valid, several letters per move
+    check_stream(inputs, state_machine)
+        Checks strings one at a time as they are read
+    scan_file(src, state_machine)
+        Checks every line of a .in file straight from its bytes
+    check_multiple_dfas(inputs, state_machines)
+        Checks strings against several DFAs in one pass
+    save_output_combined(output_rows, filename)
+        Saves the results of several DFAs as one file with a column per DFA
+    save_output_per_dfa(output_rows, filenames)
+        Saves the results of several DFAs as one file per DFA
+    save_output(output_bools, filename)
+        Saves the output as a properly formatted strings.out file
+    save_output_stream(output_bools, filename, buffer_size)
+        Saves the output while it is being produced
+    save_output_bits(output_bools, filename)
+        Saves the output as a compact binary file
+    """
+
+    def __init__(self, instrumentation: Instrumentation = None) -> None:
+        """
+        Parameters
+        ----------
+        instrumentation : Instrumentation
+            Records the time spent checking and saving, None to record nothing
+        """
+
+        self.instrumentation = instrumentation
+
+    def is_valid(self, input: str, state_machine: StateMachine) -> bool:
+        """Checks if a string is valid
+        
+        Parameters
+        ----------
+        input : str
+            An input string to test
+        state_machine : StateMachine
+            A state machine object for recognizing valid words
+        
+        Returns
+        -------
+        bool
+            True if string is valid, False otherwise
+        """
+
+        if self.instrumentation is not None:
+            return self.instrumentation.check(state_machine.compile(), input)
+        return state_machine.compile().accepts(input)
+    
+    def check_multiple(self, inputs: list[str], state_machine: StateMachine) -> ResultBits:
+        """Checks multiple strings if those are valid
+        
+        Parameters
+        ----------
+        input : list[str]
+            A list of input strings to test
+        state_machine : StateMachine
+            A state machine object for recognizing valid words
+        
+        Returns
+        -------
+        ResultBits
+            A bool per string, True if string is valid, False otherwise, packed
+            into bits but indexed and iterated like a list[bool]
+        """
+
+        dfa = state_machine.compile()
+        if self.instrumentation is not None:
+            check = self.instrumentation.check
+            with self.instrumentation.stage("check"):
+                return ResultBits(check(dfa, input) for input in inputs)
+        return ResultBits.from_bytes(bytes(map(dfa.accepts, inputs)))
+
+    def check_multiple_vectorized(self, inputs: list[str], state_machine: StateMachine) -> ResultBits:
+        """Checks multiple strings if those are valid, all strings at once
+
+        Gives the same output as check_multiple() but steps every string through
+        the DFA together with numpy, which is much faster for large batches.
+
+        Parameters
+        ----------
+        input : list[str]
+            A list of input strings to test
+        state_machine : StateMachine
+            A state machine object for recognizing valid words
+        
+        Returns
+        -------
+        ResultBits
+            A bool per string, True if string is valid, False otherwise
+        """
+
+        if self.instrumentation is not None:
+            self.instrumentation.count(inputs)
+        with _stage(self.instrumentation, "check"):
+            return ResultBits.from_bytes(bytes(state_machine.compile().accepts_vectorized(inputs)))
+
+    def check_multiple_parallel(self, inputs: list[str], state_machine: StateMachine, workers: int = None,
+                                chunk_size: int = 20000, serial_threshold: int = 100000) -> ResultBits:
+        """Checks multiple strings if those are valid, using several processes
+
+        The inputs are split into chunks that are checked by a process pool.
+        The compiled DFA is sent to each worker once when it starts, and the
+        results are put back together in input order.
+
+        Parameters
+        ----------
+        inputs : list[str]
+            A list of input strings to test
+        state_machine : StateMachine
+            A state machine object for recognizing valid words
+        workers : int
+            Number of worker processes, defaults to the number of CPUs
+        chunk_size : int
+            Number of strings sent to a worker at a time
+        serial_threshold : int
+            Batches smaller than this are checked in this process, since
+            starting the workers would take longer than the check itself
+
+        Returns
+        -------
+        ResultBits
+            A bool per string, True if string is valid, False otherwise
+        """
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or len(inputs) < serial_threshold or len(inputs) <= chunk_size:
+            return self.check_multiple(inputs, state_machine)
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunks = (inputs[first:first + chunk_size] for first in range(0, len(inputs), chunk_size))
+        results = bytearray()
+        if self.instrumentation is not None:
+            self.instrumentation.count(inputs)
+        with _stage(self.instrumentation, "check"), ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(state_machine.compile(),)) as executor:
+            # map() gives the chunk results back in the order the chunks were sent
+            for result in executor.map(_check_chunk, chunks):
+                results += result
+        return ResultBits.from_bytes(results)
+
+    def check_long(self, inputs: Iterable[str], state_machine: StateMachine, workers: int = None,
+                   chunk_size: int = 1 << 22, max_states: int = 64) -> Iterator[bool]:
+        """Checks strings that can each be too long for one process, e.g. hundreds of MB
+
+        A string longer than chunk_size is split into chunks, and worker
+        processes find the state every state reaches after each chunk, see
+        CompiledDFA.chunk_mapping(). The mappings are then followed in order
+        from the start state. Only a few chunks per worker are sent at a time,
+        so the string is not copied all at once. Shorter strings are checked
+        in this process, and so is every string if the DFA has more than
+        max_states states, since each chunk starts by moving every state and
+        that can cost more than checking the string once here.
+
+        Parameters
+        ----------
+        inputs : Iterable[str]
+            Input strings to test
+        state_machine : StateMachine
+            A state machine object for recognizing valid words
+        workers : int
+            Number of worker processes, defaults to the number of CPUs
+        chunk_size : int
+            Number of letters in a chunk
+        max_states : int
+            Largest number of DFA states for which chunks are sent to workers
+
+        Yields
+        ------
+        bool
+            True if the string is valid, False otherwise
+        """
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        dfa = state_machine.compile()
+        if dfa.n_states > max_states:
+            workers = 1
+        executor = None
+        try:
+            for input in inputs:
+                if len(input) <= chunk_size or workers <= 1:
+                    yield dfa.accepts(input)
+                    continue
+                if executor is None:
+                    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(dfa,))
+                with _stage(self.instrumentation, "check_long"):
+                    valid = dfa.accepts_mappings(self.map_chunks(executor, input, workers, chunk_size))
+                yield valid
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    def map_chunks(self, executor, input: str, workers: int, chunk_size: int) -> Iterator[list[int]]:
+        """Sends the chunks of a long string to the workers, two per worker at a time
+
+        Parameters
+        ----------
+        executor : concurrent.futures.ProcessPoolExecutor
+            The worker processes, started with _init_worker()
+        input : str
+            The long input string
+        workers : int
+            Number of worker processes
+        chunk_size : int
+            Number of letters in a chunk
+
+        Yields
+        ------
+        list[int]
+            The mapping of each chunk, in order
+        """
+
+        pending = list()
+        for first in range(0, len(input), chunk_size):
+            pending.append(executor.submit(_map_chunk, input[first:first + chunk_size]))
+            if len(pending) > 2 * workers:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+    def check_multiple_trie(self, inputs: list[str], state_machine: StateMachine) -> ResultBits:
+        """Checks multiple strings if those are valid, sharing work on common prefixes
+
+        Gives the same output as check_multiple() but moves through each prefix
+        shared by several strings only once, which is faster when many strings
+        start the same way.
+
+        Parameters
+        ----------
+        inputs : list[str]
+            A list of input strings to test
+        state_machine : StateMachine
+            A state machine object for recognizing valid words
+
+        Returns
+        -------
+        ResultBits
+            A bool per string, True if string is valid, False otherwise
+        """
+
+        if self.instrumentation is not None:
+            self.instrumentation.count(inputs)
+        with _stage(self.instrumentation, "check"):
+            return ResultBits.from_bytes(bytes(state_machine.compile().accepts_trie(inputs)))
+
+    def check_multiple_stride(self, inputs: list[str], state_machine: StateMachine, k: int = None) -> ResultBits:
+        """Checks multiple strings if those are valid, several letters per move
+
+        Gives the same output as check_multiple() but moves k letters at a time
+        through a precomputed table, which is faster for long strings over a
+        small alphabet.
+
+        Parameters
+        ----------
+        inputs : list[str]
+            A list of input strings to test
+        state_machine : StateMachine
+            A state machine object for recognizing valid words
+        k : int
+            Number of letters per move, None to pick it from the size of the DFA
+
+        Returns
+        -------
+        ResultBits
+            A bool per string, True if string is valid, False otherwise
+        """
+
+        dfa = state_machine.compile()
+        if self.instrumentation is not None:
+            self.instrumentation.count(inputs)
+        with _stage(self.instrumentation, "check"):
+            k = dfa.stride_table(k)[1]
+            return ResultBits.from_bytes(bytes(dfa.accepts_stride(input, k) for input in inputs))
+
+    def check_stream(self, inputs: Iterable[str], state_machine: StateMachine) -> Iterator[bool]:
+        """Checks strings one at a time as they are read
+
+        Parameters
+        ----------
+        inputs : Iterable[str]
+            Input strings to test, e.g. from FileParser.in_stream()
+        state_machine : StateMachine
+            A state machine object for recognizing valid words
+
+        Yields
+        ------
+        bool
+            True if the string is valid, False otherwise
+        """
+
+        dfa = state_machine.compile()
+        if self.instrumentation is not None:
+            check = self.instrumentation.check
+            return (check(dfa, input) for input in inputs)
+        return map(dfa.accepts, inputs)
+    
+    def scan_file(self, src: str, state_machine: StateMachine) -> Iterator[bool]:
+        """Checks every line of a .in file straight from its bytes
+
+        The file is memory-mapped and scanned by CompiledDFA.scan_bytes(), so
+        no string is made per line. DFAs with non-ASCII input letters, and files
+        with Unicode line separators, are checked through FileParser.in_stream()
+        instead so the lines match in_parser().
+
+        Parameters
+        ----------
+        src : str
+            A file path to the .in file
+        state_machine : StateMachine
+            A state machine object for recognizing valid words
+
+        Yields
+        ------
+        bool
+            True if the string is valid, False otherwise
+        """
+
+        dfa = state_machine.compile()
+        try:
+            dfa.byte_table()
+        except Exception:
+            yield from self.check_stream(FileParser().in_stream(src), dfa)
+            return
+        if self.instrumentation is not None:
+            # the byte scanner has no per-string hooks, trace the strings instead
+            yield from self.check_stream(FileParser(self.instrumentation).in_stream(src), dfa)
+            return
+
+        with open(src, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                # str.splitlines() also breaks on these UTF-8 characters, which the byte table does not
+                if any(data.find(separator) >= 0 for separator in (b"\xc2\x85", b"\xe2\x80\xa8", b"\xe2\x80\xa9")):
+                    scanned = self.check_stream(FileParser().in_stream(src), dfa)
+                else:
+                    scanned = dfa.scan_bytes(data)
+                yield from scanned
+
+    def check_multiple_dfas(self, inputs: Iterable[str], state_machines: list[StateMachine]) -> Iterator[tuple[bool, ...]]:
+        """Checks strings against several DFAs in one pass
+
+        Each string is read once and every DFA moves on it together through a
+        ProductDFA, instead of checking all the strings once per DFA.
+
+        Parameters
+        ----------
+        inputs : Iterable[str]
+            Input strings to test, e.g. from FileParser.in_stream()
+        state_machines : list[StateMachine]
+            State machine objects for recognizing valid words
+
+        Yields
+        ------
+        tuple[bool, ...]
+            For each string, True for each DFA the string is valid in, False otherwise
+        """
+
+        product = ProductDFA([state_machine.compile() for state_machine in state_machines])
+        if self.instrumentation is not None:
+            for input in inputs:
+                self.instrumentation.count([input])
+                yield product.accepts(input)
+        else:
+            yield from map(product.accepts, inputs)
+
+    def save_output_combined(self, output_rows: Iterable[tuple[bool, ...]], filename: str) -> int:
+        """Saves the results of several DFAs as one file with a column per DFA
+
+        Each line has VALID or INVALID for every DFA separated by commas, in
+        the order the DFAs were given.
+
+        Parameters
+        ----------
+        output_rows : Iterable[tuple[bool, ...]]
+            Results from check_multiple_dfas()
+        filename : str
+            The filename to store the outputs
+
+        Returns
+        -------
+        int
+            The number of lines written
+        """
+
+        words = ("INVALID", "VALID")
+        count = 0
+        lines = list()
+        with _stage(self.instrumentation, "save_output"), open(filename, 'w', buffering=1 << 20) as file:
+            for row in output_rows:
+                lines.append(','.join([words[valid] for valid in row]) + '\n')
+                if len(lines) == 1 << 14:
+                    file.write(''.join(lines))
+                    count += len(lines)
+                    lines.clear()
+            file.write(''.join(lines))
+            count += len(lines)
+        return count
+
+    def save_output_per_dfa(self, output_rows: Iterable[tuple[bool, ...]], filenames: list[str]) -> int:
+        """Saves the results of several DFAs as one file per DFA
+
+        Parameters
+        ----------
+        output_rows : Iterable[tuple[bool, ...]]
+            Results from check_multiple_dfas()
+        filenames : list[str]
+            The filename for each DFA, in the order the DFAs were given
+
+        Returns
+        -------
+        int
+            The number of lines written to each file
+        """
+
+        count = 0
+        columns = [list() for _ in filenames]
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(_stage(self.instrumentation, "save_output"))
+            files = [stack.enter_context(open(filename, 'w', buffering=1 << 20)) for filename in filenames]
+            for row in output_rows:
+                for column, valid in zip(columns, row):
+                    column.append("VALID\n" if valid else "INVALID\n")
+                count += 1
+                if len(columns[0]) == 1 << 14:
+                    for file, column in zip(files, columns):
+                        file.write(''.join(column))
+                        column.clear()
+            for file, column in zip(files, columns):
+                file.write(''.join(column))
+        return count
+
+    def save_output(self, output_bools: list[bool], filename: str) -> None:
+        """Saves the output as a properly formatted output file
+        
+        The lines are written in large joined chunks rather than one write per line.
+
+        Parameters
+        ----------
+        output_bools : list[bool]
+            A list of bools or ResultBits from check_multiple() method
+        filename : str
+            The filename to store the outputs
+        """
+
+        with _stage(self.instrumentation, "save_output"), open(filename, 'wb') as file:
+            if isinstance(output_bools, ResultBits):
+                output_bools.write_text(file)
+            else:
+                for start in range(0, len(output_bools), 1 << 16):
+                    file.write(_results_text(bytes(map(bool, output_bools[start:start + (1 << 16)]))))
+
+    def save_output_stream(self, output_bools: Iterable[bool], filename: str, buffer_size: int = 1 << 20) -> int:
+        """Saves the output while it is being produced
+
+        Lines are joined in batches and written through a buffered file, so
+        memory use does not grow with the number of strings. When output_bools
+        is checked lazily, e.g. from check_stream(), pass it through
+        Instrumentation.timed() so the checking time is not part of the
+        "save_output" stage.
+
+        Parameters
+        ----------
+        output_bools : Iterable[bool]
+            Bools from check_stream() or check_multiple()
+        filename : str
+            The filename to store the outputs
+        buffer_size : int
+            Size in bytes of the write buffer
+
+        Returns
+        -------
+        int
+            The number of lines written
+        """
+
+        batch = 1 << 16
+        count = 0
+        values = bytearray()
+        with _stage(self.instrumentation, "save_output"), open(filename, 'wb', buffering=buffer_size) as file:
+            for valid in output_bools:
+                values.append(valid)
+                if len(values) == batch:
+                    file.write(_results_text(values))
+                    count += len(values)
+                    values.clear()
+            file.write(_results_text(values))
+            count += len(values)
+        return count
+
+    def save_output_bits(self, output_bools: Iterable[bool], filename: str) -> int:
+        """Saves the output as a compact binary file
+
+        The file holds one bit per string, see ResultBits.save(), for tools that
+        do not need the VALID and INVALID lines. ResultBits.load() reads it back.
+
+        Parameters
+        ----------
+        output_bools : Iterable[bool]
+            Bools or ResultBits from any of the check methods
+        filename : str
+            The filename to store the outputs
+
+        Returns
+        -------
+        int
+            The number of results written
+        """
+
+        with _stage(self.instrumentation, "save_output"):
+            if not isinstance(output_bools, ResultBits):
+                output_bools = ResultBits(output_bools)
+            output_bools.save(filename)
+        return len(output_bools)
+
+class IncrementalChecker:
+    """
+    A class that keeps the output of a .in file and .dfa file up to date while
+    they are edited.
+
+    Verdicts are cached by line content, so after an edit only new or changed
+    lines are checked. When the .dfa file changes the cache is kept if the new
+    DFA accepts the same strings as the old one. The .out file is rewritten in
+    place from the first line whose verdict changed.
+
+    Attributes
+    ----------
+    input_path : str
+        The watched .in file
+    dfa_path : str
+        The watched .dfa file
+    output_path : str
+        The .out file kept up to date
+    file_parser : FileParser
+        A file parser object used to read .in and .dfa files
+    state_machine : StateMachine
+        The current DFA
+    inputs : list[str]
+        The current input strings
+    outputs : bytearray
+        The current results, 1 for VALID and 0 for INVALID
+    verdicts : dict[str, bool]
+        Cached result of each input string
+    rechecked : int
+        Number of strings checked by the last update
+    error : str
+        Why the last poll() could not load a file, None if it could
+
+    Methods
+    -------
+    seed(state_machine, inputs, outputs)
+        Starts from results that were already computed and saved
+    set_state_machine(state_machine)
+        Changes the DFA, keeping the cache if it accepts the same strings
+    set_inputs(inputs)
+        Changes the input strings, checking only strings not in the cache
+    output_size(outputs)
+        Gets the size in bytes of the lines saved for the given results
+    output_intact()
+        Checks that the .out file still holds the last results written to it
+    patch_output(first)
+        Rewrites the .out file from a given line on
+    poll()
+        Reloads the files that changed since the last poll and updates the output
+    watch(interval, stop_event, callback)
+        Polls the files until stopped
+    """
+
+    def __init__(self, input_path: str, dfa_path: str, output_path: str, file_parser: FileParser = None) -> None:
+        """
+        Parameters
+        ----------
+        input_path : str
+            The .in file to watch
+        dfa_path : str
+            The .dfa file to watch
+        output_path : str
+            The .out file to keep up to date
+        file_parser : FileParser
+            A file parser object used to read .in and .dfa files
+        """
+
+        self.input_path = input_path
+        self.dfa_path = dfa_path
+        self.output_path = output_path
+        self.file_parser = file_parser or FileParser()
+        self.state_machine = None
+        self.inputs = list()
+        self.outputs = bytearray()
+        self.verdicts = dict()
+        self.rechecked = 0
+        self.error = None
+        self.stamps = dict()
+        self.written = None     # the results the .out file holds, None if unknown
+
+    def stamp(self, path: str) -> tuple[int, int]:
+        """Gets the modification time and size of a file, to notice edits"""
+
+        info = os.stat(path)
+        return (info.st_mtime_ns, info.st_size)
+
+    def seed(self, state_machine: StateMachine, inputs: list[str], outputs: bytearray) -> None:
+        """Starts from results that were already computed and saved
+
+        Parameters
+        ----------
+        state_machine : StateMachine
+            The DFA the results were computed with
+        inputs : list[str]
+            The input strings
+        outputs : bytearray
+            The results, saved in the .out file
+        """
+
+        self.state_machine = state_machine
+        self.inputs = inputs
+        self.outputs = bytearray(outputs)
+        self.verdicts = dict(zip(inputs, map(bool, outputs)))
+        self.written = bytearray(outputs)
+        self.stamps = {path: self.stamp(path) for path in (self.input_path, self.dfa_path)}
+
+    def set_state_machine(self, state_machine: StateMachine) -> bool:
+        """Changes the DFA, keeping the cache if it accepts the same strings
+
+        Parameters
+        ----------
+        state_machine : StateMachine
+            The new DFA
+
+        Returns
+        -------
+        bool
+            True if the cached results are still valid, False if they were dropped
+        """
+
+        kept = self.state_machine is not None and self.state_machine.compile().equivalent(state_machine.compile())
+        if not kept:
+            self.verdicts = dict()
+        self.state_machine = state_machine
+        return kept
+
+    def set_inputs(self, inputs: list[str]) -> int:
+        """Changes the input strings, checking only strings not in the cache
+
+        Parameters
+        ----------
+        inputs : list[str]
+            The new input strings
+
+        Returns
+        -------
+        int
+            Index of the first result that changed, len(inputs) if none did
+        """
+
+        accepts = self.state_machine.compile().accepts
+        verdicts = self.verdicts
+        outputs = bytearray(len(inputs))
+        rechecked = 0
+        for index, input in enumerate(inputs):
+            valid = verdicts.get(input)
+            if valid is None:
+                valid = verdicts[input] = accepts(input)
+                rechecked += 1
+            outputs[index] = valid
+        # forget strings that were edited away once they outnumber the current ones
+        if len(verdicts) > 2 * len(inputs) + 1024:
+            self.verdicts = dict(zip(inputs, map(bool, outputs)))
+
+        first = _common_prefix_length(self.outputs, outputs)
+        if len(self.outputs) != len(outputs):
+            first = min(first, len(outputs))
+        self.inputs = inputs
+        self.outputs = outputs
+        self.rechecked = rechecked
+        return first
+
+    def output_size(self, outputs: bytearray) -> int:
+        """Gets the size in bytes of the lines saved for the given results"""
+
+        invalid, valid = len(_results_text(b"\x00")), len(_results_text(b"\x01"))
+        return len(outputs) * invalid - outputs.count(1) * (invalid - valid)
+
+    def output_intact(self) -> bool:
+        """Checks that the .out file still holds the last results written to it
+
+        Only the size is compared, which catches a missing, truncated or
+        replaced file without reading it.
+        """
+
+        if self.written is None:
+            return False
+        try:
+            return os.path.getsize(self.output_path) == self.output_size(self.written)
+        except OSError:
+            return False
+
+    def patch_output(self, first: int) -> None:
+        """Rewrites the .out file from a given line on
+
+        Lines before first are left untouched. If the .out file is missing or
+        does not hold the previous results, it is written in full.
+
+        Parameters
+        ----------
+        first : int
+            Index of the first line to rewrite
+        """
+
+        if not self.output_intact():
+            first = 0
+
+        offset = self.output_size(self.outputs[:first])
+        with open(self.output_path, 'r+b' if first > 0 else 'wb') as file:
+            file.seek(offset)
+            for start in range(first, len(self.outputs), 1 << 16):
+                file.write(_results_text(self.outputs[start:start + (1 << 16)]))
+            file.truncate()
+        self.written = bytearray(self.outputs)
+
+    def poll(self) -> bool:
+        """Reloads the files that changed since the last poll and updates the output
+
+        If a file cannot be loaded, e.g. while it is half edited, the previous
+        content of that file is kept, the reason is stored in self.error and
+        the file is tried again on the next poll. Changes to the other file
+        are still applied, and a missing or damaged .out file is rewritten.
+
+        Returns
+        -------
+        bool
+            True if the DFA, the results or the .out file changed, False otherwise
+        """
+
+        errors = list()
+        dfa_changed = False
+        input_changed = False
+        try:
+            dfa_stamp = self.stamp(self.dfa_path)
+            if self.stamps.get(self.dfa_path) != dfa_stamp:
+                self.set_state_machine(self.file_parser.dfa_parser(self.dfa_path))
+                self.stamps[self.dfa_path] = dfa_stamp
+                dfa_changed = True
+        except Exception as e:
+            errors.append(str(e))
+        inputs = self.inputs
+        try:
+            input_stamp = self.stamp(self.input_path)
+            if self.stamps.get(self.input_path) != input_stamp and self.state_machine is not None:
+                inputs = self.file_parser.in_parser(self.input_path)
+                self.stamps[self.input_path] = input_stamp
+                input_changed = True
+        except Exception as e:
+            errors.append(str(e))
+        self.error = ' '.join(errors) if errors else None
+        # nothing can be checked until a DFA has loaded once
+        if self.state_machine is None:
+            return False
+
+        first = self.set_inputs(inputs) if dfa_changed or input_changed else len(self.outputs)
+        if first == len(self.outputs) and self.written == self.outputs and self.output_intact():
+            return dfa_changed
+        self.patch_output(first)
+        return True
+
+    def watch(self, interval: float = 1.0, stop_event: threading.Event = None, callback=None) -> None:
+        """Polls the files until stopped
+
+        Parameters
+        ----------
+        interval : float
+            Seconds between polls
+        stop_event : threading.Event
+            Stops watching when set, None to watch forever
+        callback : Callable[[IncrementalChecker], None]
+            Called after every poll that changed the output
+        """
+
+        if stop_event is None:
+            stop_event = threading.Event()
+        while not stop_event.is_set():
+            if self.poll() and callback is not None:
+                callback(self)
+            stop_event.wait(interval)
+
+
+def _parse_address(address: str):
+    """Splits HOST:PORT or :PORT into a (host, port) tuple, anything else is a Unix socket path"""
+
+    host, _, port = address.rpartition(':')
+    if port.isdigit() and (host or address.startswith(':')):
+        return (host or "127.0.0.1", int(port))
+    return address
+
+class DFARegistry:
+    """
+    A class that keeps compiled DFAs loaded by name and by hash
+
+    Attributes
+    ----------
+    file_parser : FileParser
+        A file parser object used to read .dfa files
+    names : dict[str, str]
+        Hash of the DFA registered under each name
+    dfas : dict[str, CompiledDFA]
+        Compiled DFA for the SHA-256 hash of each .dfa content, in hex
+    lock : threading.Lock
+        Held while names and dfas change, so DFAs can be parsed in other threads
+
+    Methods
+    -------
+    load(name, text)
+        Registers a DFA from the content of a .dfa file
+    load_file(name, src)
+        Registers a DFA from a .dfa file
+    register(name, digest, dfa)
+        Points a name at a DFA
+    unload(name)
+        Removes the DFA registered under a name
+    get(key)
+        Gets a DFA by name or by hash
+    describe()
+        Lists the registered DFAs
+    """
+
+    def __init__(self, file_parser: FileParser = None) -> None:
+        """
+        Parameters
+        ----------
+        file_parser : FileParser
+            A file parser object used to read .dfa files
+        """
+
+        self.file_parser = file_parser or FileParser()
+        self.names = dict()
+        self.dfas = dict()
+        self.lock = threading.Lock()
+
+    def load(self, name: str, text: str) -> str:
+        """Registers a DFA from the content of a .dfa file
+
+        A DFA with the same content as one already loaded is not parsed again.
+
+        Parameters
+        ----------
+        name : str
+            Name to register the DFA under, replacing any DFA with that name
+        text : str
+            The content of the .dfa file
+
+        Raises
+        ------
+        Exception
+            If there are invalid inputs in the content
+
+        Returns
+        -------
+        str
+            The hash of the DFA
+        """
+
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        dfa = self.dfas.get(digest)
+        if dfa is None:
+            dfa = self.file_parser.dfa_text_parser(text, name).compile()
+        self.register(name, digest, dfa)
+        return digest
+
+    def load_file(self, name: str, src: str) -> str:
+        """Registers a DFA from a .dfa file, using its binary cache
+
+        Parameters
+        ----------
+        name : str
+            Name to register the DFA under, replacing any DFA with that name
+        src : str
+            A file path to the .dfa file
+
+        Raises
+        ------
+        Exception
+            If the file cannot be read or has invalid inputs
+
+        Returns
+        -------
+        str
+            The hash of the DFA
+        """
+
+        file = open(src, 'rb')
+        digest = hashlib.sha256(file.read()).hexdigest()
+        file.close()
+        dfa = self.dfas.get(digest)
+        if dfa is None:
+            dfa = self.file_parser.compiled_dfa_parser(src)
+        self.register(name, digest, dfa)
+        return digest
+
+    def register(self, name: str, digest: str, dfa: CompiledDFA) -> None:
+        """Points a name at a DFA
+
+        The DFA the name pointed to before is dropped once no name refers to
+        it, which is never the case when it is the same DFA.
+
+        Parameters
+        ----------
+        name : str
+            Name to register the DFA under
+        digest : str
+            Hash of the DFA
+        dfa : CompiledDFA
+            The DFA, only kept if no DFA with the hash is loaded yet
+        """
+
+        with self.lock:
+            self.dfas.setdefault(digest, dfa)
+            previous = self.names.get(name)
+            self.names[name] = digest
+            if previous is not None and previous not in self.names.values():
+                del self.dfas[previous]
+
+    def unload(self, name: str) -> bool:
+        """Removes the DFA registered under a name
+
+        The compiled DFA is dropped once no name refers to it.
+
+        Parameters
+        ----------
+        name : str
+            Name of the DFA
+
+        Returns
+        -------
+        bool
+            True if a DFA was registered under the name, False otherwise
+        """
+
+        with self.lock:
+            digest = self.names.pop(name, None)
+            if digest is None:
+                return False
+            if digest not in self.names.values():
+                del self.dfas[digest]
+        return True
+
+    def get(self, key: str) -> CompiledDFA:
+        """Gets a DFA by name or by hash
+
+        Parameters
+        ----------
+        key : str
+            Name or hash of the DFA
+
+        Raises
+        ------
+        Exception
+            If no DFA is registered under the key
+
+        Returns
+        -------
+        CompiledDFA
+            The compiled DFA
+        """
+
+        dfa = self.dfas.get(self.names.get(key, key))
+        if dfa is None:
+            raise Exception(f"Error! No DFA named {key} is loaded.")
+        return dfa
+
+    def describe(self) -> list[dict]:
+        """Lists the registered DFAs
+
+        Returns
+        -------
+        list[dict]
+            The name, hash, number of states and alphabet of each DFA
+        """
+
+        with self.lock:
+            return [{"name": name, "hash": digest, "states": self.dfas[digest].n_states,
+                     "alphabet": list(self.dfas[digest].symbol_index)}
+                    for name, digest in self.names.items()]
+
+
+class DFAServer:
+    """
+    A class that checks strings for many clients over a local socket, keeping
+    the compiled DFAs loaded between requests
+
+    Every request is a JSON line with an "op" field and is answered with a
+    JSON line that has "ok" and, if false, "error":
+        {"op": "load", "name": N, "path": P} or {"op": "load", "name": N, "content": C}
+        {"op": "unload", "name": N}
+        {"op": "list"}
+        {"op": "check", "dfa": N, "count": K, "size": B}
+    A check request is followed by B bytes holding its K strings in UTF-8,
+    each ended by a line break. Its answer is followed by K bytes, 1 for VALID
+    and 0 for INVALID, which are sent in chunks as they are checked. A check
+    request without a valid size is answered with an error and the connection
+    is closed, since the strings after it cannot be told apart from requests.
+    Loading a DFA runs in a thread, so a large DFA does not hold up the other
+    clients.
+
+    Attributes
+    ----------
+    address : str
+        A Unix socket path, or HOST:PORT to listen on TCP
+    registry : DFARegistry
+        The loaded DFAs, shared by every client
+    chunk_size : int
+        Number of strings checked between writes, so other clients are served
+
+    Methods
+    -------
+    handle(reader, writer)
+        Answers the requests of one client until it disconnects
+    check(request, reader, writer)
+        Answers a check request
+    serve()
+        Listens for clients until cancelled
+    run()
+        Listens for clients until interrupted
+    """
+
+    # Unix sockets where the platform has them, checked without importing socket
+    DEFAULT_ADDRESS = "pe01.sock" if os.name == "posix" else "127.0.0.1:8765"
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, registry: DFARegistry = None, chunk_size: int = 8192) -> None:
+        """
+        Parameters
+        ----------
+        address : str
+            A Unix socket path, or HOST:PORT to listen on TCP
+        registry : DFARegistry
+            The loaded DFAs, e.g. with some preloaded, or None to start empty
+        chunk_size : int
+            Number of strings checked between writes
+        """
+
+        self.address = address
+        self.registry = registry or DFARegistry()
+        self.chunk_size = chunk_size
+
+    async def handle(self, reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter") -> None:
+        """Answers the requests of one client until it disconnects
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            Stream of the client's requests
+        writer : asyncio.StreamWriter
+            Stream of the answers
+        """
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    op = request.get("op")
+                    if op == "check":
+                        size = request.get("size")
+                        if type(size) is not int or size < 0:
+                            response = {"ok": False, "error": "Error! A check request needs the size of its strings."}
+                            writer.write(json.dumps(response).encode() + b"\n")
+                            await writer.drain()
+                            break
+                        await self.check(request, reader, writer)
+                        continue
+                    elif op == "load":
+                        # parsing and compiling run in a thread so other clients are still answered
+                        if "content" in request:
+                            digest = await loop.run_in_executor(None, self.registry.load, request["name"], request["content"])
+                        else:
+                            digest = await loop.run_in_executor(None, self.registry.load_file, request["name"], request["path"])
+                        response = {"ok": True, "name": request["name"], "hash": digest}
+                    elif op == "unload":
+                        response = {"ok": self.registry.unload(request["name"])}
+                        if not response["ok"]:
+                            response["error"] = f"Error! No DFA named {request['name']} is loaded."
+                    elif op == "list":
+                        response = {"ok": True, "dfas": self.registry.describe()}
+                    else:
+                        raise Exception(f"Error! {op} is not an operation.")
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except KeyError as e:
+                    response = {"ok": False, "error": f"Error! The request has no {e.args[0]} field."}
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def check(self, request: dict, reader: "asyncio.StreamReader", writer: "asyncio.StreamWriter") -> None:
+        """Answers a check request
+
+        The strings are read before anything is checked, so a request that
+        fails, e.g. for a DFA that is not loaded, leaves the stream in step.
+
+        Parameters
+        ----------
+        request : dict
+            The check request
+        reader : asyncio.StreamReader
+            Stream holding the strings of the request
+        writer : asyncio.StreamWriter
+            Stream of the answer
+
+        Raises
+        ------
+        Exception
+            If the DFA is not loaded or the strings do not match the request
+        """
+
+        import asyncio
+
+        payload = await reader.readexactly(request["size"])
+        dfa = self.registry.get(request["dfa"])
+        count = request["count"]
+        inputs = payload.decode().split('\n')
+        if type(count) is not int or inputs.pop() != '' or len(inputs) != count:
+            raise Exception(f"Error! Expected {count} strings ended by line breaks.")
+
+        writer.write(json.dumps({"ok": True, "count": len(inputs)}).encode() + b"\n")
+        accepts = dfa.accepts
+        for start in range(0, len(inputs), self.chunk_size):
+            writer.write(bytes(map(accepts, inputs[start:start + self.chunk_size])))
+            await writer.drain()
+            # let the other clients in between chunks of a large request
+            await asyncio.sleep(0)
+
+    async def serve(self) -> None:
+        """Listens for clients until cancelled
+        """
+
+        import asyncio
+        import stat
+
+        address = _parse_address(self.address)
+        if isinstance(address, tuple):
+            server = await asyncio.start_server(self.handle, *address)
+        else:
+            # a socket file left by a server that did not stop cleanly
+            if os.path.exists(address) and stat.S_ISSOCK(os.stat(address).st_mode):
+                os.remove(address)
+            server = await asyncio.start_unix_server(self.handle, address)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if not isinstance(address, tuple) and os.path.exists(address):
+                os.remove(address)
+
+    def run(self) -> None:
+        """Listens for clients until interrupted
+        """
+
+        import asyncio
+
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+
+
+# compiled DFA of a worker process in StringChecker.check_multiple_parallel()
+_worker_dfa = None
+
+def _init_worker(dfa: CompiledDFA) -> None:
+    """Keeps the compiled DFA sent to a worker process when it starts"""
+
+    global _worker_dfa
+    _worker_dfa = dfa
+
+def _check_chunk(inputs: list[str]) -> bytes:
+    """Checks a chunk of strings in a worker process, 1 for VALID and 0 for INVALID"""
+
+    return bytes(map(_worker_dfa.accepts, inputs))
+
+def _map_chunk(chunk: str) -> list[int]:
+    """Gets the state mapping of a chunk of a long string in a worker process"""
+
+    return _worker_dfa.chunk_mapping(chunk)
+
+class VirtualScroller:
+    """
+    A class that scrolls a group of virtual views together with one scrollbar
+
+    Attributes
+    ----------
+    scrollbar : ttk.Scrollbar
+        The scrollbar that controls the views
+    views : list
+        The VirtualTextView and VirtualTableView objects that scroll together
+    top : int
+        Index of the first line in view
+
+    Methods
+    -------
+    add(view)
+        Adds a view to the group
+    yview(*args)
+        Handles scrollbar commands
+    scroll_to(top)
+        Shows the lines starting from a given index in every view
+    refresh()
+        Renders the views again, e.g. after their data changed
+    """
+
+    def __init__(self, scrollbar) -> None:
+        """
+        Parameters
+        ----------
+        scrollbar : ttk.Scrollbar
+            The scrollbar that controls the views
+        """
+
+        self.scrollbar = scrollbar
+        self.scrollbar.config(command=self.yview)
+        self.views = list()
+        self.top = 0
+
+    def add(self, view) -> None:
+        """Adds a view to the group
+
+        Parameters
+        ----------
+        view : VirtualTextView or VirtualTableView
+            The view to add
+        """
+
+        self.views.append(view)
+        view.widget.bind("<MouseWheel>", self.on_mouse_wheel)
+        view.widget.bind("<Button-4>", self.on_mouse_wheel)
+        view.widget.bind("<Button-5>", self.on_mouse_wheel)
+        view.widget.bind("<Configure>", lambda event: self.refresh())
+
+    def line_count(self) -> int:
+        """Gets the number of lines of the longest view"""
+
+        return max((view.count for view in self.views), default=0)
+
+    def visible_rows(self) -> int:
+        """Gets the number of lines that fit in every view"""
+
+        return min((view.visible_rows() for view in self.views), default=1)
+
+    def yview(self, *args) -> None:
+        """Handles scrollbar commands
+
+        Parameters
+        ----------
+        args
+            ("moveto", fraction) or ("scroll", amount, "units" or "pages")
+        """
+
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * self.line_count()))
+        elif args[0] == "scroll":
+            step = self.visible_rows() if args[2] == "pages" else 1
+            self.scroll_to(self.top + int(args[1]) * step)
+
+    def on_mouse_wheel(self, event) -> str:
+        """Scrolls the views with the mouse wheel"""
+
+        if event.num == 4 or event.delta > 0:
+            self.yview("scroll", -3, "units")
+        else:
+            self.yview("scroll", 3, "units")
+        return "break"
+
+    def scroll_to(self, top: int) -> None:
+        """Shows the lines starting from a given index in every view
+
+        Parameters
+        ----------
+        top : int
+            Index of the first line to show
+        """
+
+        count = self.line_count()
+        rows = self.visible_rows()
+        self.top = max(0, min(top, count - rows))
+        for view in self.views:
+            view.render(self.top, rows)
+        if count > 0:
+            self.scrollbar.set(self.top / count, min(1.0, (self.top + rows) / count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def refresh(self) -> None:
+        """Renders the views again, e.g. after their data changed"""
+
+        self.scroll_to(self.top)
+
+
+class VirtualTextView:
+    """
+    A class that shows the lines of a large list in a Text widget, rendering only
+    the lines in view
+
+    Attributes
+    ----------
+    widget : tk.Text
+        The Text widget showing the lines
+    count : int
+        Total number of lines
+    get_lines : Callable[[int, int], list[str]]
+        Gets the lines from a start index up to an end index
+
+    Methods
+    -------
+    set_source(count, get_lines)
+        Changes the lines shown by the view
+    visible_rows()
+        Gets the number of lines that fit in the widget
+    render(top, rows)
+        Shows the lines starting from a given index
+    """
 
-    def dfa_parser(self, src: str) -> StateMachine:
-        """Parses a .dfa file
-        
+    def __init__(self, widget) -> None:
+        """
         Parameters
         ----------
-        src : str
-            A file path to the .dfa file
-        
-        Raises
-        ------
-        Exception
-            If there are invalid inputs in the file
-        
-        Returns
-        -------
-        StateMachine
-            A working StateMachine object based on the .dfa file
+        widget : tk.Text
+            The Text widget showing the lines, it should not wrap lines and
+            can have a horizontal scrollbar for long ones
         """
 
-        file = open(src, 'r')
-        content = file.read().splitlines()
-        file.close()
+        self.widget = widget
+        self.count = 0
+        self.get_lines = lambda first, last: []
+        self.line_height = tkfont.Font(font=widget.cget("font")).metrics("linespace")
 
-        file_name = os.path.basename(src)
+    def set_source(self, count: int, get_lines) -> None:
+        """Changes the lines shown by the view
 
-        for i in range(len(content)):
-            content[i] = content[i].split(',')
+        Parameters
+        ----------
+        count : int
+            Total number of lines
+        get_lines : Callable[[int, int], list[str]]
+            Gets the lines from a start index up to an end index
+        """
 
-        alphabet = content.pop(0)
-        
-        # errors: more than 2 symbols, the 2 symbols are the same, the symbols are not single character
-        if (len(alphabet) != 2 or alphabet[0] == alphabet[1]):
-            raise Exception(f"({file_name}) Invalid DFA! DFA must have 2 unique input symbols.")
-        for char in alphabet:
-            if (len(char) != 1):
-                raise Exception(f"({file_name}) Invalid DFA! ({char}) is not a valid input symbol.")
+        self.count = count
+        self.get_lines = get_lines
 
-        states = list()
-        f_states = list()
-        transition = list(list())
+    def visible_rows(self) -> int:
+        """Gets the number of lines that fit in the widget"""
 
-        start_state_found = False   # for checking invalid number of start states
-        current_line = 1    # for checking dfa file line number
+        return max(1, self.widget.winfo_height() // max(1, self.line_height))
 
-        for line in content:
-            current_line += 1
-            # error if line is missing state type or state name
-            if len(line) < 2:
-                raise Exception(f"({file_name}) Invalid DFA! Invalid state in line {current_line}.")
-            if line[0] == '-' or line[0] == '-+' or line[0] == '+-':
-                if start_state_found:
-                    raise Exception(f"({file_name}) Invalid DFA! Duplicate start state in line {current_line}.")
-                start_state_found = True
-                states.insert(0, line[1])
-                transition.insert(0, line[2:4])
-                if line[0] == '-+' or line[0] == '+-':
-                    f_states.append(line[1])
-            else:
-                if line[0] == '+':
-                    f_states.append(line[1])
-                elif line[0] != '':
-                    # determinant of start/final state is not - or +
-                    raise Exception(f"({file_name}) Invalid DFA! Invalid state type symbol ({line[0]}) in line {current_line}.")
-                states.append(line[1])
-                transition.append(line[2:4])
-            
-            # other errors: non capital letter state, invalid transitions
-            if len(line[1]) != 1 or not line[1].isupper():
-                raise Exception(f"({file_name}) Invalid DFA! Invalid state ({line[1]}) found in line {current_line}. Not a capital letter.")
-            if len(line) != 4:
-                raise Exception(f"({file_name}) Invalid DFA! Invalid number of state transitions in line {current_line}.")
-        
-        # some more errors: state with no transitions
-        for line in transition:
-            for state in line:
-                if not state in states:
-                    raise Exception(f"({file_name}) Invalid DFA! Invalid state ({state}) in transitions for state {states[transition.index(line)]}.")
-        
-        if not start_state_found:
-            raise Exception(f"({file_name}) Invalid DFA! No start state found.")
+    def render(self, top: int, rows: int) -> None:
+        """Shows the lines starting from a given index
 
+        Parameters
+        ----------
+        top : int
+            Index of the first line to show
+        rows : int
+            Number of lines to show
+        """
 
-        state_machine = StateMachine(alphabet, states, f_states, transition)
-        return state_machine
+        # keep the sideways scroll position while the lines are replaced
+        left = self.widget.xview()[0]
+        self.widget.config(state=tk.NORMAL)
+        self.widget.delete("1.0", tk.END)
+        self.widget.insert(tk.END, '\n'.join(self.get_lines(top, min(top + rows, self.count))))
+        self.widget.config(state=tk.DISABLED)
+        self.widget.xview_moveto(left)
 
-class StringChecker:
+
+class VirtualTableView:
     """
-    A class that contains the methods for checking for valid strings
-    Main author: Galang
+    A class that shows the rows of a large table in a ttk.Treeview, inserting
+    only the rows in view
+
+    Attributes
+    ----------
+    widget : ttk.Treeview
+        The Treeview showing the rows
+    count : int
+        Total number of rows
+    get_rows : Callable[[int, int], list[list[str]]]
+        Gets the rows from a start index up to an end index
 
     Methods
     -------
-    is_valid(input, state_machine)
-        Checks if a string is valid
-    check_multiple(inputs, state_machine)
-        Checks multiple strings if those are valid
-    save_output(output_bools, filename)
-        Saves the output as a properly formatted strings.out file
+    set_source(count, get_rows)
+        Changes the rows shown by the view
+    visible_rows()
+        Gets the number of rows that fit in the widget
+    render(top, rows)
+        Shows the rows starting from a given index
     """
 
-    def is_valid(self, input: str, state_machine: StateMachine) -> bool:
-        """Checks if a string is valid
-        
+    def __init__(self, widget) -> None:
+        """
         Parameters
         ----------
-        input : str
-            An input string to test
-        state_machine : StateMachine
-            A state machine object for recognizing valid words
-        
-        Returns
-        -------
-        bool
-            True if string is valid, False otherwise
+        widget : ttk.Treeview
+            The Treeview showing the rows
         """
 
-        curr = state_machine.get_start_state()
-        try:
-            for i in range(len(input)):
-                if ((input[i] == state_machine.alphabet[0] or input[i] == state_machine.alphabet[1]) == False):
-                    return False
-                curr = state_machine.move(curr,input[i])
-            return state_machine.is_final(curr)
-        except: # if error in move == crash == INVALID
-            return False
-    
-    def check_multiple(self, inputs: list[str], state_machine: StateMachine) -> list[bool]:
-        """Checks multiple strings if those are valid
-        
+        self.widget = widget
+        self.count = 0
+        self.get_rows = lambda first, last: []
+
+    def set_source(self, count: int, get_rows) -> None:
+        """Changes the rows shown by the view
+
         Parameters
         ----------
-        input : list[str]
-            A list of input strings to test
-        state_machine : StateMachine
-            A state machine object for recognizing valid words
-        
-        Returns
-        -------
-        list[bool]
-            A list of bools per string, True if string is valid, False otherwise
+        count : int
+            Total number of rows
+        get_rows : Callable[[int, int], list[list[str]]]
+            Gets the rows from a start index up to an end index
         """
 
-        boollist=[]
-        for i in range(len(inputs)):
-            if(self.is_valid(inputs[i],state_machine)):
-                boollist.append(True)
-            else:
-                boollist.append(False)
-        return boollist
-    
-    def save_output(self, output_bools: list[bool], filename: str) -> None:
-        """Saves the output as a properly formatted output file
-        
+        self.count = count
+        self.get_rows = get_rows
+
+    def visible_rows(self) -> int:
+        """Gets the number of rows that fit in the widget"""
+
+        row_height = ttk.Style().lookup("Treeview", "rowheight") or 20
+        # one row of the widget is taken by the headings
+        return max(1, self.widget.winfo_height() // int(row_height) - 1)
+
+    def render(self, top: int, rows: int) -> None:
+        """Shows the rows starting from a given index
+
         Parameters
         ----------
-        output_bools : list[bool]
-            A list of bools from check_multiple() method
-        filename : str
-            The filename to store the outputs
+        top : int
+            Index of the first row to show
+        rows : int
+            Number of rows to show
         """
 
-        file1 = open(filename, 'w')
-        for i in range(len(output_bools)):
-            if(output_bools[i] == True):
-                file1.write("VALID\n")
-            else:
-                file1.write("INVALID\n")
-        file1.close()
+        self.widget.delete(*self.widget.get_children())
+        for row in self.get_rows(top, min(top + rows, self.count)):
+            self.widget.insert("", "end", values=row)
+
 
 class App:
     """
@@ -361,29 +4091,85 @@ class App:
         A file parser object used to read .in and .dfa files
     string_checker : StringChecker
         A string checker object used to check the validity of strings given a dfa
+    outputs : bytearray
+        The results of the last processing run, 1 for VALID and 0 for INVALID
+    instrumentation : Instrumentation
+        Records where the time of each run goes, None to record nothing
+    watcher : IncrementalChecker
+        Keeps the output up to date while the files are edited, None when
+        watching is off
+    watch_thread : threading.Thread
+        The thread polling the watched files, None if watching never started
+    watch_stop : threading.Event
+        Set to stop the thread polling the watched files
+    watch_messages : queue.Queue
+        Updates and errors sent by the thread polling the watched files
 
     Methods
     -------
     update_status_bar(message)
         Changes the text in the status bar
+    def show_transition_table()
+        Shows the transition table of the loaded dfa
     def load_file()
         Handles loading of files and displaying the outputs
     def process_file()
         Handles checking inputs to a dfa
+    def cancel_processing()
+        Stops the current processing run
+    def process_worker(inputs, output_name, dfa, watch_thread)
+        Checks the inputs and saves the output in a background thread
+    def queue_output(output_bools)
+        Passes results to the window in batches as they are saved
+    def poll_results()
+        Shows the progress sent by the background thread
+    def toggle_watch()
+        Starts or stops watching the loaded files for changes
+    def stop_watch()
+        Stops watching the loaded files for changes
+    def watch_worker(watcher, stop_event, previous)
+        Polls the watched files in a background thread
+    def poll_watch(watcher)
+        Shows the updates sent by the watching thread
+    def get_output_lines(first, last)
+        Gets output lines for the output area
     """
 
-    def __init__(self) -> None:
+    def __init__(self, instrumentation: Instrumentation = None) -> None:
         """Constructor of the App class 
+
+        Parameters
+        ----------
+        instrumentation : Instrumentation
+            Records where the time of each run goes and shows a summary in the
+            status bar, None to record nothing
         """
 
+        _load_tkinter()
+
         # initialize instances of needed objects
         self.dfa = None
         self.inputs = None
-        self.file_parser = FileParser()
-        self.string_checker = StringChecker()
+        self.outputs = bytearray()
+        self.instrumentation = instrumentation
+        self.file_parser = FileParser(instrumentation)
+        self.string_checker = StringChecker(instrumentation)
+
+        # state of a processing run in the background thread
+        self.results = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.worker = None
+        self.processed = 0
+        self.process_start = 0.0
+        self.output_name = None
+        self.watcher = None
+        self.watch_thread = None
+        self.watch_stop = threading.Event()
+        self.watch_messages = queue.Queue()
 
         # Create the main window
         root = tk.Tk()
+        self.root = root
         root.title("Strings and DFA")
         root.geometry("1000x515")
 
@@ -399,12 +4185,21 @@ class App:
         button_frame.pack(padx=20, pady=20)
 
         # A "Load File" button that loads only an .in or a .dfa file through a file manager window
-        load_button = ttk.Button(button_frame, text="Load File", command=self.load_file, style="theme.TButton")
-        load_button.grid(row=0, column=0, padx=5)
+        self.load_button = ttk.Button(button_frame, text="Load File", command=self.load_file, style="theme.TButton")
+        self.load_button.grid(row=0, column=0, padx=5)
 
         # A "Process" button that processess the inputs to the DFA file
-        process_button = ttk.Button(button_frame, text="Process", command=self.process_file, style="theme.TButton") #missing command for process
-        process_button.grid(row=0, column=1, padx=5)
+        self.process_button = ttk.Button(button_frame, text="Process", command=self.process_file, style="theme.TButton")
+        self.process_button.grid(row=0, column=1, padx=5)
+
+        # A "Cancel" button that stops processing, only enabled while processing
+        self.cancel_button = ttk.Button(button_frame, text="Cancel", command=self.cancel_processing, style="theme.TButton", state=tk.DISABLED)
+        self.cancel_button.grid(row=0, column=2, padx=5)
+
+        # A "Watch files" toggle that reprocesses the files whenever they are saved
+        self.watch_enabled = tk.BooleanVar(value=False)
+        self.watch_button = ttk.Checkbutton(button_frame, text="Watch files", variable=self.watch_enabled, command=self.toggle_watch)
+        self.watch_button.grid(row=0, column=3, padx=5)
 
         # Frame for the status bar
         status_frame = tk.Frame(root, bd=1, relief=tk.SUNKEN, padx=5, pady=2)
@@ -426,9 +4221,14 @@ class App:
         table_label = tk.Label(table_frame, text="Transition Table", font=("TkDefaultFont", 10, "bold"))
         table_label.pack()
 
-        # Create the transition table using ttk.Treeview
+        # Create the transition table using ttk.Treeview, only the rows in view are inserted
+        table_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL)
+        table_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.transition_table = ttk.Treeview(table_frame, columns=default_headers, show="headings", selectmode="browse")
         self.transition_table.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.table_view = VirtualTableView(self.transition_table)
+        self.table_scroller = VirtualScroller(table_scrollbar)
+        self.table_scroller.add(self.table_view)
 
         # Insert the default column headers
         for header in default_headers:
@@ -443,17 +4243,31 @@ class App:
         input_label = tk.Label(text_area_frame, text="Input", font=("TkDefaultFont", 10, "bold"))
         input_label.pack()
 
-        # Create the "Input" text area
-        self.input_text = tk.Text(text_area_frame, wrap=tk.WORD, height=10, width=40, state=tk.DISABLED)
+        # Scrollbar shared by the "Input" and "Output" text areas so their lines stay side by side
+        text_scrollbar = ttk.Scrollbar(text_area_frame, orient=tk.VERTICAL)
+        text_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text_scroller = VirtualScroller(text_scrollbar)
+
+        # Create the "Input" text area, only the lines in view are rendered
+        self.input_text = tk.Text(text_area_frame, wrap=tk.NONE, height=10, width=40, state=tk.DISABLED)
         self.input_text.pack(fill=tk.BOTH, expand=True)
+        # lines are not wrapped, so long ones are scrolled sideways, output lines are always short
+        input_xscrollbar = ttk.Scrollbar(text_area_frame, orient=tk.HORIZONTAL, command=self.input_text.xview)
+        input_xscrollbar.pack(fill=tk.X)
+        self.input_text.config(xscrollcommand=input_xscrollbar.set)
+        self.input_view = VirtualTextView(self.input_text)
+        self.text_scroller.add(self.input_view)
 
         # Label for the "Output" text area
         output_label = tk.Label(text_area_frame, text="Output", font=("TkDefaultFont", 10, "bold"))
         output_label.pack()
 
-        # Create the "Output" text area
-        self.output_text = tk.Text(text_area_frame, wrap=tk.WORD, height=10, width=40, state=tk.DISABLED)
+        # Create the "Output" text area, only the lines in view are rendered
+        self.output_text = tk.Text(text_area_frame, wrap=tk.NONE, height=10, width=40, state=tk.DISABLED)
         self.output_text.pack(fill=tk.BOTH, expand=True) 
+        self.output_view = VirtualTextView(self.output_text)
+        self.output_view.set_source(0, self.get_output_lines)
+        self.text_scroller.add(self.output_view)
 
         # Configure the grid weights to make widgets expand with window resizing
         root.grid_rowconfigure(0, weight=1)
@@ -477,6 +4291,27 @@ class App:
 
         self.status_message_label.config(text=message)
             
+    def show_transition_table(self) -> None:
+        """Shows the transition table of the loaded dfa
+        """
+
+        # Read the first line to get column headers, one per input symbol
+        column_headers = ["", "State"] + self.dfa.alphabet
+        self.transition_table["columns"] = [str(i + 1) for i in range(len(column_headers))]
+
+        # Set column headers in the Treeview
+        for i, header in enumerate(column_headers):
+            self.transition_table.heading(f"#{i+1}", text=header)
+            self.transition_table.column(f"#{i+1}", width=50, minwidth=50)
+
+        # Show the table, rows are inserted as they are scrolled into view
+        table_rows = self.dfa.format_for_display()
+        self.table_view.set_source(len(table_rows), lambda first, last: table_rows[first:last])
+        self.table_scroller.refresh()
+
+        # Set the width of the Treeview widget itself
+        self.transition_table.update_idletasks()  # Ensure column widths are applied
+
     # Function to load an .in or a .dfa file
     def load_file(self) -> None:
         """Handles loading of files and displaying the outputs
@@ -488,6 +4323,8 @@ class App:
         global input_path
         file_path = filedialog.askopenfilename(filetypes=[("*.in; *.dfa", "*.in *.dfa"),("Input Files (*.in)", "*.in"), ("DFA Files (*.dfa)", "*.dfa")])
         if file_path:
+            # the watched files are no longer the loaded ones
+            self.stop_watch()
             file_extension = file_path.split('.')[-1]
             file_name = os.path.basename(file_path)
             if file_extension == "in":
@@ -496,10 +4333,11 @@ class App:
                 input_path = file_path
                 input_name = os.path.basename(input_path)
                 
-                self.input_text.config(state=tk.NORMAL) 
-                self.input_text.delete("1.0", tk.END)
-                self.input_text.insert(tk.END, '\n'.join(self.inputs))
-                self.input_text.config(state=tk.DISABLED)
+                # results of an earlier input no longer line up with the new one
+                self.outputs = bytearray()
+                self.output_view.set_source(0, self.get_output_lines)
+                self.input_view.set_source(len(self.inputs), lambda first, last: self.inputs[first:last])
+                self.text_scroller.scroll_to(0)
 
                 self.update_status_bar(f"Input from file {file_name} has been successfully loaded.")
             elif file_extension == "dfa":
@@ -511,25 +4349,8 @@ class App:
                         last_successful_dfa_name = os.path.basename(last_successful_dfa)
                         
                         self.dfa = new_dfa  
-
-                        # Clear existing data and column headers
-                        self.transition_table.delete(*self.transition_table.get_children())
-
-                        # Read the first line to get column headers
-                        column_headers = ["", "State", self.dfa.alphabet[0], self.dfa.alphabet[1]]
-                        # self.transition_table["columns"] = column_headers
-
-                        # Set column headers in the Treeview
-                        for i, header in enumerate(column_headers):
-                            self.transition_table.heading(f"#{i+1}", text=header)
-                            self.transition_table.column(f"#{i+1}", width=50, minwidth=50)
-
-                        # Read the rest of the file to populate the table
-                        for line in self.dfa.format_for_display():
-                            self.transition_table.insert("", "end", values=line)
-
-                        # Set the width of the Treeview widget itself
-                        self.transition_table.update_idletasks()  # Ensure column widths are applied
+                        self.show_transition_table()
+                        self.table_scroller.scroll_to(0)
                         
                         self.update_status_bar(f"DFA table from {file_name} has been successfully loaded.")
                     except Exception as e:
@@ -544,33 +4365,495 @@ class App:
 
     def process_file(self) -> None:
         """Handles checking inputs to a dfa
+
+        The check runs in a background thread so the window stays responsive,
+        and poll_results() shows its progress.
         """
 
         if self.dfa is None or self.inputs is None:
             self.update_status_bar("Please load both a DFA file and an input file first.")
             return
+        if self.worker is not None:
+            return
+        # a full run replaces the output the watcher keeps up to date
+        self.stop_watch()
+
+        self.outputs = bytearray()
+        self.output_view.set_source(0, self.get_output_lines)
+        self.text_scroller.refresh()
 
-        string_checker = StringChecker()
-        output_bools = string_checker.check_multiple(self.inputs, self.dfa)
-    
-        self.output_text.config(state=tk.NORMAL)
-        self.output_text.delete("1.0", tk.END)
-        
-        for index, valid in enumerate(output_bools): # index is needed here for enumerate(output_bools)
-            if valid:
-                self.output_text.insert(tk.END, f"VALID\n")
-            else:
-                self.output_text.insert(tk.END, f"INVALID\n")
-        
         # change input.in to input.out for output filename
         output_name = input_name.split('.')
         output_name[len(output_name) - 1] = 'out'
         output_name = '.'.join(output_name)
+        self.output_name = output_name
 
-        string_checker.save_output(output_bools, output_name)
-        self.output_text.config(state=tk.DISABLED)
+        self.load_button.config(state=tk.DISABLED)
+        self.process_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.update_status_bar(f"Processing input from {input_name}...")
 
-        self.update_status_bar(f"Input from {input_name} successfully processed using DFA table from {last_successful_dfa_name}. Output saved to {output_name}.")
-            
-# Create an app object
-App()
\ No newline at end of file
+        self.results = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.processed = 0
+        self.process_start = time.perf_counter()
+        self.worker = threading.Thread(target=self.process_worker, args=(self.inputs, output_name, self.dfa.compile(), self.watch_thread),
+                                       daemon=True)
+        self.worker.start()
+        self.root.after(50, self.poll_results)
+
+    def cancel_processing(self) -> None:
+        """Stops the current processing run
+        """
+
+        self.cancel_event.set()
+        self.cancel_button.config(state=tk.DISABLED)
+
+    def process_worker(self, inputs: list[str], output_name: str, dfa: CompiledDFA, watch_thread: threading.Thread = None) -> None:
+        """Checks the inputs and saves the output in a background thread
+
+        Nothing here touches the window, everything is sent through self.results.
+        The output is written to a temporary file that replaces output_name only
+        if the run finishes.
+
+        Parameters
+        ----------
+        inputs : list[str]
+            The loaded strings shown in the input pane, which the output lines up with
+        output_name : str
+            The filename to store the outputs
+        dfa : CompiledDFA
+            The compiled DFA to check the strings with
+        watch_thread : threading.Thread
+            A stopped watching thread, waited for so it is not still writing the output
+        """
+
+        if watch_thread is not None:
+            watch_thread.join()
+        partial = output_name + ".part"
+        try:
+            # check the loaded strings rather than reading the file again, which may have changed since
+            output_bools = self.string_checker.check_stream(inputs, dfa)
+            output_bools = _timed(self.instrumentation, "check", output_bools)
+            count = self.string_checker.save_output_stream(self.queue_output(output_bools), partial)
+            if self.cancel_event.is_set():
+                os.remove(partial)
+                self.results.put(("cancelled", count))
+            else:
+                os.replace(partial, output_name)
+                self.results.put(("done", output_name))
+        except Exception as e:
+            if os.path.exists(partial):
+                os.remove(partial)
+            self.results.put(("error", str(e)))
+
+    def queue_output(self, output_bools: Iterable[bool]) -> Iterator[bool]:
+        """Passes results to the window in batches as they are saved
+
+        Stops early when the run is cancelled.
+
+        Parameters
+        ----------
+        output_bools : Iterable[bool]
+            Results to display
+
+        Yields
+        ------
+        bool
+            The same results, unchanged
+        """
+
+        batch = bytearray()
+        for valid in output_bools:
+            batch.append(valid)
+            yield valid
+            if len(batch) == 4096:
+                self.results.put(("output", bytes(batch)))
+                batch.clear()
+                if self.cancel_event.is_set():
+                    return
+        self.results.put(("output", bytes(batch)))
+
+    def poll_results(self) -> None:
+        """Shows the progress sent by the background thread
+
+        Runs on the Tk main thread through after() until the run ends.
+        """
+
+        finished = None
+        received = len(self.outputs)
+        try:
+            while finished is None:
+                message = self.results.get_nowait()
+                if message[0] == "output":
+                    self.outputs += message[1]
+                else:
+                    finished = message
+        except queue.Empty:
+            pass
+        self.processed = len(self.outputs)
+
+        if self.processed != received:
+            self.output_view.set_source(len(self.outputs), self.get_output_lines)
+            self.text_scroller.refresh()
+
+        elapsed = time.perf_counter() - self.process_start
+        rate = self.processed / elapsed if elapsed > 0 else 0.0
+        if finished is None:
+            self.update_status_bar(f"Processing input from {input_name}: {self.processed}/{len(self.inputs)} strings "
+                                   f"({rate:,.0f} strings/s)")
+            self.root.after(50, self.poll_results)
+            return
+
+        self.worker = None
+        self.load_button.config(state=tk.NORMAL)
+        self.process_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+        if finished[0] == "done":
+            message = (f"Input from {input_name} successfully processed using DFA table from {last_successful_dfa_name}. "
+                       f"Output saved to {finished[1]}. ({self.processed} strings in {elapsed:.2f}s, {rate:,.0f} strings/s)")
+            if self.instrumentation is not None:
+                message += f" [{self.instrumentation.summary()}]"
+            self.update_status_bar(message)
+        elif finished[0] == "cancelled":
+            self.update_status_bar(f"Processing of {input_name} cancelled after {self.processed} strings. No output was saved.")
+        else:
+            self.update_status_bar(f"Unable to process {input_name}: {finished[1]}")
+
+    def toggle_watch(self) -> None:
+        """Starts or stops watching the loaded files for changes
+
+        Watching starts from the results of the last processing run, so the
+        files must have been processed first.
+        """
+
+        if not self.watch_enabled.get():
+            self.stop_watch()
+            self.update_status_bar("Stopped watching for changes.")
+            return
+        if self.output_name is None or self.worker is not None or len(self.outputs) != len(self.inputs):
+            self.watch_enabled.set(False)
+            self.update_status_bar("Please process the input file before watching it for changes.")
+            return
+
+        watcher = IncrementalChecker(input_path, last_successful_dfa, self.output_name, self.file_parser)
+        watcher.seed(self.dfa, self.inputs, self.outputs)
+        self.watcher = watcher
+        self.watch_stop = threading.Event()
+        self.watch_thread = threading.Thread(target=self.watch_worker, args=(watcher, self.watch_stop, self.watch_thread),
+                                             daemon=True)
+        self.watch_thread.start()
+        self.update_status_bar(f"Watching {input_name} and {last_successful_dfa_name} for changes.")
+        self.root.after(250, self.poll_watch, watcher)
+
+    def stop_watch(self) -> None:
+        """Stops watching the loaded files for changes
+
+        The watching thread ends after its current poll, self.watch_thread is
+        kept so the next thread writing the output can wait for it.
+        """
+
+        self.watch_stop.set()
+        self.watcher = None
+        self.watch_enabled.set(False)
+
+    def watch_worker(self, watcher: IncrementalChecker, stop_event: threading.Event, previous: threading.Thread) -> None:
+        """Polls the watched files in a background thread
+
+        Reading, checking and saving happen here so the window stays
+        responsive. Nothing here touches the window, every update and new
+        error is sent through self.watch_messages along with the watcher.
+
+        Parameters
+        ----------
+        watcher : IncrementalChecker
+            The watcher to poll
+        stop_event : threading.Event
+            Stops polling when set
+        previous : threading.Thread
+            The thread of an earlier watcher, waited for so it is not still writing the output
+        """
+
+        if previous is not None:
+            previous.join()
+        reported = None
+        while not stop_event.is_set():
+            try:
+                if watcher.poll():
+                    self.watch_messages.put((watcher, "update", watcher.state_machine, watcher.inputs,
+                                             bytes(watcher.outputs), watcher.rechecked))
+                error = watcher.error
+            except Exception as e:
+                error = str(e)
+            # report a failed load once, not on every poll
+            if error is not None and error != reported:
+                self.watch_messages.put((watcher, "error", error))
+            reported = error
+            stop_event.wait(1.0)
+
+    def poll_watch(self, watcher: IncrementalChecker) -> None:
+        """Shows the updates sent by the watching thread
+
+        Runs on the Tk main thread through after() until the watcher is stopped.
+
+        Parameters
+        ----------
+        watcher : IncrementalChecker
+            The watcher whose updates are shown, messages of earlier ones are dropped
+        """
+
+        if self.watcher is not watcher:
+            return
+        update = None
+        error = None
+        try:
+            while True:
+                message = self.watch_messages.get_nowait()
+                if message[0] is not watcher:
+                    continue
+                if message[1] == "update":
+                    update = message
+                    error = None
+                else:
+                    error = message[2]
+        except queue.Empty:
+            pass
+
+        if update is not None:
+            _, _, state_machine, inputs, outputs, rechecked = update
+            dfa_changed = state_machine is not self.dfa
+            self.inputs = inputs
+            self.outputs = bytearray(outputs)
+            self.dfa = state_machine
+            self.input_view.set_source(len(self.inputs), lambda first, last: self.inputs[first:last])
+            self.output_view.set_source(len(self.outputs), self.get_output_lines)
+            self.text_scroller.refresh()
+            if dfa_changed:
+                self.show_transition_table()
+            self.update_status_bar(f"Output {watcher.output_path} updated, {rechecked} of "
+                                   f"{len(self.inputs)} strings rechecked.")
+        if error is not None:
+            self.update_status_bar(f"Watching for changes, using the last file that loaded: {error}")
+        self.root.after(250, self.poll_watch, watcher)
+
+
+    def get_output_lines(self, first: int, last: int) -> list[str]:
+        """Gets output lines for the output area
+
+        Parameters
+        ----------
+        first : int
+            Index of the first line
+        last : int
+            Index after the last line
+
+        Returns
+        -------
+        list[str]
+            VALID or INVALID for each result in the range
+        """
+
+        return ["VALID" if valid else "INVALID" for valid in self.outputs[first:last]]
+
+def watch_files(dfa_path: str, input_paths: list[str], output_paths: list[str], interval: float,
+                file_parser: FileParser = None) -> int:
+    """Keeps the outputs of .in files up to date until interrupted
+
+    Parameters
+    ----------
+    dfa_path : str
+        The .dfa file to watch
+    input_paths : list[str]
+        The .in files to watch
+    output_paths : list[str]
+        The output file for each .in file
+    interval : float
+        Seconds between polls
+    file_parser : FileParser
+        A file parser object used to read .in and .dfa files
+
+    Returns
+    -------
+    int
+        Exit status, 0 when stopped with Ctrl+C
+    """
+
+    file_parser = file_parser or FileParser()
+    watchers = [IncrementalChecker(input_path, dfa_path, output_path, file_parser)
+                for input_path, output_path in zip(input_paths, output_paths)]
+    errors = dict()
+    print(f"Watching {dfa_path} and {len(watchers)} input file(s), press Ctrl+C to stop.")
+    try:
+        while True:
+            for watcher in watchers:
+                if watcher.poll():
+                    print(f"{watcher.input_path}: {watcher.rechecked} of {len(watcher.inputs)} strings rechecked, "
+                          f"output saved to {watcher.output_path}")
+                # report a failed load once, not on every poll
+                if watcher.error is not None and errors.get(watcher.input_path) != watcher.error:
+                    print(f"error: {watcher.error}", file=sys.stderr)
+                errors[watcher.input_path] = watcher.error
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+def main(argv: list[str] = None) -> int:
+    """Runs the program, headless when files are given on the command line
+
+    With no arguments the App window is opened. Otherwise each input file is
+    checked against the DFA file and the results are saved without a display,
+    e.g. python -m Galang_Masayon_Poledo_PE01 --dfa X.dfa --in Y.in --out Z.out
+    With --serve the program stays running as a DFAServer for clients such as
+    Galang_Masayon_Poledo_PE01_Client.DFAClient.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Command line arguments, defaults to sys.argv[1:]
+
+    Returns
+    -------
+    int
+        Exit status, 0 if every file was processed
+    """
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv:
+        App()
+        return 0
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Checks strings from .in files against a DFA.")
+    parser.add_argument("--dfa", dest="dfas", nargs="+", metavar="DFA",
+                        help="the .dfa file, or several to check each input against all of them in one pass")
+    parser.add_argument("--in", dest="inputs", nargs="+", metavar="IN", help="one or more .in files")
+    parser.add_argument("--out", dest="outputs", nargs="+", metavar="OUT",
+                        help="output file for each .in file, defaults to the .in file name with .out")
+    parser.add_argument("--workers", type=int, default=1, help="number of processes used for checking")
+    parser.add_argument("--long", action="store_true",
+                        help="the strings are very long, split each one across the --workers processes "
+                             "instead of giving each process whole strings")
+    parser.add_argument("--report", help="record the time of each stage and save it to this JSON file")
+    parser.add_argument("--combined", action="store_true",
+                        help="with several DFAs, save one output per input with a column per DFA "
+                             "instead of IN.DFA.out files")
+    parser.add_argument("--binary", action="store_true",
+                        help="save the outputs as packed bits, see ResultBits.save(), instead of VALID/INVALID lines")
+    parser.add_argument("--gui", action="store_true", help="open the window, e.g. with --report")
+    parser.add_argument("--watch", type=float, nargs="?", const=1.0, metavar="SECONDS",
+                        help="keep the outputs up to date while the files are edited, polling every "
+                             "SECONDS (default 1), until interrupted")
+    parser.add_argument("--serve", nargs="?", const=DFAServer.DEFAULT_ADDRESS, metavar="ADDRESS",
+                        help="check strings for clients on a Unix socket path or HOST:PORT "
+                             f"(default {DFAServer.DEFAULT_ADDRESS}) until interrupted, "
+                             "preloading any --dfa files by file name")
+    args = parser.parse_args(argv)
+
+    instrumentation = Instrumentation() if args.report else None
+    if args.gui:
+        App(instrumentation)
+        if instrumentation is not None:
+            with open(args.report, 'w') as file:
+                file.write(instrumentation.to_json())
+        return 0
+
+    if args.serve is not None:
+        registry = DFARegistry(FileParser(instrumentation))
+        try:
+            for path in args.dfas or []:
+                registry.load_file(os.path.splitext(os.path.basename(path))[0], path)
+        except Exception as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+        print(f"Serving on {args.serve}, press Ctrl+C to stop.")
+        DFAServer(args.serve, registry).run()
+        return 0
+
+    if args.dfas is None or args.inputs is None:
+        parser.error("--dfa and --in are required without --gui or --serve")
+    if args.outputs is not None and len(args.outputs) != len(args.inputs):
+        parser.error("--out must give one output file for each --in file")
+    if args.outputs is not None and len(args.dfas) > 1 and not args.combined:
+        parser.error("--out with several DFAs needs --combined")
+    if args.watch is not None and len(args.dfas) > 1:
+        parser.error("--watch takes a single DFA")
+    if args.binary and (len(args.dfas) > 1 or args.watch is not None):
+        parser.error("--binary takes a single DFA and cannot be used with --watch")
+    outputs = args.outputs or [os.path.splitext(path)[0] + ".out" for path in args.inputs]
+    if len(args.dfas) > 1 and not args.combined:
+        # an IN.DFA.out file for each DFA
+        outputs = [[f"{os.path.splitext(path)[0]}.{os.path.splitext(os.path.basename(dfa))[0]}.out" for dfa in args.dfas]
+                   for path in args.inputs]
+        planned = [path for paths in outputs for path in paths]
+        hint = ", DFA files with the same name need --combined"
+    else:
+        planned = outputs
+        hint = ""
+    seen = set()
+    for path in planned:
+        if os.path.abspath(path) in seen:
+            parser.error(f"{path} would be written more than once{hint}")
+        seen.add(os.path.abspath(path))
+
+    if args.watch is not None:
+        return watch_files(args.dfas[0], args.inputs, outputs, args.watch, FileParser(instrumentation))
+
+    file_parser = FileParser(instrumentation)
+    string_checker = StringChecker(instrumentation)
+    try:
+        dfas = [file_parser.compiled_dfa_parser(path) for path in args.dfas]
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    status = 0
+    for input_path, output_path in zip(args.inputs, outputs):
+        # outputs are written to .part files and renamed once the input is done, like App.process_worker(),
+        # so an input that fails never leaves a partly written or emptied output behind
+        written = output_path if isinstance(output_path, list) else [output_path]
+        partials = [path + ".part" for path in written]
+        partial = partials if isinstance(output_path, list) else partials[0]
+        try:
+            if len(dfas) > 1:
+                output_rows = string_checker.check_multiple_dfas(file_parser.in_stream(input_path), dfas)
+                # checking runs while the outputs are written, time it as its own stage
+                output_rows = _timed(instrumentation, "check", output_rows)
+                if args.combined:
+                    count = string_checker.save_output_combined(output_rows, partial)
+                else:
+                    count = string_checker.save_output_per_dfa(output_rows, partial)
+            else:
+                if args.long:
+                    output_bools = string_checker.check_long(file_parser.in_stream(input_path), dfas[0], args.workers)
+                elif args.workers > 1:
+                    output_bools = string_checker.check_multiple_parallel(file_parser.in_parser(input_path), dfas[0], args.workers)
+                else:
+                    output_bools = string_checker.scan_file(input_path, dfas[0])
+                if not isinstance(output_bools, ResultBits):
+                    output_bools = _timed(instrumentation, "check", output_bools)
+                if args.binary:
+                    count = string_checker.save_output_bits(output_bools, partial)
+                else:
+                    count = string_checker.save_output_stream(output_bools, partial)
+            for part, path in zip(partials, written):
+                os.replace(part, path)
+        except Exception as e:
+            print(f"({input_path}) error: {e}", file=sys.stderr)
+            status = 1
+            for part in partials:
+                with contextlib.suppress(OSError):
+                    os.remove(part)
+            continue
+        print(f"{input_path}: {count} strings checked, output saved to {', '.join(written)}")
+
+    if instrumentation is not None:
+        with open(args.report, 'w') as file:
+            file.write(instrumentation.to_json())
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,487 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Benchmarks for the DFA program. Generates random    #
+#   DFAs and inputs, times each stage and compares the  #
+#   results with a stored baseline.                     #
+#########################################################
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+from Galang_Masayon_Poledo_PE01 import FileParser, StringChecker
+
+class DFAGenerator:
+    """
+    A class that generates .dfa files for benchmarking
+
+    Attributes
+    ----------
+    rng : random.Random
+        Random number generator, seeded so runs are repeatable
+
+    Methods
+    -------
+    generate(kind, n_states, alphabet)
+        Generates the content of a .dfa file
+    minimal_states(content)
+        Gets the number of states left once the DFA is minimised
+    """
+
+    KINDS = ("random", "sink", "cycles")
+
+    def __init__(self, seed: int = 0) -> None:
+        """
+        Parameters
+        ----------
+        seed : int
+            Seed for the random number generator
+        """
+
+        self.rng = random.Random(seed)
+
+    def generate(self, kind: str, n_states: int, alphabet: list[str] = None) -> str:
+        """Generates the content of a .dfa file
+
+        Every DFA is already minimal, so the cases measure the table size they
+        are named after. The compiled DFA has n_states states, or one less for
+        "sink" since its trap becomes the compiled DFA's rejecting -1 entries.
+
+        Parameters
+        ----------
+        kind : str
+            "random" for random transitions, "sink" for a DFA where most strings
+            fall into a non-final trap state, "cycles" for states that mostly move
+            around a cycle so strings keep running through the whole table
+        n_states : int
+            Number of states, at most 26
+        alphabet : list[str]
+            The 2 input symbols, defaults to 0 and 1
+
+        Raises
+        ------
+        Exception
+            If kind or n_states is invalid, or no minimal random DFA was found
+
+        Returns
+        -------
+        str
+            The content of the .dfa file
+        """
+
+        if alphabet is None:
+            alphabet = ["0", "1"]
+        if kind not in self.KINDS:
+            raise Exception(f"Error! {kind} is not a DFA kind.")
+        if not 1 <= n_states <= 26:
+            raise Exception(f"Error! A DFA must have 1 to 26 states, not {n_states}.")
+
+        states = [chr(ord('A') + i) for i in range(n_states)]
+        # random DFAs are drawn again until none of their states can be merged
+        for _ in range(100):
+            lines = [','.join(alphabet)]
+            for i, state in enumerate(states):
+                if kind == "random":
+                    # the first symbol walks a cycle so every state is reachable
+                    transitions = [states[(i + 1) % n_states], self.rng.choice(states)]
+                    final = self.rng.random() < 0.5
+                elif kind == "sink":
+                    # the last state is the trap, every other state falls into it on the second
+                    # symbol and otherwise walks a cycle with one final state
+                    if i == n_states - 1:
+                        transitions = [state, state]
+                    else:
+                        transitions = [states[(i + 1) % (n_states - 1)], states[-1]]
+                    final = i == n_states - 2
+                else:
+                    # one final state, so the distance to it tells every state apart
+                    transitions = [states[(i + 1) % n_states], states[(i - 1) % n_states]]
+                    final = i == n_states - 1
+                state_type = ('-' if i == 0 else '') + ('+' if final else '')
+                lines.append(','.join([state_type, state] + transitions))
+            content = '\n'.join(lines) + '\n'
+            if kind != "random" or self.minimal_states(content) == n_states:
+                return content
+        raise Exception(f"Error! No minimal random DFA with {n_states} states was found.")
+
+    def minimal_states(self, content: str) -> int:
+        """Gets the number of states left once the DFA is minimised
+
+        Parameters
+        ----------
+        content : str
+            The content of a .dfa file
+
+        Returns
+        -------
+        int
+            Number of states of the compiled DFA
+        """
+
+        return FileParser().dfa_text_parser(content, "generated.dfa").compile().n_states
+
+
+class CorpusGenerator:
+    """
+    A class that generates .in file contents for benchmarking
+
+    Attributes
+    ----------
+    rng : random.Random
+        Random number generator, seeded so runs are repeatable
+
+    Methods
+    -------
+    generate(count, length, prefix_sharing, alphabet)
+        Generates a list of input strings
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        """
+        Parameters
+        ----------
+        seed : int
+            Seed for the random number generator
+        """
+
+        self.rng = random.Random(seed)
+
+    def generate(self, count: int, length: int, prefix_sharing: float = 0.0,
+                 alphabet: list[str] = None) -> list[str]:
+        """Generates a list of input strings
+
+        Parameters
+        ----------
+        count : int
+            Number of strings
+        length : int
+            Maximum length of a string, lengths are uniform from 0 to length
+        prefix_sharing : float
+            Fraction of each string taken from a small pool of shared prefixes,
+            from 0.0 (independent strings) to 1.0 (strings only differ at the end)
+        alphabet : list[str]
+            The input symbols, defaults to 0 and 1
+
+        Returns
+        -------
+        list[str]
+            The input strings
+        """
+
+        if alphabet is None:
+            alphabet = ["0", "1"]
+        pool = [''.join(self.rng.choices(alphabet, k=length)) for _ in range(16)]
+        inputs = list()
+        for _ in range(count):
+            size = self.rng.randint(0, length)
+            shared = int(size * prefix_sharing)
+            inputs.append(self.rng.choice(pool)[:shared] + ''.join(self.rng.choices(alphabet, k=size - shared)))
+        return inputs
+
+
+class Benchmark:
+    """
+    A class that times each stage of the program on generated DFAs and inputs
+
+    Attributes
+    ----------
+    file_parser : FileParser
+        The file parser being measured
+    string_checker : StringChecker
+        The string checker being measured
+    repeat : int
+        Number of timed loops per stage, the median time is kept
+    min_seconds : float
+        Shortest time of a loop, short stages are run several times per loop
+
+    Methods
+    -------
+    run_case(name, dfa_content, inputs)
+        Times every stage for one DFA and input list
+    run_suite(quick, seed, names)
+        Times every stage over the standard set of cases
+    compare(report, baseline, tolerance, memory_tolerance)
+        Finds stages that are slower than the baseline
+    rerun_slower(report, baseline, tolerance, retries)
+        Runs the cases that look slower than the baseline again
+    """
+
+    def __init__(self, repeat: int = 5, min_seconds: float = 0.05) -> None:
+        """
+        Parameters
+        ----------
+        repeat : int
+            Number of timed loops per stage, the median time is kept
+        min_seconds : float
+            Shortest time of a loop, short stages are run several times per loop
+        """
+
+        self.file_parser = FileParser()
+        self.string_checker = StringChecker()
+        self.repeat = repeat
+        self.min_seconds = min_seconds
+
+    def measure(self, function) -> tuple[float, int]:
+        """Times a function and measures its peak memory
+
+        Like timeit.Timer.autorange(), the number of calls per loop is doubled
+        until a loop takes at least self.min_seconds, so a stage of a few
+        microseconds is not lost in timer noise. Loops are timed in CPU time,
+        so time spent waiting for other processes is not counted, and the time
+        is the median time per call over self.repeat loops, which one slow
+        loop does not move. The peak memory comes from one more run under
+        tracemalloc.
+
+        Parameters
+        ----------
+        function : Callable[[], object]
+            The function to measure
+
+        Returns
+        -------
+        tuple[float, int]
+            Seconds taken and peak bytes allocated
+        """
+
+        timer = timeit.Timer(function, timer=time.process_time)
+        number = 1
+        while timer.timeit(number) < self.min_seconds:
+            number *= 2
+        seconds = statistics.median(timer.timeit(number) / number for _ in range(self.repeat))
+
+        tracemalloc.start()
+        try:
+            function()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return seconds, peak
+
+    def run_case(self, name: str, dfa_content: str, inputs: list[str]) -> dict:
+        """Times every stage for one DFA and input list
+
+        Parameters
+        ----------
+        name : str
+            Name of the case in the report
+        dfa_content : str
+            Content of the .dfa file
+        inputs : list[str]
+            The input strings
+
+        Returns
+        -------
+        dict
+            The case name, its size, the number of states of the compiled DFA
+            and a record per stage with seconds, strings_per_s, symbols_per_s
+            and peak_bytes. For dfa_parser the strings are .dfa files and the
+            symbols are characters of the file
+        """
+
+        symbols = sum(map(len, inputs))
+        with tempfile.TemporaryDirectory() as directory:
+            dfa_path = os.path.join(directory, "bench.dfa")
+            out_path = os.path.join(directory, "bench.out")
+            with open(dfa_path, 'w') as file:
+                file.write(dfa_content)
+
+            state_machine = self.file_parser.dfa_parser(dfa_path)
+            output_bools = self.string_checker.check_multiple(inputs, state_machine)
+            is_valid = self.string_checker.is_valid
+
+            # (stage, function, strings handled, symbols handled)
+            stages = [
+                ("dfa_parser", lambda: self.file_parser.dfa_parser(dfa_path), 1, len(dfa_content)),
+                ("is_valid", lambda: [is_valid(input, state_machine) for input in inputs], len(inputs), symbols),
+                ("check_multiple", lambda: self.string_checker.check_multiple(inputs, state_machine), len(inputs), symbols),
+                ("save_output", lambda: self.string_checker.save_output(output_bools, out_path), len(inputs), 0),
+            ]
+            records = dict()
+            for stage, function, strings, stage_symbols in stages:
+                seconds, peak = self.measure(function)
+                seconds = max(seconds, 1e-9)
+                records[stage] = {
+                    "seconds": seconds,
+                    "strings_per_s": strings / seconds,
+                    "symbols_per_s": stage_symbols / seconds,
+                    "peak_bytes": peak,
+                }
+        return {"case": name, "strings": len(inputs), "symbols": symbols,
+                "states": state_machine.compile().n_states, "stages": records}
+
+    def run_suite(self, quick: bool = False, seed: int = 0, names: set[str] = None) -> dict:
+        """Times every stage over the standard set of cases
+
+        Parameters
+        ----------
+        quick : bool
+            Use small inputs, e.g. for a fast check while developing
+        seed : int
+            Seed for the generators
+        names : set[str]
+            Names of the cases to run, all of them if None. The other cases
+            are still generated so every case gets the same DFA and inputs
+
+        Returns
+        -------
+        dict
+            The report, with environment details and one record per case
+        """
+
+        dfa_generator = DFAGenerator(seed)
+        corpus_generator = CorpusGenerator(seed)
+        scale = 1 if quick else 10
+        cases = list()
+        for kind in DFAGenerator.KINDS:
+            for n_states in (2, 8, 26):
+                dfa_content = dfa_generator.generate(kind, n_states)
+                for count, length, prefix_sharing in ((2000 * scale, 16, 0.0), (200 * scale, 256, 0.0), (2000 * scale, 64, 0.9)):
+                    inputs = corpus_generator.generate(count, length, prefix_sharing)
+                    name = f"{kind}-{n_states}states-{count}x{length}-share{prefix_sharing}"
+                    if names is None or name in names:
+                        cases.append(self.run_case(name, dfa_content, inputs))
+        return {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "quick": quick,
+            "seed": seed,
+            "cases": cases,
+        }
+
+    def compare(self, report: dict, baseline: dict, tolerance: float, memory_tolerance: float = 0.05) -> list[str]:
+        """Finds stages that are slower than the baseline
+
+        Parameters
+        ----------
+        report : dict
+            The current report from run_suite()
+        baseline : dict
+            A stored report from run_suite()
+        tolerance : float
+            Allowed slowdown, e.g. 0.2 allows 20% lower throughput
+        memory_tolerance : float
+            Allowed growth of the peak memory, e.g. 0.05 allows 5% more
+
+        Returns
+        -------
+        list[str]
+            A message for each regressed stage, empty if there are none
+        """
+
+        previous = {case["case"]: case for case in baseline.get("cases", [])}
+        regressions = list()
+        for case in report["cases"]:
+            if case["case"] not in previous:
+                continue
+            for stage, record in case["stages"].items():
+                old = previous[case["case"]]["stages"].get(stage)
+                if old is None:
+                    continue
+                if record["strings_per_s"] < old["strings_per_s"] * (1 - tolerance):
+                    regressions.append(f"{case['case']} {stage}: {record['strings_per_s']:,.0f} strings/s, "
+                                       f"baseline {old['strings_per_s']:,.0f} strings/s")
+                if record["peak_bytes"] > old["peak_bytes"] * (1 + memory_tolerance):
+                    regressions.append(f"{case['case']} {stage}: {record['peak_bytes']:,} peak bytes, "
+                                       f"baseline {old['peak_bytes']:,} peak bytes")
+        return regressions
+
+    def rerun_slower(self, report: dict, baseline: dict, tolerance: float, retries: int = 3) -> None:
+        """Runs the cases that look slower than the baseline again
+
+        On a busy machine the timings of a stage can drift by more than the
+        tolerance from one run to the next. Each case that compare() finds
+        slower is run again, up to retries times, and each stage keeps its
+        fastest run, so a stage is only reported if it is slower every time.
+
+        Parameters
+        ----------
+        report : dict
+            The current report from run_suite(), updated in place
+        baseline : dict
+            A stored report from run_suite()
+        tolerance : float
+            Allowed slowdown, as for compare()
+        retries : int
+            Largest number of times a case is run again
+        """
+
+        for _ in range(retries):
+            # only the timings drift, so peak memory is left out here
+            slower = {case["case"] for case in report["cases"]
+                      if self.compare({"cases": [case]}, baseline, tolerance, float("inf"))}
+            if not slower:
+                return
+            rerun = {case["case"]: case for case in self.run_suite(report["quick"], report["seed"], slower)["cases"]}
+            for case in report["cases"]:
+                for stage, record in rerun.get(case["case"], {"stages": {}})["stages"].items():
+                    if record["strings_per_s"] > case["stages"][stage]["strings_per_s"]:
+                        case["stages"][stage] = record
+
+
+def main(argv: list[str] = None) -> int:
+    """Runs the benchmark suite
+
+    Parameters
+    ----------
+    argv : list[str]
+        Command line arguments, defaults to sys.argv[1:]
+
+    Returns
+    -------
+    int
+        Exit status, 1 if a stage regressed beyond the tolerance
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmarks the DFA program.")
+    parser.add_argument("--quick", action="store_true", help="use small inputs")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the generated DFAs and inputs")
+    parser.add_argument("--repeat", type=int, default=5, help="timed loops per stage, the median is kept")
+    parser.add_argument("--min-seconds", type=float, default=0.05,
+                        help="shortest time of a timed loop, short stages are run several times per loop")
+    parser.add_argument("--output", help="write the JSON report to this file instead of standard output")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown against the baseline, default 0.25")
+    parser.add_argument("--memory-tolerance", type=float, default=0.05,
+                        help="allowed peak memory growth against the baseline, default 0.05")
+    parser.add_argument("--retries", type=int, default=3,
+                        help="times a case that is slower than the baseline is run again, default 3")
+    parser.add_argument("--save-baseline", help="also write the report to this file as the new baseline")
+    args = parser.parse_args(argv)
+
+    benchmark = Benchmark(args.repeat, args.min_seconds)
+    report = benchmark.run_suite(args.quick, args.seed)
+    regressions = list()
+    if args.baseline:
+        with open(args.baseline, 'r') as file:
+            baseline = json.load(file)
+        benchmark.rerun_slower(report, baseline, args.tolerance, args.retries)
+        regressions = benchmark.compare(report, baseline, args.tolerance, args.memory_tolerance)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(text + '\n')
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as file:
+            file.write(text + '\n')
+
+    for message in regressions:
+        print(f"regression: {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,231 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Client for the DFA program running with --serve.    #
+#   Only needs the standard library, so checking a      #
+#   batch does not pay for loading the DFA program.     #
+#########################################################
+
+import json
+import socket
+from collections.abc import Iterable, Iterator
+
+DEFAULT_ADDRESS = "pe01.sock" if hasattr(socket, "AF_UNIX") else "127.0.0.1:8765"
+
+class DFAClient:
+    """
+    A class that checks strings with a running DFAServer
+
+    Attributes
+    ----------
+    address : str
+        The Unix socket path, or HOST:PORT, the server listens on
+    socket : socket.socket
+        The connection to the server
+    file : io.BufferedReader
+        Buffered reader of the answers from the server
+
+    Methods
+    -------
+    request(request, payload)
+        Sends a request and reads its answer
+    load(name, path, content)
+        Loads a DFA into the server
+    unload(name)
+        Removes a DFA from the server
+    list_dfas()
+        Lists the DFAs loaded in the server
+    check(dfa, inputs)
+        Checks a list of strings
+    check_iter(dfa, inputs, batch_size)
+        Checks strings in batches, giving each result as its batch is answered
+    close()
+        Closes the connection
+    """
+
+    def __init__(self, address: str = DEFAULT_ADDRESS, timeout: float = None) -> None:
+        """
+        Parameters
+        ----------
+        address : str
+            The Unix socket path, or HOST:PORT, the server listens on
+        timeout : float
+            Seconds to wait for the server, None to wait forever
+        """
+
+        self.address = address
+        host, _, port = address.rpartition(':')
+        if port.isdigit() and (host or address.startswith(':')):
+            self.socket = socket.create_connection((host or "127.0.0.1", int(port)), timeout)
+            # requests are small, send them at once instead of waiting to fill a packet
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.settimeout(timeout)
+            self.socket.connect(address)
+        self.file = self.socket.makefile('rb')
+
+    def __enter__(self) -> "DFAClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def request(self, request: dict, payload: bytes = b"") -> dict:
+        """Sends a request and reads its answer
+
+        Parameters
+        ----------
+        request : dict
+            The request, see DFAServer for the operations
+        payload : bytes
+            Data sent after the request, e.g. the strings of a check
+
+        Raises
+        ------
+        Exception
+            If the server answers with an error or closes the connection
+
+        Returns
+        -------
+        dict
+            The answer from the server
+        """
+
+        self.socket.sendall(json.dumps(request).encode() + b"\n" + payload)
+        line = self.file.readline()
+        if not line:
+            raise Exception(f"Error! The server at {self.address} closed the connection.")
+        response = json.loads(line)
+        if not response["ok"]:
+            raise Exception(response["error"])
+        return response
+
+    def load(self, name: str, path: str = None, content: str = None) -> str:
+        """Loads a DFA into the server
+
+        Parameters
+        ----------
+        name : str
+            Name to register the DFA under
+        path : str
+            A file path to the .dfa file, read by the server
+        content : str
+            The content of a .dfa file, used instead of path
+
+        Raises
+        ------
+        Exception
+            If the DFA is invalid or cannot be read
+
+        Returns
+        -------
+        str
+            The hash of the DFA, which can be used instead of its name
+        """
+
+        request = {"op": "load", "name": name}
+        if content is not None:
+            request["content"] = content
+        else:
+            request["path"] = path
+        return self.request(request)["hash"]
+
+    def unload(self, name: str) -> None:
+        """Removes a DFA from the server
+
+        Parameters
+        ----------
+        name : str
+            Name of the DFA
+
+        Raises
+        ------
+        Exception
+            If no DFA is loaded under the name
+        """
+
+        self.request({"op": "unload", "name": name})
+
+    def list_dfas(self) -> list[dict]:
+        """Lists the DFAs loaded in the server
+
+        Returns
+        -------
+        list[dict]
+            The name, hash, number of states and alphabet of each DFA
+        """
+
+        return self.request({"op": "list"})["dfas"]
+
+    def check(self, dfa: str, inputs: list[str]) -> list[bool]:
+        """Checks a list of strings
+
+        Parameters
+        ----------
+        dfa : str
+            Name or hash of a loaded DFA
+        inputs : list[str]
+            Input strings, without line breaks
+
+        Raises
+        ------
+        Exception
+            If the DFA is not loaded or a string has a line break
+
+        Returns
+        -------
+        list[bool]
+            True for VALID and False for INVALID, one per string
+        """
+
+        payload = ''.join([input + '\n' for input in inputs]).encode()
+        if payload.count(b'\n') != len(inputs):
+            raise Exception("Error! Input strings cannot contain line breaks.")
+        response = self.request({"op": "check", "dfa": dfa, "count": len(inputs), "size": len(payload)}, payload)
+        results = self.file.read(response["count"])
+        if len(results) != response["count"]:
+            raise Exception(f"Error! The server at {self.address} closed the connection.")
+        return list(map(bool, results))
+
+    def check_iter(self, dfa: str, inputs: Iterable[str], batch_size: int = 1 << 16) -> Iterator[bool]:
+        """Checks strings in batches, giving each result as its batch is answered
+
+        Parameters
+        ----------
+        dfa : str
+            Name or hash of a loaded DFA
+        inputs : Iterable[str]
+            Input strings, without line breaks, e.g. read from a large file
+        batch_size : int
+            Number of strings sent in one request
+
+        Raises
+        ------
+        Exception
+            If the DFA is not loaded or a string has a line break
+
+        Yields
+        ------
+        bool
+            True for VALID and False for INVALID, one per string
+        """
+
+        batch = list()
+        for input in inputs:
+            batch.append(input)
+            if len(batch) == batch_size:
+                yield from self.check(dfa, batch)
+                batch = list()
+        if batch:
+            yield from self.check(dfa, batch)
+
+    def close(self) -> None:
+        """Closes the connection
+        """
+
+        self.file.close()
+        self.socket.close()
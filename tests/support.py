@@ -0,0 +1,117 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Helpers shared by the tests: the original program's #
+#   parser and checking rules, and random DFAs and      #
+#   inputs.                                             #
+#########################################################
+
+import random
+
+from Galang_Masayon_Poledo_PE01 import StateMachine
+
+DFA_TEXT = "0,1\n-,A,A,B\n+,B,A,B\n"
+# the same states with the final state moved, so it accepts other strings
+OTHER_DFA_TEXT = "0,1\n-+,A,A,B\n,B,A,B\n"
+
+
+def reference_dfa_parser(content: list[str], file_name: str) -> tuple:
+    """Parses the lines of a .dfa file the way the original program did
+
+    Returns
+    -------
+    tuple
+        (alphabet, states, f_states, transition) of the DFA
+    """
+
+    content = [line.split(',') for line in content]
+    alphabet = content.pop(0)
+    if (len(alphabet) != 2 or alphabet[0] == alphabet[1]):
+        raise Exception(f"({file_name}) Invalid DFA! DFA must have 2 unique input symbols.")
+    for char in alphabet:
+        if (len(char) != 1):
+            raise Exception(f"({file_name}) Invalid DFA! ({char}) is not a valid input symbol.")
+
+    states = list()
+    f_states = list()
+    transition = list(list())
+    start_state_found = False
+    current_line = 1
+    for line in content:
+        current_line += 1
+        if len(line) < 2:
+            raise Exception(f"({file_name}) Invalid DFA! Invalid state in line {current_line}.")
+        if line[0] == '-' or line[0] == '-+' or line[0] == '+-':
+            if start_state_found:
+                raise Exception(f"({file_name}) Invalid DFA! Duplicate start state in line {current_line}.")
+            start_state_found = True
+            states.insert(0, line[1])
+            transition.insert(0, line[2:4])
+            if line[0] == '-+' or line[0] == '+-':
+                f_states.append(line[1])
+        else:
+            if line[0] == '+':
+                f_states.append(line[1])
+            elif line[0] != '':
+                raise Exception(f"({file_name}) Invalid DFA! Invalid state type symbol ({line[0]}) in line {current_line}.")
+            states.append(line[1])
+            transition.append(line[2:4])
+        if len(line[1]) != 1 or not line[1].isupper():
+            raise Exception(f"({file_name}) Invalid DFA! Invalid state ({line[1]}) found in line {current_line}. Not a capital letter.")
+        if len(line) != 4:
+            raise Exception(f"({file_name}) Invalid DFA! Invalid number of state transitions in line {current_line}.")
+    for line in transition:
+        for state in line:
+            if not state in states:
+                raise Exception(f"({file_name}) Invalid DFA! Invalid state ({state}) in transitions for state {states[transition.index(line)]}.")
+    if not start_state_found:
+        raise Exception(f"({file_name}) Invalid DFA! No start state found.")
+    return alphabet, states, f_states, transition
+
+
+def reference_is_valid(input: str, state_machine: StateMachine) -> bool:
+    """Checks a string the way the original program did, walking the state names"""
+
+    curr = state_machine.get_start_state()
+    for char in input:
+        if char not in state_machine.alphabet or curr not in state_machine.states:
+            return False
+        curr = state_machine.transition[state_machine.states.index(curr)][state_machine.alphabet.index(char)]
+    return curr in state_machine.f_states
+
+
+def random_state_machine(rng: random.Random, dangling: bool = False) -> StateMachine:
+    """Makes a random 2 symbol DFA, with dangling=True some transitions go to a state that does not exist"""
+
+    states = [chr(ord('A') + i) for i in range(rng.randint(1, 8))]
+    pool = states + (['Z'] if dangling else [])
+    f_states = [state for state in pool if rng.random() < 0.4]
+    transition = [[rng.choice(pool) for _ in range(2)] for _ in states]
+    return StateMachine(rng.sample(['a', 'b', '0', '1'], 2), states, f_states, transition)
+
+
+def random_inputs(rng: random.Random, state_machine: StateMachine, count: int = 100) -> list[str]:
+    """Makes random strings over the alphabet, a few with a letter outside it"""
+
+    chars = state_machine.alphabet + ['c']
+    return [''.join(rng.choice(chars) if rng.random() > 0.03 else 'c' for _ in range(rng.randint(0, 12)))
+            for _ in range(count)]
+
+
+def reference_cases(seed: int, count: int = 100):
+    """Gives random DFAs, some with transitions to missing states, with inputs and their expected results
+
+    Yields
+    ------
+    tuple[StateMachine, list[str], list[bool]]
+        The DFA, the input strings and the original program's result for each
+    """
+
+    rng = random.Random(seed)
+    for _ in range(count):
+        state_machine = random_state_machine(rng, dangling=rng.random() < 0.3)
+        inputs = random_inputs(rng, state_machine)
+        yield state_machine, inputs, [reference_is_valid(input, state_machine) for input in inputs]
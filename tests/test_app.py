@@ -0,0 +1,76 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests the background checking of the window without #
+#   a display.                                          #
+#########################################################
+
+import os
+import queue
+import tempfile
+import threading
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import App, FileParser, StringChecker
+from support import DFA_TEXT
+
+
+def headless_app() -> App:
+    """Makes an App with only what process_worker() uses, without opening a window"""
+
+    app = App.__new__(App)
+    app.string_checker = StringChecker()
+    app.instrumentation = None
+    app.results = queue.Queue()
+    app.cancel_event = threading.Event()
+    return app
+
+
+def drain(app: App) -> tuple[bytes, tuple]:
+    """Gets the results sent to the window and the message that ended the run"""
+
+    outputs = b""
+    while True:
+        message = app.results.get_nowait()
+        if message[0] != "output":
+            return outputs, message
+        outputs += message[1]
+
+
+class TestProcessWorker(unittest.TestCase):
+    """Tests App.process_worker()"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.output_name = os.path.join(self.directory.name, "a.out")
+        self.dfa = FileParser().dfa_text_parser(DFA_TEXT, "f.dfa").compile()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_checks_loaded_inputs(self):
+        app = headless_app()
+        inputs = ["1", "0", "01", "", "10"]
+        app.process_worker(inputs, self.output_name, self.dfa)
+        outputs, finished = drain(app)
+        # the output lines up with the strings in the input pane
+        self.assertEqual(list(outputs), [1, 0, 1, 0, 0])
+        self.assertEqual(finished, ("done", self.output_name))
+        with open(self.output_name, 'r') as file:
+            self.assertEqual(file.read(), "VALID\nINVALID\nVALID\nINVALID\nINVALID\n")
+
+    def test_cancel(self):
+        app = headless_app()
+        app.cancel_event.set()
+        app.process_worker(["1"] * 10000, self.output_name, self.dfa)
+        outputs, finished = drain(app)
+        self.assertEqual(finished, ("cancelled", len(outputs)))
+        self.assertLess(len(outputs), 10000)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
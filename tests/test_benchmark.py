@@ -0,0 +1,44 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests the regression gate of the benchmark.         #
+#########################################################
+
+import copy
+import unittest
+
+from Galang_Masayon_Poledo_PE01_Benchmark import Benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    """Tests Benchmark"""
+
+    def test_measure(self):
+        benchmark = Benchmark(repeat=3, min_seconds=0.01)
+        calls = []
+        seconds, peak = benchmark.measure(lambda: calls.append(bytearray(1 << 16)))
+        # a call this short is run many times per timed loop
+        self.assertGreater(len(calls), 100)
+        self.assertLess(seconds, 0.01)
+        self.assertGreaterEqual(peak, 1 << 16)
+
+    def test_compare(self):
+        benchmark = Benchmark(repeat=1, min_seconds=0.001)
+        baseline = {"cases": [benchmark.run_case("small", "0,1\n-,A,A,B\n+,B,A,B\n", ["01", "10"] * 50)]}
+        report = copy.deepcopy(baseline)
+        self.assertEqual(benchmark.compare(report, baseline, 0.2), [])
+
+        record = report["cases"][0]["stages"]["check_multiple"]
+        record["strings_per_s"] *= 0.9
+        self.assertEqual(benchmark.compare(report, baseline, 0.2), [])
+        record["strings_per_s"] *= 0.5
+        record["peak_bytes"] = record["peak_bytes"] * 2 + 1
+        self.assertEqual(len(benchmark.compare(report, baseline, 0.2)), 2)
+        self.assertEqual(len(benchmark.compare(report, baseline, 0.2, memory_tolerance=2)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
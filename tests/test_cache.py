@@ -0,0 +1,71 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests the binary cache of compiled DFAs.            #
+#########################################################
+
+import os
+import random
+import tempfile
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import CompiledDFA, FileParser, StateMachine
+from support import DFA_TEXT, OTHER_DFA_TEXT, random_state_machine
+
+
+class TestCache(unittest.TestCase):
+    """Tests the binary cache of compiled DFAs"""
+
+    def test_round_trip(self):
+        rng = random.Random(8)
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "f.dfac")
+            for _ in range(20):
+                dfa = random_state_machine(rng).compile()
+                dfa.save(filename, b"h" * 32)
+                loaded = CompiledDFA.load(filename, b"h" * 32)
+                self.assertEqual(list(loaded.table), list(dfa.table))
+                self.assertEqual(loaded.state_names, dfa.state_names)
+                self.assertEqual(loaded.state_map, dfa.state_map)
+                self.assertTrue(loaded.equivalent(dfa))
+                # the sink table is read in place from the file instead of being built again
+                for values, expected in zip(loaded._sink_table, dfa.sink_table()):
+                    self.assertIsInstance(values, memoryview)
+                    self.assertEqual(list(values), list(expected))
+                # a cache made from other .dfa content is not used
+                self.assertIsNone(CompiledDFA.load(filename, b"x" * 32))
+
+    def test_stale_and_corrupt_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            src = os.path.join(directory, "f.dfa")
+            with open(src, 'w') as file:
+                file.write(DFA_TEXT)
+            file_parser = FileParser()
+            self.assertTrue(file_parser.compiled_dfa_parser(src).accepts("01"))
+            self.assertTrue(os.path.exists(src + 'c'))
+            self.assertTrue(file_parser.compiled_dfa_parser(src).accepts("01"))
+
+            # a changed .dfa file is parsed again instead of using the cache
+            with open(src, 'w') as file:
+                file.write(OTHER_DFA_TEXT)
+            self.assertFalse(file_parser.compiled_dfa_parser(src).accepts("01"))
+
+            # a damaged cache is rebuilt from the .dfa file
+            with open(src + 'c', 'r+b') as file:
+                file.seek(-1, os.SEEK_END)
+                file.write(b"\xff")
+            self.assertTrue(file_parser.compiled_dfa_parser(src).accepts("10"))
+
+    def test_sink_table_built_on_compile(self):
+        dfa = FileParser().dfa_text_parser(DFA_TEXT, "f.dfa").compile()
+        self.assertIsNotNone(dfa._sink_table)
+        dfa = StateMachine(['0', '1'], ['A', 'B'], ['B'], [['A', 'B'], ['B', 'B']]).compile()
+        # B is an accepting sink
+        self.assertEqual(list(dfa._sink_table[1]), [0, CompiledDFA.ACCEPT_SINK])
+
+
+if __name__ == "__main__":
+    unittest.main()
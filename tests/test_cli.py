@@ -0,0 +1,86 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests the command line in main() without a display. #
+#########################################################
+
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import ResultBits, main
+from support import DFA_TEXT, OTHER_DFA_TEXT
+
+
+class TestCommandLine(unittest.TestCase):
+    """Tests main() without a display"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        for name, text in [("p/x.dfa", DFA_TEXT), ("q/x.dfa", OTHER_DFA_TEXT), ("a.in", "1\n0\n")]:
+            self.write(name, text)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory.name, name)
+
+    def write(self, name: str, text) -> None:
+        os.makedirs(os.path.dirname(self.path(name)), exist_ok=True)
+        with open(self.path(name), 'wb' if isinstance(text, bytes) else 'w') as file:
+            file.write(text)
+
+    def read(self, name: str) -> str:
+        with open(self.path(name), 'r') as file:
+            return file.read()
+
+    def run_main(self, argv: list[str]) -> int:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            return main(argv)
+
+    def test_single_dfa(self):
+        self.assertEqual(self.run_main(["--dfa", self.path("p/x.dfa"), "--in", self.path("a.in")]), 0)
+        self.assertEqual(self.read("a.out"), "VALID\nINVALID\n")
+
+    def test_duplicate_output_names(self):
+        # both DFAs would write a.x.out
+        with self.assertRaises(SystemExit):
+            self.run_main(["--dfa", self.path("p/x.dfa"), self.path("q/x.dfa"), "--in", self.path("a.in")])
+        self.assertFalse(os.path.exists(self.path("a.x.out")))
+        self.assertEqual(self.run_main(["--dfa", self.path("p/x.dfa"), self.path("q/x.dfa"), "--in", self.path("a.in"),
+                                        "--combined"]), 0)
+        self.assertEqual(self.read("a.out"), "VALID,INVALID\nINVALID,VALID\n")
+
+    def test_binary(self):
+        self.assertEqual(self.run_main(["--dfa", self.path("p/x.dfa"), "--in", self.path("a.in"), "--binary"]), 0)
+        self.assertEqual(list(ResultBits.load(self.path("a.out"))), [True, False])
+        with self.assertRaises(SystemExit):
+            self.run_main(["--dfa", self.path("p/x.dfa"), self.path("q/x.dfa"), "--in", self.path("a.in"), "--binary"])
+
+    def test_bad_input_file(self):
+        # a file that is not UTF-8 fails on the text paths, the next input is still checked
+        self.write("bad.in", b"1\n\xff\xfe0\n")
+        self.assertEqual(self.run_main(["--dfa", self.path("p/x.dfa"), self.path("q/x.dfa"),
+                                        "--in", self.path("bad.in"), self.path("a.in"), "--combined"]), 1)
+        self.assertFalse(os.path.exists(self.path("bad.out")))
+        self.assertTrue(os.path.exists(self.path("a.out")))
+
+        # an output from an earlier run is kept when the input cannot be read at all
+        self.write("b.out", "VALID\n")
+        for options in [[], ["--workers", "2"], ["--binary"]]:
+            self.assertEqual(self.run_main(["--dfa", self.path("p/x.dfa"), "--in", self.path("b.in")] + options), 1)
+            self.assertEqual(self.read("b.out"), "VALID\n")
+        self.assertEqual(self.run_main(["--dfa", self.path("p/x.dfa"), self.path("q/x.dfa"), "--in", self.path("b.in"),
+                                        "--combined"]), 1)
+        self.assertEqual(self.read("b.out"), "VALID\n")
+        self.assertEqual([name for name in os.listdir(self.directory.name) if name.endswith(".part")], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests counting and listing the valid strings of a   #
+#   DFA, against brute force over every string.         #
+#########################################################
+
+import itertools
+import random
+import unittest
+from unittest import mock
+
+import Galang_Masayon_Poledo_PE01
+from Galang_Masayon_Poledo_PE01 import FileParser, StateMachine
+from support import random_state_machine, reference_is_valid
+
+
+def all_strings(state_machine: StateMachine, max_length: int) -> list[str]:
+    """Gives every string over the alphabet up to max_length letters in shortlex order"""
+
+    letters = sorted(state_machine.alphabet)
+    return [''.join(string) for length in range(max_length + 1) for string in itertools.product(letters, repeat=length)]
+
+
+def reference_counts(state_machine: StateMachine, length: int) -> list[int]:
+    """Counts the valid strings of each length up to length by carrying the number of strings at each state name"""
+
+    counts = {state_machine.get_start_state(): 1}
+    found = [sum(count for state, count in counts.items() if state in state_machine.f_states)]
+    for _ in range(length):
+        moved = dict()
+        for state, count in counts.items():
+            # a state that is not declared has no moves
+            if state in state_machine.states:
+                for dest in state_machine.transition[state_machine.states.index(state)]:
+                    moved[dest] = moved.get(dest, 0) + count
+        counts = moved
+        found.append(sum(count for state, count in counts.items() if state in state_machine.f_states))
+    return found
+
+
+class TestCount(unittest.TestCase):
+    """Tests CompiledDFA.count_accepted() and CompiledDFA.accepted_strings()"""
+
+    def test_count_accepted(self):
+        rng = random.Random(23)
+        for _ in range(100):
+            state_machine = random_state_machine(rng, dangling=rng.random() < 0.3)
+            valid = [len(string) for string in all_strings(state_machine, 8) if reference_is_valid(string, state_machine)]
+            for length in range(9):
+                self.assertEqual(state_machine.count_accepted(length), valid.count(length))
+                self.assertEqual(state_machine.count_accepted(length, up_to=True),
+                                 sum(1 for found in valid if found <= length))
+        with self.assertRaises(Exception):
+            state_machine.count_accepted(-1)
+
+    def test_count_accepted_matrix(self):
+        # at this length the matrix powers take fewer steps than one step per letter
+        rng = random.Random(24)
+        with mock.patch.object(Galang_Masayon_Poledo_PE01, "_multiply", wraps=Galang_Masayon_Poledo_PE01._multiply) as multiply:
+            for _ in range(30):
+                state_machine = random_state_machine(rng, dangling=rng.random() < 0.3)
+                counts = reference_counts(state_machine, 2000)
+                self.assertEqual(state_machine.compile().count_accepted(2000), counts[-1])
+                self.assertEqual(state_machine.compile().count_accepted(2000, up_to=True), sum(counts))
+            self.assertTrue(multiply.called)
+
+    def test_accepted_strings(self):
+        rng = random.Random(25)
+        for _ in range(100):
+            state_machine = random_state_machine(rng, dangling=rng.random() < 0.3)
+            expected = [string for string in all_strings(state_machine, 7) if reference_is_valid(string, state_machine)]
+            self.assertEqual(list(state_machine.accepted_strings(7)), expected)
+            # the first strings given without a limit are the same
+            found = list(itertools.islice(state_machine.accepted_strings(), len(expected) + 1))
+            self.assertEqual(found[:len(expected)], expected)
+
+    def test_finite_language(self):
+        # strings of 1 to 3 letters, the generator ends by itself
+        state_machine = FileParser().dfa_text_parser("0,1\n-,A,B,B\n+,B,C,C\n+,C,D,D\n+,D,E,E\n,E,E,E\n", "f.dfa")
+        expected = [string for string in all_strings(state_machine, 5) if reference_is_valid(string, state_machine)]
+        self.assertEqual(len(expected), 14)
+        self.assertEqual(list(state_machine.accepted_strings()), expected)
+
+        rng = random.Random(26)
+        for _ in range(200):
+            state_machine = random_state_machine(rng, dangling=True)
+            # with no valid string from length 9 to 16 the language is finite for DFAs of up to 8 states
+            if any(reference_counts(state_machine, 16)[9:]):
+                continue
+            expected = [string for string in all_strings(state_machine, 8) if reference_is_valid(string, state_machine)]
+            self.assertEqual(list(itertools.islice(state_machine.accepted_strings(), len(expected) + 1)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
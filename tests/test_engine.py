@@ -0,0 +1,102 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests for StringChecker and CompiledDFA, comparing  #
+#   every way of checking strings with the original     #
+#   program's rules.                                    #
+#########################################################
+
+import os
+import tempfile
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import FileParser, ResultBits, StringChecker
+from support import reference_cases
+
+
+class TestChecker(unittest.TestCase):
+    """Tests the checking methods against the original checking rules"""
+
+    def test_check_multiple(self):
+        string_checker = StringChecker()
+        for state_machine, inputs, expected in reference_cases(1, 300):
+            self.assertEqual(string_checker.check_multiple(inputs, state_machine), expected)
+            self.assertEqual([string_checker.is_valid(input, state_machine) for input in inputs], expected)
+            self.assertEqual([state_machine.compile().accepts(input) for input in inputs], expected)
+
+    def test_check_multiple_vectorized(self):
+        # without numpy the strings are checked one at a time, with the same results
+        string_checker = StringChecker()
+        for state_machine, inputs, expected in reference_cases(2, 200):
+            self.assertEqual(string_checker.check_multiple_vectorized(inputs, state_machine), expected)
+
+    def test_check_stream(self):
+        file_parser = FileParser()
+        string_checker = StringChecker()
+        with tempfile.TemporaryDirectory() as directory:
+            src = os.path.join(directory, "a.in")
+            out = os.path.join(directory, "a.out")
+            for state_machine, inputs, expected in reference_cases(3, 50):
+                with open(src, 'w') as file:
+                    file.write(''.join(input + '\n' for input in inputs))
+                self.assertEqual(list(file_parser.in_stream(src)), file_parser.in_parser(src))
+                output_bools = string_checker.check_stream(file_parser.in_stream(src), state_machine)
+                # a small buffer so the output is written in several pieces
+                self.assertEqual(string_checker.save_output_stream(output_bools, out, buffer_size=64), len(inputs))
+                with open(out, 'r') as file:
+                    self.assertEqual(file.read(), ''.join("VALID\n" if valid else "INVALID\n" for valid in expected))
+
+    def test_check_multiple_parallel(self):
+        # small chunks and no serial threshold, so the strings really go through the worker processes
+        string_checker = StringChecker()
+        for state_machine, inputs, expected in reference_cases(4, 3):
+            inputs = inputs * 10
+            expected = expected * 10
+            self.assertEqual(string_checker.check_multiple_parallel(inputs, state_machine, workers=2, chunk_size=64,
+                                                                    serial_threshold=0), expected)
+
+    def test_check_multiple_trie(self):
+        string_checker = StringChecker()
+        for state_machine, inputs, expected in reference_cases(6, 200):
+            self.assertEqual(string_checker.check_multiple_trie(inputs, state_machine), expected)
+
+    def test_batch_result_type(self):
+        string_checker = StringChecker()
+        for state_machine, inputs, expected in reference_cases(19, 5):
+            results = [string_checker.check_multiple(inputs, state_machine),
+                       string_checker.check_multiple_vectorized(inputs, state_machine),
+                       string_checker.check_multiple_trie(inputs, state_machine),
+                       string_checker.check_multiple_stride(inputs, state_machine),
+                       string_checker.check_multiple_parallel(inputs, state_machine, workers=2, chunk_size=30,
+                                                              serial_threshold=0)]
+            for result in results:
+                self.assertIsInstance(result, ResultBits)
+                self.assertEqual(result, expected)
+
+    def test_save_output(self):
+        string_checker = StringChecker()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "strings.out")
+            string_checker.save_output([True, False, True], filename)
+            with open(filename, 'r') as file:
+                self.assertEqual(file.read(), "VALID\nINVALID\nVALID\n")
+
+            # packed bits for every length around a byte boundary
+            for length in range(20):
+                output_bools = [bool(i % 3) for i in range(length)]
+                self.assertEqual(string_checker.save_output_bits(output_bools, filename), length)
+                loaded = ResultBits.load(filename)
+                self.assertIsInstance(loaded, ResultBits)
+                self.assertEqual(list(loaded), output_bools)
+
+            with open(filename, 'ab') as file:
+                file.write(b"\0")
+            with self.assertRaises(Exception):
+                ResultBits.load(filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests Instrumentation: stages, hooks, rejection     #
+#   reasons and the JSON report.                        #
+#########################################################
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import FileParser, Instrumentation, main
+from support import DFA_TEXT
+
+# A goes to the final state C on 0 and to the dead state B on 1
+DEAD_DFA_TEXT = "0,1\n-,A,C,B\n,B,B,B\n+,C,C,C\n"
+
+
+def slow_items(count: int, seconds: float):
+    """Yields 0 to count - 1, waiting before each item"""
+
+    for item in range(count):
+        time.sleep(seconds)
+        yield item
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Tests Instrumentation"""
+
+    def test_nested_stages(self):
+        instrumentation = Instrumentation()
+        with instrumentation.stage("outer"):
+            with instrumentation.stage("inner"):
+                time.sleep(0.05)
+        stages = instrumentation.stages
+        self.assertGreaterEqual(stages["inner"]["seconds"], 0.05)
+        # the inner stage is left out of the outer one
+        self.assertLess(stages["outer"]["seconds"], 0.02)
+        self.assertEqual(stages["outer"]["calls"], 1)
+
+    def test_timed(self):
+        instrumentation = Instrumentation()
+        with instrumentation.stage("save_output"):
+            self.assertEqual(list(instrumentation.timed("check", slow_items(3, 0.03))), [0, 1, 2])
+        stages = instrumentation.stages
+        self.assertGreaterEqual(stages["check"]["seconds"], 0.09)
+        self.assertEqual(stages["check"]["calls"], 1)
+        self.assertLess(stages["save_output"]["seconds"], 0.02)
+
+        # an iterator that is closed early is still recorded
+        items = instrumentation.timed("check", slow_items(3, 0))
+        next(items)
+        items.close()
+        self.assertEqual(stages["check"]["calls"], 2)
+
+    def test_hooks(self):
+        instrumentation = Instrumentation()
+        calls = []
+        instrumentation.add_hook(lambda name, record: calls.append((name, record["calls"])))
+        with instrumentation.stage("parse_dfa"):
+            pass
+        for _ in instrumentation.timed("check", range(5)):
+            self.assertEqual(calls, [("parse_dfa", 1)])
+        self.assertEqual(calls, [("parse_dfa", 1), ("check", 1)])
+
+    def test_rejections(self):
+        instrumentation = Instrumentation()
+        dfa = FileParser().dfa_text_parser(DEAD_DFA_TEXT, "f.dfa").compile()
+        inputs = ["0", "01", "", "1", "10", "12", "2", "02"]
+        self.assertEqual([instrumentation.check(dfa, input) for input in inputs],
+                         [True, True, False, False, False, False, False, False])
+        self.assertEqual(instrumentation.strings, len(inputs))
+        self.assertEqual(instrumentation.symbols, sum(map(len, inputs)))
+        self.assertEqual(instrumentation.accepted, 2)
+        # a letter outside the alphabet counts even after the string can no longer be valid
+        self.assertEqual(instrumentation.rejections, {"invalid_symbol": 3, "non_final": 3})
+        self.assertEqual(instrumentation.state_visits["A"], len(inputs))
+
+    def test_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ("f.dfa", "a.in", "report.json")]
+            for path, text in zip(paths, [DFA_TEXT, "1\n0\n2\n"]):
+                with open(path, 'w') as file:
+                    file.write(text)
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main(["--dfa", paths[0], "--in", paths[1], "--report", paths[2]]), 0)
+            with open(paths[2], 'r') as file:
+                report = json.load(file)
+        # checking and reading run while the output is written, but are recorded as their own stages
+        for stage in ("parse_dfa", "parse_input", "check", "save_output"):
+            self.assertEqual(report["stages"][stage]["calls"], 1)
+        self.assertEqual(report["strings"], 3)
+        self.assertEqual(report["accepted"], 1)
+        self.assertEqual(report["rejections"], {"invalid_symbol": 1, "non_final": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests checking very long strings in chunks, against #
+#   the original checking rules.                        #
+#########################################################
+
+import random
+import unittest
+from unittest import mock
+
+from Galang_Masayon_Poledo_PE01 import StringChecker
+from support import random_state_machine, reference_is_valid
+
+
+def long_cases(seed: int, count: int = 100):
+    """Gives random DFAs with strings of up to 300 letters, a few with a letter outside the alphabet
+
+    Yields
+    ------
+    tuple[StateMachine, list[str]]
+        The DFA and the input strings
+    """
+
+    rng = random.Random(seed)
+    for _ in range(count):
+        state_machine = random_state_machine(rng, dangling=rng.random() < 0.3)
+        inputs = [''.join(rng.choices(state_machine.alphabet, k=rng.randint(0, 300))) for _ in range(20)]
+        for i in range(0, len(inputs), 7):
+            position = rng.randint(0, len(inputs[i]))
+            inputs[i] = inputs[i][:position] + 'c' + inputs[i][position:]
+        yield state_machine, inputs
+
+
+def split(rng: random.Random, input: str) -> list[str]:
+    """Splits a string into random chunks, some of them empty"""
+
+    cuts = sorted(rng.randint(0, len(input)) for _ in range(rng.randint(0, 6)))
+    return [input[start:end] for start, end in zip([0] + cuts, cuts + [len(input)])]
+
+
+class TestLongStrings(unittest.TestCase):
+    """Tests CompiledDFA.chunk_mapping(), CompiledDFA.accepts_mappings() and StringChecker.check_long()"""
+
+    def test_chunk_mapping(self):
+        rng = random.Random(21)
+        for state_machine, inputs in long_cases(21, 50):
+            dfa = state_machine.compile()
+            table, codes = dfa.sink_table()
+            for input in inputs:
+                chunk = input[:rng.randint(0, len(input))]
+                mapping = dfa.chunk_mapping(chunk)
+                if 'c' in chunk:
+                    self.assertIsNone(mapping)
+                    continue
+                # every state walked through the chunk one letter at a time
+                expected = list()
+                for state in codes:
+                    for char in chunk:
+                        if state < 0:
+                            break
+                        state = table[state * dfa.n_symbols + dfa.symbol_index[char]]
+                    expected.append(state)
+                self.assertEqual(mapping, expected)
+
+    def test_accepts_mappings(self):
+        rng = random.Random(22)
+        for state_machine, inputs in long_cases(22):
+            dfa = state_machine.compile()
+            for input in inputs:
+                mappings = map(dfa.chunk_mapping, split(rng, input))
+                self.assertEqual(dfa.accepts_mappings(mappings), reference_is_valid(input, state_machine), input)
+
+    def test_check_long(self):
+        string_checker = StringChecker()
+        for state_machine, inputs in long_cases(23, 3):
+            expected = [reference_is_valid(input, state_machine) for input in inputs]
+            self.assertEqual(list(string_checker.check_long(inputs, state_machine, workers=2, chunk_size=40)), expected)
+
+            # with more states than max_states every string is checked in this process
+            with mock.patch("concurrent.futures.ProcessPoolExecutor", side_effect=AssertionError):
+                self.assertEqual(list(string_checker.check_long(inputs, state_machine, workers=2, chunk_size=40,
+                                                                max_states=0)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests for FileParser, comparing the classic .dfa    #
+#   parser with the original program's parser.          #
+#########################################################
+
+import random
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import FileParser, StringChecker
+from support import reference_dfa_parser
+
+
+class TestParser(unittest.TestCase):
+    """Tests FileParser against the original parser"""
+
+    def test_classic_matches_reference(self):
+        rng = random.Random(14)
+        file_parser = FileParser()
+        for _ in range(2000):
+            lines = [rng.choice(['a,b', 'a,a', 'a', 'ab,c', '0,1', 'a,b,c'])]
+            for _ in range(rng.randint(0, 5)):
+                fields = rng.choice([2, 3, 4, 4, 4, 4, 5])
+                row = [rng.choice(['', '', '-', '+', '-+', 'x'])]
+                row += [rng.choice(['A', 'B', 'C', 'D', 'a', 'AB']) if rng.random() < 0.2 else rng.choice('ABC')
+                        for _ in range(fields - 1)]
+                lines.append(','.join(row))
+            text = '\n'.join(lines)
+            try:
+                expected = reference_dfa_parser(text.splitlines(), "f.dfa")
+            except Exception as e:
+                with self.assertRaises(Exception) as raised:
+                    file_parser.dfa_text_parser(text, "f.dfa")
+                self.assertEqual(str(raised.exception), str(e), text)
+                continue
+            state_machine = file_parser.dfa_text_parser(text, "f.dfa")
+            self.assertEqual((state_machine.alphabet, state_machine.states, state_machine.f_states,
+                              state_machine.transition), expected, text)
+
+    def test_extended(self):
+        text = "%extended\na,b,c\n,q1,q2,q1,q0\n-+,q0,q1,q1,q1\n+,q2,q0,q2,q2\n"
+        state_machine = FileParser().dfa_text_parser(text, "f.dfa")
+        self.assertEqual(state_machine.states, ['q0', 'q1', 'q2'])
+        self.assertEqual(state_machine.f_states, ['q0', 'q2'])
+        self.assertEqual(StringChecker().check_multiple(['', 'a', 'aa', 'ac', 'ab'], state_machine),
+                         [True, False, True, True, False])
+        for bad in ["%extended\na,b\n,q1,q1\n", "%extended\na,b\n-,q1,q1,x\n", "%extended\na,a\n",
+                    "%extended\na,b\n-,q1,q1,q1\n,q1,q1,q1\n"]:
+            with self.assertRaises(Exception):
+                FileParser().dfa_text_parser(bad, "f.dfa")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests finding the longest matches of a DFA in a     #
+#   stream of text, against a brute-force matcher.      #
+#########################################################
+
+import io
+import os
+import random
+import tempfile
+import time
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import FileParser, StateMachine
+from support import random_state_machine, reference_is_valid
+
+# a*b over the letters a and b
+A_STAR_B_TEXT = "a,b\n-,A,A,B\n+,B,C,C\n,C,C,C\n"
+
+
+def reference_scan(text: str, state_machine: StateMachine) -> list[tuple[int, int]]:
+    """Finds the leftmost longest non-empty matches by trying every piece of the text"""
+
+    matches = list()
+    begin = 0
+    while begin < len(text):
+        ends = [end for end in range(begin + 1, len(text) + 1) if reference_is_valid(text[begin:end], state_machine)]
+        if ends:
+            matches.append((begin, ends[-1]))
+            begin = ends[-1]
+        else:
+            begin += 1
+    return matches
+
+
+def split(rng: random.Random, text: str) -> list[str]:
+    """Splits a text into chunks of random sizes, some of them empty"""
+
+    chunks = list()
+    position = 0
+    while position < len(text):
+        size = rng.choice([0, 1, 1, 2, 3, 7, 20])
+        chunks.append(text[position:position + size])
+        position += size
+    return chunks
+
+
+class TestScan(unittest.TestCase):
+    """Tests CompiledDFA.tokenize(), CompiledDFA.scan() and the StateMachine methods that use them"""
+
+    def check(self, state_machine: StateMachine, text: str, chunks) -> None:
+        expected = reference_scan(text, state_machine)
+        tokens = list(state_machine.compile().tokenize(chunks))
+        self.assertEqual(''.join(token for token, matched in tokens), text)
+        self.assertTrue(all(token for token, matched in tokens))
+        position = 0
+        found = list()
+        for token, matched in tokens:
+            if matched:
+                found.append((position, position + len(token)))
+            position += len(token)
+        self.assertEqual(found, expected, text)
+
+    def test_matches_reference(self):
+        rng = random.Random(22)
+        for _ in range(300):
+            state_machine = random_state_machine(rng, dangling=rng.random() < 0.3)
+            chars = state_machine.alphabet * 4 + ['c']
+            text = ''.join(rng.choices(chars, k=rng.randint(0, 40)))
+            self.check(state_machine, text, text)
+            self.check(state_machine, text, split(rng, text))
+            expected = reference_scan(text, state_machine)
+            self.assertEqual(list(state_machine.scan(text)), expected)
+            self.assertEqual(list(state_machine.compile().scan(iter(split(rng, text)))), expected)
+            self.assertEqual(''.join(token for token, matched in state_machine.tokenize(text)), text)
+
+    def test_accepting_sink(self):
+        # once 0 is read every further 0 or 1 still matches, until a letter outside the alphabet
+        state_machine = FileParser().dfa_text_parser("0,1\n-,A,B,A\n+,B,B,B\n", "f.dfa")
+        rng = random.Random(23)
+        for text in ["1110101c01", "0" * 50, "c1c0c", "1" * 30 + "0" + "1" * 30 + "cc0"]:
+            self.check(state_machine, text, text)
+            self.check(state_machine, text, split(rng, text))
+
+    def test_no_final_state(self):
+        state_machine = FileParser().dfa_text_parser("0,1\n-,A,A,A\n", "f.dfa")
+        self.assertEqual(list(state_machine.tokenize(["01", "", "10"])), [("01", False), ("10", False)])
+        self.assertEqual(list(state_machine.scan("0101")), [])
+
+    def test_file(self):
+        state_machine = FileParser().dfa_text_parser(A_STAR_B_TEXT, "f.dfa")
+        rng = random.Random(24)
+        text = ''.join(rng.choice("aaab\n") for _ in range(200000))
+        expected = list(state_machine.scan(split(rng, text[:2000]) + [text[2000:]]))
+        self.assertEqual(list(state_machine.scan(io.StringIO(text))), expected)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "text.txt")
+            with open(path, 'w', newline='') as file:
+                file.write(text)
+            # the file is read in pieces much smaller than the text
+            with open(path, 'r', newline='') as file:
+                self.assertEqual(list(state_machine.scan(file)), expected)
+        self.assertEqual(expected[:20], reference_scan(text[:expected[20][0]], state_machine))
+
+    def test_linear_time(self):
+        # every start in the run of a's fails the same way, the failed pairs stop each try after one letter
+        state_machine = FileParser().dfa_text_parser(A_STAR_B_TEXT, "f.dfa")
+        n = 200000
+        start = time.perf_counter()
+        self.assertEqual(list(state_machine.scan("a" * n)), [])
+        # more failed pairs than the limit, so some are dropped while matching continues
+        self.assertEqual(list(state_machine.scan(["a" * n, "c", "aab", "a" * n, "b"])),
+                         [(n + 1, n + 4), (n + 4, 2 * n + 5)])
+        self.assertEqual(list(state_machine.scan("a" * n + "b")), [(0, n + 1)])
+        self.assertLess(time.perf_counter() - start, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests checking .in files straight from their bytes, #
+#   against reading the lines with in_parser().         #
+#########################################################
+
+import os
+import random
+import tempfile
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import FileParser, StringChecker
+from support import DFA_TEXT, random_state_machine
+
+# every ASCII line break of str.splitlines()
+LINE_BREAKS = ['\n', '\r\n', '\r', '\x0b', '\x0c', '\x1c', '\x1d', '\x1e']
+
+
+def random_file(rng: random.Random, letters: list[str], breaks: list[str]) -> str:
+    """Makes the text of a .in file with random line breaks and maybe no final line break"""
+
+    lines = [''.join(rng.choice(letters) for _ in range(rng.randrange(6))) for _ in range(rng.randrange(12))]
+    text = ''.join(line + rng.choice(breaks) for line in lines)
+    if rng.random() < 0.5:
+        text += ''.join(rng.choice(letters) for _ in range(rng.randrange(1, 6)))
+    return text
+
+
+class TestScanBytes(unittest.TestCase):
+    """Tests CompiledDFA.scan_bytes() and StringChecker.scan_file() against in_parser() and check_multiple()"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.directory.name, "a.in")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def expected(self, text: str, state_machine) -> list[bool]:
+        """Writes the text as UTF-8 and checks the lines read by in_parser()"""
+
+        with open(self.src, 'wb') as file:
+            file.write(text.encode())
+        return list(StringChecker().check_multiple(FileParser().in_parser(self.src), state_machine))
+
+    def test_scan_bytes(self):
+        rng = random.Random(9)
+        string_checker = StringChecker()
+        for _ in range(300):
+            state_machine = random_state_machine(rng, dangling=rng.random() < 0.3)
+            # non-ASCII letters make their lines invalid
+            letters = sorted(state_machine.alphabet) + ['c', '\xe9', '\u20ac']
+            text = random_file(rng, letters, LINE_BREAKS)
+            expected = self.expected(text, state_machine)
+            self.assertEqual(list(state_machine.compile().scan_bytes(text.encode())), expected, repr(text))
+            self.assertEqual(list(string_checker.scan_file(self.src, state_machine)), expected, repr(text))
+
+    def test_line_breaks(self):
+        state_machine = FileParser().dfa_text_parser(DFA_TEXT, "f.dfa")
+        for text, expected in [('', []),
+                               ('1', [True]),
+                               ('1\r\n0\r\n', [True, False]),
+                               ('1\r\r\n0', [True, False, False]),
+                               ('\r\n\r1\n', [False, False, True]),
+                               ('1\x0c0\x1c1', [True, False, True]),
+                               ('1\xe9\n01', [False, True])]:
+            self.assertEqual(self.expected(text, state_machine), expected, repr(text))
+            self.assertEqual(list(state_machine.compile().scan_bytes(text.encode())), expected, repr(text))
+            self.assertEqual(list(StringChecker().scan_file(self.src, state_machine)), expected, repr(text))
+
+    def test_unicode_separators(self):
+        # str.splitlines() also breaks on these, so scan_file() reads the lines as strings instead
+        rng = random.Random(19)
+        string_checker = StringChecker()
+        for _ in range(100):
+            state_machine = random_state_machine(rng)
+            letters = sorted(state_machine.alphabet) + ['c']
+            text = random_file(rng, letters, LINE_BREAKS + ['\x85', '\u2028', '\u2029'])
+            expected = self.expected(text, state_machine)
+            self.assertEqual(list(string_checker.scan_file(self.src, state_machine)), expected, repr(text))
+
+    def test_non_ascii_alphabet(self):
+        # a DFA with a non-ASCII letter has no byte table and is checked through the strings
+        state_machine = FileParser().dfa_text_parser("\xe9,1\n-,A,A,B\n+,B,A,B\n", "f.dfa")
+        text = '\xe91\r\n1\xe9\r1\n\u2028\xe9\xe91'
+        expected = self.expected(text, state_machine)
+        self.assertEqual(expected, [True, False, True, False, True])
+        self.assertEqual(list(StringChecker().scan_file(self.src, state_machine)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests DFARegistry and DFAServer, through DFAClient. #
+#########################################################
+
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import DFARegistry, DFAServer
+from Galang_Masayon_Poledo_PE01_Client import DFAClient
+from support import DFA_TEXT, OTHER_DFA_TEXT
+
+
+class TestRegistry(unittest.TestCase):
+    """Tests DFARegistry"""
+
+    def test_load_get_unload(self):
+        registry = DFARegistry()
+        digest = registry.load("x", DFA_TEXT)
+        self.assertIs(registry.get("x"), registry.get(digest))
+        self.assertTrue(registry.get("x").accepts("1"))
+
+        # a second name for the same content shares the compiled DFA
+        self.assertEqual(registry.load("y", DFA_TEXT), digest)
+        self.assertTrue(registry.unload("x"))
+        self.assertTrue(registry.get("y").accepts("1"))
+        self.assertTrue(registry.unload("y"))
+        self.assertFalse(registry.unload("y"))
+        self.assertEqual(registry.dfas, {})
+        with self.assertRaises(Exception):
+            registry.get("y")
+
+    def test_reload_same_name(self):
+        registry = DFARegistry()
+        digest = registry.load("x", DFA_TEXT)
+        self.assertEqual(registry.load("x", DFA_TEXT), digest)
+        self.assertTrue(registry.get("x").accepts("1"))
+
+        # pointing the name at other content drops the DFA no name uses any more
+        other = registry.load("x", OTHER_DFA_TEXT)
+        self.assertEqual(list(registry.dfas), [other])
+        self.assertFalse(registry.get("x").accepts("1"))
+
+    def test_load_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            src = os.path.join(directory, "f.dfa")
+            with open(src, 'w', newline='') as file:
+                file.write(DFA_TEXT)
+            registry = DFARegistry()
+            self.assertEqual(registry.load_file("f", src), registry.load("g", DFA_TEXT))
+            self.assertEqual([entry["name"] for entry in registry.describe()], ["f", "g"])
+            self.assertEqual(registry.load_file("f", src), registry.load("g", DFA_TEXT))
+            self.assertTrue(registry.get("f").accepts("1"))
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "needs Unix sockets")
+class TestServer(unittest.TestCase):
+    """Tests DFAServer through DFAClient"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.address = os.path.join(self.directory.name, "pe01.sock")
+        self.loop = asyncio.new_event_loop()
+        self.task = self.loop.create_task(DFAServer(self.address).serve())
+        self.thread = threading.Thread(target=self.serve)
+        self.thread.start()
+        for _ in range(100):
+            if os.path.exists(self.address):
+                break
+            time.sleep(0.05)
+
+    def serve(self):
+        try:
+            self.loop.run_until_complete(self.task)
+        except asyncio.CancelledError:
+            pass
+
+    def tearDown(self):
+        self.loop.call_soon_threadsafe(self.task.cancel)
+        self.thread.join()
+        self.loop.close()
+        self.directory.cleanup()
+
+    def test_load_and_check(self):
+        src = os.path.join(self.directory.name, "f.dfa")
+        with open(src, 'w') as file:
+            file.write(DFA_TEXT)
+        with DFAClient(self.address) as client:
+            digest = client.load("f", path=src)
+            # loading again, e.g. after reconnecting, keeps the DFA usable
+            self.assertEqual(client.load("f", path=src), digest)
+            self.assertEqual(client.check("f", ['1', '0', '', '01', '10']), [True, False, False, True, False])
+            with self.assertRaises(Exception):
+                client.check("g", ['1'])
+            self.assertEqual(client.check(digest, ['1']), [True])
+
+    def test_check_without_size(self):
+        # a check without its payload size gets an error and the connection is closed
+        with DFAClient(self.address) as client:
+            client.load("f", content=DFA_TEXT)
+            client.socket.sendall(json.dumps({"op": "check", "dfa": "f", "count": 1}).encode() + b"\n1\n")
+            self.assertFalse(json.loads(client.file.readline())["ok"])
+            self.assertEqual(client.file.readline(), b"")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests checking several letters per move with the    #
+#   stride table, against the original checking rules.  #
+#########################################################
+
+import random
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import CompiledDFA, StateMachine, StringChecker
+from support import random_state_machine, reference_cases
+
+
+class TestStride(unittest.TestCase):
+    """Tests CompiledDFA.stride_table() and the checks that use it"""
+
+    def test_verify_stride_table(self):
+        for state_machine, inputs, expected in reference_cases(20, 50):
+            dfa = state_machine.compile()
+            for k in range(1, 6):
+                dfa.verify_stride_table(state_machine, k)
+
+        # a wrong entry is found
+        rows = dfa.stride_table(3)[0]
+        block = next(iter(rows[dfa.start]))
+        rows[dfa.start][block] = dfa.n_states
+        with self.assertRaises(Exception):
+            dfa.verify_stride_table(state_machine, 3)
+
+    def test_accepts_stride(self):
+        for state_machine, inputs, expected in reference_cases(21, 50):
+            dfa = state_machine.compile()
+            for k in range(1, 6):
+                self.assertEqual([dfa.accepts_stride(input, k) for input in inputs], expected)
+            self.assertEqual(StringChecker().check_multiple_stride(inputs, state_machine), expected)
+
+    def test_stride_length(self):
+        dfa = random_state_machine(random.Random(22)).compile()
+        self.assertEqual(dfa.stride_length(0), 1)
+        self.assertEqual(dfa.stride_length(1 << 60), CompiledDFA.STRIDE_MAX)
+        lengths = [dfa.stride_length(1 << bits) for bits in range(8, 40)]
+        self.assertEqual(lengths, sorted(lengths))
+        self.assertEqual(dfa.stride_table()[1], dfa.stride_length())
+
+        # with one letter there is one block of each length, so any stride fits
+        dfa = StateMachine(['a'], ['A'], ['A'], [['A']]).compile()
+        self.assertEqual(dfa.stride_length(0), CompiledDFA.STRIDE_MAX)
+        self.assertTrue(dfa.accepts_stride('a' * 40))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#########################################################
+#               Programming Exercise 01                 #
+#                   Strings and DFA                     #
+#                                                       #
+#               Galang, Masayon, Poledo                 #
+#########################################################
+#   Tests IncrementalChecker keeping a .out file up to  #
+#   date while its files change.                        #
+#########################################################
+
+import os
+import tempfile
+import unittest
+
+from Galang_Masayon_Poledo_PE01 import IncrementalChecker
+from support import DFA_TEXT, OTHER_DFA_TEXT
+
+
+class TestIncrementalChecker(unittest.TestCase):
+    """Tests IncrementalChecker keeping a .out file up to date"""
+
+    def test_poll(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ("a.in", "a.dfa", "a.out")]
+
+            def write(path: str, text: str) -> None:
+                with open(path, 'w') as file:
+                    file.write(text)
+
+            def output() -> list[str]:
+                with open(paths[2], 'r') as file:
+                    return file.read().split()
+
+            write(paths[0], "1\n0\n01\n")
+            write(paths[1], DFA_TEXT)
+            watcher = IncrementalChecker(*paths)
+            self.assertTrue(watcher.poll())
+            self.assertEqual(output(), ["VALID", "INVALID", "VALID"])
+            self.assertFalse(watcher.poll())
+
+            # only the new line is checked and the lines before it are kept
+            write(paths[0], "1\n0\n01\n110\n")
+            self.assertTrue(watcher.poll())
+            self.assertEqual(watcher.rechecked, 1)
+            self.assertEqual(output(), ["VALID", "INVALID", "VALID", "INVALID"])
+
+            # input edits and a deleted output are handled while the DFA does not load
+            write(paths[1], "0,1\n-,A,A,Q\n")
+            write(paths[0], "0\n1\n")
+            os.remove(paths[2])
+            self.assertTrue(watcher.poll())
+            self.assertIsNotNone(watcher.error)
+            self.assertEqual(output(), ["INVALID", "VALID"])
+
+            write(paths[1], OTHER_DFA_TEXT)
+            self.assertTrue(watcher.poll())
+            self.assertIsNone(watcher.error)
+            self.assertEqual(output(), ["VALID", "INVALID"])
+
+
+if __name__ == "__main__":
+    unittest.main()